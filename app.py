@@ -1,43 +1,175 @@
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, Request, Response, render_template, request, jsonify, session, url_for
+from werkzeug.utils import secure_filename
+import io
 import os
-import base64
-import PyPDF2
-import re
+import asyncio
 import json
-from train import score_answer  # Import function for scoring answers
-from privacy import encode_file, decode_file  # Import for file encoding/decoding
-from transformers import pipeline, logging  # For NLP summarization
+import uuid
+from train import SCORING_MODE, default_scorer, score_answer  # Import function for scoring answers
+from privacy import (  # Encrypted storage
+    DecryptionError, UploadTooLarge, decrypt_to_buffer, iter_base64, iter_decrypt_file, load_key_ring,
+    plaintext_size, read_upload, save_encrypted_stream,
+)
+from pdf_extract import ExtractionTimeout, extract_text  # Pooled PDF text extraction
+from section_segmenter import segment_sections  # One-pass resume section detection
+from session_store import create_session_store  # Per-session interview state
+from model_registry import model_registry  # Lazily loaded NLP models
+from summary_batcher import create_summary_batcher  # Micro-batched summarization
+from summary_pipeline import create_chunked_summarizer, join_sections  # Map-reduce over long resumes
+from resume_cache import PARSED, SUMMARY, create_resume_cache, sha256_text
+from retention import create_retention_manager  # Expiry and purge of session artifacts
+from question_bank import get_question_bank  # Indexed interview questions
+from question_scheduler import QuestionScheduler  # Adaptive question selection
+from work_pools import QueueFull, create_bounded_executor  # Bounded pools for CPU-heavy work
+from jobs import FAILED, FINAL_STATES, SUCCEEDED, create_job_manager  # Background resume processing
+from pii_redactor import default_redactor  # Masks personal data in parsed sections
+from parsed_resume import ParsedResume  # Parsed sections with pre-split entries
+import instrumentation  # Request/stage latency metrics and the optional profiler
+from instrumentation import stage, timed
 import warnings
 
 warnings.filterwarnings("ignore")
 
-# Suppress detailed logs from the Transformers library
-logging.set_verbosity_error()
+class InMemoryUploadRequest(Request):
+    """
+    Request whose uploaded files are buffered in memory.
+
+    Werkzeug spools uploads over 500 KB to a temporary file before the view
+    runs, which would put the plaintext resume on disk. The buffer is bounded
+    by MAX_CONTENT_LENGTH, since larger requests are refused while parsing.
+    """
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return io.BytesIO()
+
 
 app = Flask(__name__)
+app.request_class = InMemoryUploadRequest
 app.secret_key = "your_secret_key"  # Required for session handling
 
+# Request latency histograms, /metrics and the opt-in sampling profiler; attached
+# first so requests rejected by later hooks are measured too
+instrumentation.init_app(app)
+
+# "encrypted" (default) stores uploads encrypted under UPLOAD_FOLDER; "memory" parses them
+# from an in-memory buffer and keeps only the masked sections derived from them
+RESUME_STORAGE = os.environ.get("RESUME_STORAGE", "encrypted").lower()
+if RESUME_STORAGE not in ("encrypted", "memory"):
+    print(f"Unknown RESUME_STORAGE '{RESUME_STORAGE}', storing uploads encrypted.")
+    RESUME_STORAGE = "encrypted"
+
 # Define and create the uploads folder
 UPLOAD_FOLDER = os.path.join(os.getcwd(), "uploads")
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+if RESUME_STORAGE == "encrypted":
+    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+
+# Uploads larger than this are rejected; Flask refuses oversized requests from
+# their Content-Length before reading the body
+MAX_UPLOAD_BYTES = int(os.environ.get("MAX_UPLOAD_BYTES", 10 * 1024 * 1024))
+app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_BYTES
+
+# Uploaded resumes are stored encrypted; see privacy.load_key_ring for key configuration
+key_ring = load_key_ring()
+ENCRYPTION_CIPHER = os.environ.get("ENCRYPTION_CIPHER", "aes-256-gcm")
+
+# Parsed sections and summaries are cached by content hash across sessions
+resume_cache = create_resume_cache()
+
+# Uploads and cache entries are indexed per session and purged once they expire
+if RESUME_STORAGE == "memory":
+    retention = create_retention_manager(resume_cache, persist_index=False)
+else:
+    # Files under older keys move to the current one; an ephemeral key cannot read other workers' files
+    retention = create_retention_manager(
+        resume_cache, UPLOAD_FOLDER,
+        key_ring=key_ring if os.environ.get("ENCRYPTION_KEYS") else None, cipher=ENCRYPTION_CIPHER,
+    )
+
+# Interview state is kept per session so concurrent candidates never share it
+session_store = create_session_store()
+
+
+def get_session_id():
+    """Return the id of the current session, assigning one if needed."""
+    session_id = session.get("sid")
+    if session_id is None:
+        session_id = uuid.uuid4().hex
+        session["sid"] = session_id
+    return session_id
+
+
+def load_state():
+    """Load the interview state of the current session."""
+    return session_store.load(get_session_id())
+
+
+def save_state(state):
+    """Persist the interview state of the current session."""
+    session_store.set(get_session_id(), state)
+
+
+def new_upload_path(session_id):
+    """
+    Server-chosen path for a session's encrypted upload.
+
+    Each session stores its uploads in its own directory under a random name, so
+    the filename a client sends never decides where, or whose, a file is.
+    """
+    directory = os.path.join(UPLOAD_FOLDER, secure_filename(session_id))
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"{uuid.uuid4().hex}.enc")
+
+
+def update_session(session_id, **fields):
+    """
+    Set fields of a session's stored state, re-reading it just before the write.
+
+    Background jobs use this instead of holding a state across slow steps, so
+    they never overwrite updates made by requests meanwhile.
+
+    Returns:
+        bool: False, with nothing written, if the session has quit or expired.
+    """
+    state = session_store.get(session_id)
+    if state is None:
+        return False
+    state.update(fields)
+    session_store.set(session_id, state)
+    return True
+
 
-# Global variables to manage interview state
-questions = []
-current_question_index = 0
-parsed_data = {}
-total_score = 0
-total_questions = 0
+def remember_cache_key(session_id, namespace, key):
+    """Record a cache entry used by a session so it expires with it and /quit can delete it."""
+    retention.track_cache(session_id, namespace, key)
+
+
+@app.before_request
+def start_retention():
+    """Start the background purger in this worker; a no-op once it runs."""
+    retention.start()
 
 
 # Middleware to check GDPR consent before processing requests
 @app.before_request
 def check_gdpr_consent():
     """Ensure GDPR consent before accessing most endpoints."""
-    if request.endpoint not in ["index", "privacy_policy", "accept_gdpr", "static"]:
+    if request.endpoint not in ["index", "privacy_policy", "accept_gdpr", "readiness", "prometheus_metrics", "static"]:
         if not session.get("gdpr_accepted"):
             return jsonify({"error": "GDPR consent is required to use this application."}), 403
 
 
+@app.errorhandler(413)
+def upload_too_large(error):
+    """Report oversized uploads as JSON."""
+    return jsonify({"message": f"File exceeds the {MAX_UPLOAD_BYTES} byte upload limit."}), 413
+
+
+@app.errorhandler(QueueFull)
+def work_queue_full(error):
+    """Ask clients to back off when a work pool is saturated."""
+    return jsonify({"error": str(error)}), 429, {"Retry-After": "1"}
+
+
 @app.route("/accept_gdpr", methods=["POST"])
 def accept_gdpr():
     """Handle GDPR acceptance."""
@@ -57,122 +189,341 @@ def index():
     return render_template("index.html")
 
 
-# Load predefined questions from a JSON file
-def load_questions():
-    """Load questions from the JSON file."""
-    try:
-        with open("questions.json", "r") as file:
-            return json.load(file)
-    except FileNotFoundError:
-        print("Error: 'questions.json' not found.")
-        return {}
+# Questions from questions.json and data.json, indexed by skill and alias and
+# reloaded when the files change
+question_bank = get_question_bank()
 
+# Tokenize every expected answer once (and again after a reload) so scoring only
+# processes the user's answer
+question_bank.add_reload_hook(lambda bank: default_scorer.precompute(bank.expected_answers()))
 
-question_bank = load_questions()
+# Chooses interview questions from plans precomputed on every bank (re)load
+question_scheduler = QuestionScheduler(question_bank)
 
-# Initialize the NLP summarizer
-try:
-    summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
-except Exception as e:
-    print(f"Error initializing summarizer: {e}")
-    summarizer = None
+# Semantic scoring embeds every expected answer; build or load the index now (in
+# the master with --preload) instead of on the first /submit_answer
+if SCORING_MODE == "semantic":
+    from semantic_scoring import get_semantic_index
+    try:
+        get_semantic_index()
+    except Exception as e:
+        print(f"Error building the semantic scoring index: {e}")
+
+# The summarizer loads on first use; set PRELOAD_MODELS=1 (e.g. with gunicorn --preload)
+# to load it once in the master process so forked workers share its memory
+if os.environ.get("PRELOAD_MODELS") == "1":
+    model_registry.preload()
+
+# Concurrent /get_summary calls are grouped into padded batches by a background worker
+summary_batcher = create_summary_batcher(model_registry)
+# Resumes longer than the model's input window are summarized per section, then reduced
+chunked_summarizer = create_chunked_summarizer(summary_batcher, resume_cache, model_registry)
+
+# CPU-heavy request work runs on bounded pools so async views only await it; when a
+# pool is full the request gets 429 instead of waiting. PDF extraction itself runs in
+# pdf_extract's process pool.
+parse_pool = create_bounded_executor("parse", workers=4, queue_size=16)
+scoring_pool = create_bounded_executor("scoring", workers=4, queue_size=64)
+
+# Uploaded resumes are processed as background jobs on the parse pool; finished
+# jobs and their results expire after JOB_TTL seconds
+job_manager = create_job_manager(parse_pool)
+# Seconds between keep-alive comments on an idle job event stream
+JOB_EVENTS_KEEPALIVE = 15
+
+# Scrape-time gauges for /metrics
+instrumentation.metrics.gauge(
+    "app_model_memory_bytes", "Parameter and buffer memory of each loaded model.",
+    lambda: {(name, ): size for name, size in model_registry.memory_bytes().items()}, ("model",)
+)
+instrumentation.metrics.gauge(
+    "app_work_pool_in_flight", "Tasks running or waiting in each work pool.",
+    lambda: {(pool.name, ): pool.stats()["in_flight"] for pool in (parse_pool, scoring_pool)}, ("pool",)
+)
+instrumentation.metrics.gauge(
+    "app_summary_queue_pending", "Summaries waiting for the batch worker.",
+    lambda: summary_batcher.stats()["pending"]
+)
+instrumentation.metrics.gauge(
+    "app_retention_tracked_artifacts", "Session artifacts awaiting expiry, by kind.",
+    lambda: {(kind, ): stats["artifacts"] for kind, stats in retention.index.stats().items()}, ("kind",)
+)
+instrumentation.metrics.gauge(
+    "app_retention_reclaimed_bytes", "Bytes of expired or quit session files purged by this worker.",
+    lambda: retention.stats()["purged"]["bytes_reclaimed"]
+)
+instrumentation.metrics.gauge(
+    "app_jobs", "Background jobs kept, by status.",
+    lambda: {(status, ): count for status, count in job_manager.stats().items()}, ("status",)
+)
+
+
+@app.route("/ready", methods=["GET"])
+def readiness():
+    """Report whether the models required to serve requests are available."""
+    ready = model_registry.is_ready()
+    return jsonify({"ready": ready, "models": model_registry.status()}), 200 if ready else 503
+
+
+@app.route("/summary_metrics", methods=["GET"])
+def summary_metrics():
+    """Report batch fill rate and queue latency of the summarization worker, and work pool usage."""
+    pools = {pool.name: pool.stats() for pool in (parse_pool, scoring_pool)}
+    return jsonify({**summary_batcher.stats(), "chunking": chunked_summarizer.stats(), "pools": pools})
 
 
 # Function to parse resume text from a PDF file
-def parse_resume(filepath):
-    """Extract and parse text from the uploaded resume."""
+def parse_resume(source):
+    """Extract and parse text from the uploaded resume, given a file path, its bytes or a binary stream."""
     text = ""
-    if filepath.endswith(".pdf"):
-        with open(filepath, "rb") as pdf_file:
-            reader = PyPDF2.PdfReader(pdf_file)
-            for page in reader.pages:
-                text += page.extract_text()
-
-    # Extract relevant sections from the parsed text
-    parsed_data = {
-        "education": extract_section(text, "Education"),
-        "skills": extract_section(text, "Technical skills"),
-        "projects": extract_section(text, "Projects"),
-        "certificates": extract_section(text, "Certificates and achievements"),
-        "extracurricular": extract_section(text, "Extracurricular Activities"),
-    }
-    return parsed_data
-
-
-# Function to extract specific sections from text
-def extract_section(text, section_name):
-    """Extract a specific section from the text based on the section name."""
-    pattern = rf"{section_name}\n(.*?)(\n\n|\Z)"
-    match = re.search(pattern, text, re.DOTALL)
-    return match.group(1).strip() if match else "Not found"
+    if isinstance(source, bytes) or hasattr(source, "read") or source.endswith(".pdf"):
+        with stage("pdf_extract"):
+            text = extract_text(source)
+
+    # Split the text into every known section in a single pass
+    with stage("section_parse"):
+        sections = segment_sections(text)
+    return ParsedResume.from_sections(sections)
+
+
+def summary_input(parsed_data):
+    """Text summarized for a parsed resume."""
+    return join_sections(parsed_data.sections())
+
+
+def process_resume(report, session_id, source, digest, summarize=False):
+    """
+    Background pipeline for an uploaded resume: parse, mask personal data, store the
+    sections in the session and optionally summarize them.
+
+    Args:
+        report (callable): Publishes (stage, progress) to the job record.
+        session_id (str): Session the resume belongs to.
+        source: Path of the encrypted upload, or the PDF bytes when RESUME_STORAGE is "memory".
+        digest (str): SHA-256 of the plaintext upload.
+        summarize (bool): Also generate the summary.
+
+    Returns:
+        dict: The response body for the upload.
+    """
+    # Identical uploads reuse the sections parsed the first time
+    resume_details = resume_cache.get(PARSED, digest)
+    if resume_details is None:
+        report("parsing", 0.1)
+        if isinstance(source, str):
+            with stage("decrypt"):
+                source = decrypt_to_buffer(source, key_ring)
+        parsed_data = parse_resume(source)
+        del source  # Only the masked sections outlive parsing
+        report("masking", 0.6)
+        with stage("mask"):
+            resume_details = parsed_data.map(default_redactor.mask)
+        if resume_details:
+            # Cached only after masking, since the cache may persist entries to disk
+            resume_cache.set(PARSED, digest, resume_details)
+    if not resume_details:
+        return {"message": "No details found in the resume."}
+
+    report("storing", 0.7)
+    # Store the sections as soon as they are masked; the state is re-read right before
+    # each write so answers or resets made meanwhile are kept
+    if not update_session(session_id, parsed_data=resume_details):
+        retention.drop_untracked_cache(PARSED, [digest])
+        return {"message": "Session ended before the resume was processed."}
+    remember_cache_key(session_id, PARSED, digest)
+    result = {"message": "Resume parsed successfully."}
+
+    full_text = summary_input(resume_details)
+    if summarize and len(full_text.split()) >= 10 and model_registry.get("summarizer") is not None:
+        report("summarizing", 0.8)
+        summary_digest = sha256_text(full_text)
+        summary = resume_cache.get(SUMMARY, summary_digest)
+        chunk_digests = []
+        if summary is None:
+            with stage("summarize"):
+                summary = chunked_summarizer.submit(resume_details.sections(), chunk_digests).result()
+            # The candidate may have quit while the model ran; keep nothing derived for them then
+            if session_store.get(session_id) is None:
+                retention.drop_untracked_cache(SUMMARY, chunk_digests)
+                return {"message": "Session ended before the resume was processed."}
+            resume_cache.set(SUMMARY, summary_digest, summary)
+        for key in [summary_digest, *chunk_digests]:
+            remember_cache_key(session_id, SUMMARY, key)
+        result["summary"] = summary
+    return result
 
 
 @app.route("/upload_resume", methods=["POST"])
-def upload_resume():
-    """Handle resume upload and parse the content."""
-    global parsed_data
+async def upload_resume():
+    """
+    Accept a resume upload and process it in the background.
+
+    Responds 202 with a job id to poll at /jobs/<id>. With ?wait=1 the request
+    waits for the job and returns its result instead. A form field
+    summarize=1 also generates the summary.
+
+    Jobs live in the memory of the worker that accepted the upload, so polling
+    needs sticky sessions or a single worker (or ?wait=1); the parsed sections
+    themselves are written to the session store.
+    """
     file = request.files.get("resume")
     if not file:
         return jsonify({"message": "No file uploaded."}), 400
 
-    file_path = os.path.join(UPLOAD_FOLDER, file.filename)
-    file.save(file_path)
-    encode_file(file_path)  # Encode file for security
-
-    resume_details = parse_resume(file_path)
-    if not resume_details:
-        return jsonify({"message": "No details found in the resume."})
-
-    parsed_data = resume_details  # Store the parsed data globally
-    return jsonify({"message": "Resume parsed successfully."})
+    if not file.filename.lower().endswith(".pdf"):
+        return jsonify({"message": "Only PDF resumes are supported."}), 400
+
+    session_id = get_session_id()
+    if RESUME_STORAGE == "memory":
+        # Parse straight from memory; the upload is dropped once the job has parsed it
+        try:
+            with stage("save"):
+                source, digest = read_upload(file.stream, max_size=MAX_UPLOAD_BYTES)
+        except UploadTooLarge as e:
+            return jsonify({"message": str(e)}), 413
+    else:
+        source = new_upload_path(session_id)
+        try:
+            # Hash and encrypt the in-memory upload chunk by chunk; the plaintext never reaches disk
+            with stage("save"):
+                digest, _ = save_encrypted_stream(
+                    file.stream, source, key_ring, cipher=ENCRYPTION_CIPHER, max_size=MAX_UPLOAD_BYTES
+                )
+        except UploadTooLarge as e:
+            return jsonify({"message": str(e)}), 413
+
+        retention.track_file(session_id, source)
+
+    # Remember the stored file so /resume and /get_encoded_file can stream it back; saving
+    # the state also marks the session live for the job, which writes nothing once it is gone
+    state = session_store.load(session_id)
+    if RESUME_STORAGE == "memory":
+        state["resume"] = None
+    else:
+        # The client's filename is only kept for display, e.g. in Content-Disposition
+        filename = secure_filename(file.filename) or "resume.pdf"
+        state["resume"] = {"path": source, "filename": filename, "digest": digest}
+    session_store.set(session_id, state)
+
+    summarize = request.form.get("summarize", "").lower() in ("1", "true", "yes")
+    job, future = job_manager.submit(session_id, process_resume, session_id, source, digest, summarize)
+    del source
+
+    if request.args.get("wait", "").lower() in ("1", "true", "yes"):
+        try:
+            return jsonify(await asyncio.wrap_future(future))
+        except ExtractionTimeout as e:
+            return jsonify({"message": str(e)}), 422
+    return jsonify({
+        "message": "Resume upload accepted.",
+        "job_id": job.id,
+        "status_url": url_for("job_status", job_id=job.id),
+        "result_url": url_for("job_result", job_id=job.id),
+        "events_url": url_for("job_events", job_id=job.id),
+    }), 202
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def job_status(job_id):
+    """Report the status, stage and progress of one of this session's jobs."""
+    job = job_manager.get(job_id, get_session_id())
+    if job is None:
+        return jsonify({"error": "Job not found or expired."}), 404
+    return jsonify(job.to_dict())
+
+
+@app.route("/jobs/<job_id>/result", methods=["GET"])
+def job_result(job_id):
+    """Return a finished job's result; 202 while it is still running."""
+    job = job_manager.get(job_id, get_session_id())
+    if job is None:
+        return jsonify({"error": "Job not found or expired."}), 404
+    if job.status == FAILED:
+        return jsonify({"message": job.error}), 422
+    if job.status != SUCCEEDED:
+        return jsonify(job.to_dict()), 202
+    return jsonify(job.result)
+
+
+@app.route("/jobs/<job_id>/events", methods=["GET"])
+def job_events(job_id):
+    """Stream a job's status changes as server-sent events until it finishes."""
+    job = job_manager.get(job_id, get_session_id())
+    if job is None:
+        return jsonify({"error": "Job not found or expired."}), 404
+
+    def events():
+        version = -1
+        while True:
+            if job.version > version:
+                version = job.version
+                yield f"event: {job.status}\ndata: {json.dumps(job.to_dict())}\n\n"
+                if job.status in FINAL_STATES:
+                    return
+            elif not job_manager.wait(job, version, timeout=JOB_EVENTS_KEEPALIVE):
+                # Comment line that keeps proxies from closing an idle stream
+                yield ": keep-alive\n\n"
+
+    return Response(events(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
 
 
 @app.route("/start_interview", methods=["POST"])
 def start_interview():
     """Initialize and start the interview process."""
-    global questions, current_question_index, total_questions
-
-    technical_skills = parsed_data.get("skills", "")
+    state = load_state()
+    parsed_data = state["parsed_data"]
+    # Before any upload there is no parsed resume; answer with the original 400, not a 500
+    technical_skills = parsed_data.skill_list if parsed_data is not None else []
     if not technical_skills:
         return jsonify({"message": "No technical skills found in the parsed resume."}), 400
 
-    questions = []
-    for skill in technical_skills.split(", "):
-        if skill.lower() in question_bank:
-            questions.extend(question_bank[skill.lower()])
-        else:
-            questions.append({
-                "question": f"Can you explain your experience with {skill}?",
-                "expected_answer": f"Experience with {skill}"
-            })
-
-    if not questions:
+    # A bounded, skill-balanced interview; further questions are chosen as answers come in
+    schedule = question_scheduler.start(technical_skills)
+    question = question_scheduler.next_question(schedule) if schedule else None
+    if question is None:
         return jsonify({"message": "No questions available for the extracted skills."})
 
-    total_questions = len(questions)
-    current_question_index = 0
+    questions = [question]
+    state["schedule"] = schedule
+    state["questions"] = questions
+    state["total_questions"] = schedule["total"]
+    state["current_question_index"] = 0
+    save_state(state)
     return jsonify({
         "message": "Interview started.",
-        "question": questions[current_question_index]["question"]
+        "question": questions[0]["question"]
     })
 
 
 @app.route("/submit_answer", methods=["POST"])
-def submit_answer():
+async def submit_answer():
     """Handle user's answer submission and provide feedback."""
-    global current_question_index, questions, total_score
-
     user_answer = request.json.get("answer")
     if not user_answer:
         return jsonify({"error": "Please provide an answer!"}), 400
 
+    state = load_state()
+    questions = state["questions"]
+    current_question_index = state["current_question_index"]
     if current_question_index < len(questions):
         question_data = questions[current_question_index]
         expected = question_data["expected_answer"]
-        score = score_answer(expected, user_answer)
-        total_score += score  # Update the total score
+        score = await scoring_pool.run(timed, "score", score_answer, expected, user_answer)
+        state["total_score"] += score  # Update the total score
 
         current_question_index += 1
+        state["current_question_index"] = current_question_index
+        schedule = state.get("schedule")
+        if schedule:
+            # The next question's difficulty follows the running score
+            question_scheduler.record_score(schedule, score)
+            if current_question_index == len(questions):
+                question = question_scheduler.next_question(schedule)
+                if question is not None:
+                    questions.append(question)
+                else:
+                    state["total_questions"] = len(questions)
+        save_state(state)
         next_question = questions[current_question_index]["question"] if current_question_index < len(
             questions) else None
 
@@ -186,21 +537,35 @@ def submit_answer():
 
 
 @app.route("/get_summary", methods=["GET"])
-def get_summary():
+async def get_summary():
     """Generate a summary of the parsed resume data."""
+    parsed_data = load_state()["parsed_data"]
     if not parsed_data:
         return jsonify({"error": "No parsed data available to summarize."}), 404
 
-    full_text = " ".join(parsed_data.values()).strip()
+    full_text = summary_input(parsed_data)
     if not full_text or len(full_text.split()) < 10:
         return jsonify({"error": "Parsed data is too short to generate a summary."}), 400
 
+    digest = sha256_text(full_text)
+    summary = resume_cache.get(SUMMARY, digest)
+    if summary is not None:
+        return jsonify({"summary": summary})
+
+    summarizer = model_registry.get("summarizer")
     if summarizer is None:
         return jsonify({"error": "Summarization model not initialized."}), 500
 
     try:
-        summary = summarizer(full_text, max_length=150, min_length=50, do_sample=False)
-        return jsonify({"summary": summary[0]["summary_text"]})
+        chunk_digests = []
+        with stage("summarize"):
+            summary = await asyncio.wrap_future(chunked_summarizer.submit(parsed_data.sections(), chunk_digests))
+        resume_cache.set(SUMMARY, digest, summary)
+        for key in [digest, *chunk_digests]:
+            remember_cache_key(get_session_id(), SUMMARY, key)
+        return jsonify({"summary": summary})
+    except QueueFull:
+        raise
     except Exception as e:
         return jsonify({"error": f"Failed to generate summary: {str(e)}"}), 500
 
@@ -208,13 +573,15 @@ def get_summary():
 @app.route('/get_score', methods=['GET'])
 def get_score():
     """Provide the overall score for the interview."""
-    global total_questions, total_score
+    state = load_state()
 
-    if total_questions == 0:
-        total_score = 0
+    if state["total_questions"] == 0:
+        if state["total_score"]:
+            state["total_score"] = 0
+            save_state(state)
         return jsonify({"error": "No questions answered."}), 400
 
-    average_score = total_score / total_questions
+    average_score = state["total_score"] / state["total_questions"]
     return jsonify({"score": round(average_score, 2)})
 
 
@@ -223,26 +590,23 @@ def quit_application():
     """
     Handle cleanup tasks like deleting uploaded resumes and resetting the score.
     """
-    global total_score, total_questions
-
-    # Fetch file name from request
-    file_name = request.json.get("file_name", "")
-    file_path = os.path.join(UPLOAD_FOLDER, file_name)
-    resume_deleted = False
-
-    # Delete the uploaded file if it exists
-    if os.path.exists(file_path):
-        os.remove(file_path)
-        resume_deleted = True
-
-    # Reset the score to 0
-    total_score = 0
-    total_questions = 0
+    # Purge every file and cache entry the retention index records for this session;
+    # files are never located from client-supplied names
+    purged = retention.purge_session(get_session_id())
+    resume_deleted = purged["files"] > 0
+    bytes_reclaimed = purged["bytes_reclaimed"]
+    # Forget this session's background jobs and their results
+    job_manager.delete_owned(get_session_id())
+
+    # Drop the interview state, which resets the score to 0; a job still running for
+    # this session sees it gone and stores nothing
+    session_store.delete(get_session_id())
 
     return jsonify({
         "message": "Quit task completed. Score reset to 0 successfully.",
         "score_displayed": True,
-        "resume_deleted": resume_deleted
+        "resume_deleted": resume_deleted,
+        "bytes_reclaimed": bytes_reclaimed
     })
 
 
@@ -251,10 +615,10 @@ def reset_score():
     """
     Reset the total score and questions to 0 explicitly.
     """
-    global total_score, total_questions
-
-    total_score = 0
-    total_questions = 0
+    state = load_state()
+    state["total_score"] = 0
+    state["total_questions"] = 0
+    save_state(state)
 
     return jsonify({"message": "Score reset to 0 successfully."})
 
@@ -262,48 +626,98 @@ def reset_score():
 @app.route("/get_key_fields", methods=["GET"])
 def get_key_fields():
     """Extract and return key fields like skills, projects, and certificates."""
+    parsed_data = load_state()["parsed_data"]
     if not parsed_data:
         return jsonify({"error": "No parsed data available."}), 404
 
+    # Entries were split once when the resume was parsed
+    return jsonify(parsed_data.key_fields())
+
+
+def stored_resume():
+    """
+    Locate the current session's stored resume.
+
+    Returns:
+        tuple: The resume record, its plaintext size and None, or (None, None, error response).
+    """
+    if RESUME_STORAGE == "memory":
+        return None, None, (jsonify({"error": "Uploaded files are not kept (RESUME_STORAGE=memory)."}), 404)
+    resume = load_state()["resume"]
+    if not resume or not os.path.isfile(resume["path"]):
+        return None, None, (jsonify({"error": "File not found."}), 404)
     try:
-        certificates = parsed_data.get("certificates", "").split("\n")[:3]
-        skills = parsed_data.get("skills", "").split("\n")[0]
-        projects = parsed_data.get("projects", "").split("\n•")[:3]
-
-        key_fields = {
-            "Top Certificates": certificates,
-            "Key Skills": skills,
-            "Top Projects": projects
-        }
-        return jsonify(key_fields)
-    except Exception as e:
-        return jsonify({"error": f"Failed to extract key fields: {str(e)}"}), 500
+        return resume, plaintext_size(resume["path"], key_ring), None
+    except DecryptionError as e:
+        return None, None, (jsonify({"error": f"Failed to read file: {str(e)}"}), 500)
+
+
+@app.route("/resume", methods=["GET"])
+def download_resume():
+    """
+    Stream the session's resume, decrypting it frame by frame.
+
+    Supports single byte ranges (206 Partial Content) and If-Range, so clients
+    can resume interrupted downloads; ?download=1 serves it as an attachment.
+    """
+    resume, size, error = stored_resume()
+    if error:
+        return error
+
+    start, stop, status = 0, size, 200
+    if_range = request.headers.get("If-Range")
+    if request.range is not None and len(request.range.ranges) == 1 and (
+            not if_range or request.if_range.etag == resume["digest"]):
+        byte_range = request.range.range_for_length(size)
+        if byte_range is None:
+            response = Response(status=416)
+            response.headers["Content-Range"] = f"bytes */{size}"
+            return response
+        start, stop = byte_range
+        status = 206
+
+    response = Response(iter_decrypt_file(resume["path"], key_ring, start, stop), status=status,
+                        mimetype="application/pdf", direct_passthrough=True)
+    response.headers["Content-Length"] = str(stop - start)
+    response.headers["Accept-Ranges"] = "bytes"
+    if status == 206:
+        response.headers["Content-Range"] = f"bytes {start}-{stop - 1}/{size}"
+    disposition = "attachment" if request.args.get("download", "").lower() in ("1", "true", "yes") else "inline"
+    response.headers["Content-Disposition"] = f'{disposition}; filename="{resume["filename"]}"'
+    response.headers["Cache-Control"] = "private, no-store"
+    response.set_etag(resume["digest"])
+    return response
 
 
 @app.route('/get_encoded_file', methods=['GET'])
 def get_encoded_file():
-    """Provide Base64 encoded content of the uploaded file."""
-    try:
-        file_path = "resume.pdf"  # Replace with your actual file path
-        with open(file_path, "rb") as file:
-            encoded_content = base64.b64encode(file.read()).decode("utf-8")
+    """
+    Provide Base64 encoded content of the session's resume.
 
-        return jsonify({"encoded_content": encoded_content})
-    except FileNotFoundError:
-        return jsonify({"error": "File not found."}), 404
-    except Exception as e:
-        return jsonify({"error": f"Failed to encode file: {str(e)}"}), 500
+    The JSON body is streamed: the file is decrypted and encoded piece by
+    piece, so memory use is constant and the first bytes go out immediately.
+    """
+    resume, size, error = stored_resume()
+    if error:
+        return error
+
+    def generate():
+        yield '{"encoded_content": "'
+        yield from iter_base64(iter_decrypt_file(resume["path"], key_ring))
+        yield '"}'
+
+    return Response(generate(), mimetype="application/json", headers={"Cache-Control": "private, no-store"})
 
 
 @app.route('/get_parsed_data', methods=['GET'])
 def get_parsed_data():
     """Provide parsed resume data."""
-    global parsed_data
+    parsed_data = load_state()["parsed_data"]
 
     if not parsed_data:
         return jsonify({"error": "No parsed data available."}), 404
 
-    return jsonify(parsed_data)
+    return jsonify(parsed_data.to_dict())
 
 
 if __name__ == "__main__":
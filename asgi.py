@@ -0,0 +1,13 @@
+"""
+ASGI entry point.
+
+Serve the application from an ASGI server so async views and slow requests do
+not hold a dedicated WSGI worker each, e.g.:
+
+    uvicorn asgi:asgi_app --workers 2
+"""
+from asgiref.wsgi import WsgiToAsgi
+
+from app import app
+
+asgi_app = WsgiToAsgi(app)
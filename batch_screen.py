@@ -0,0 +1,272 @@
+"""
+Batch resume screening.
+
+Walks a directory or a .zip/.tar(.gz) archive of PDF resumes and writes one
+JSON line per resume with its detected skills, sections and a count of the
+personal data masked before analysis. Work runs on a process pool; a resume
+that takes longer than the timeout gets an error line and its worker is
+replaced. The output file doubles as the checkpoint, so rerunning the same
+command after a crash skips the resumes already written.
+
+Usage:
+    python batch_screen.py resumes/ -o screening.jsonl [--workers 8]
+    python batch_screen.py round42.zip -o screening.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+import tarfile
+import time
+import zipfile
+from collections import Counter, deque
+
+from pdf_extract import EXTRACT_TIMEOUT, extract_pages
+from pii_redactor import default_redactor
+from section_segmenter import segment_sections
+from skills_extractor import extract_technical_skills
+from work_pools import ProcessWorkerPool, TaskTimeout
+
+# Pipeline stages timed in each worker, in order
+STAGES = ["extract", "mask", "skills", "sections"]
+# Documents in flight per worker; bounds memory when reading from archives
+WINDOW_PER_WORKER = 4
+
+
+def iter_documents(source):
+    """
+    Yield (document id, source) for every PDF in a directory or archive.
+
+    Directory entries are yielded as paths; archive members as bytes, read
+    lazily as the pool asks for more work.
+
+    Args:
+        source (str): Directory, .zip, .tar, .tar.gz or .tgz file.
+
+    Yields:
+        tuple: Document id (relative path or member name) and a path or bytes.
+    """
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(".pdf"):
+                    path = os.path.join(root, name)
+                    yield os.path.relpath(path, source), path
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for member in archive.infolist():
+                if not member.is_dir() and member.filename.lower().endswith(".pdf"):
+                    yield member.filename, archive.read(member)
+    elif tarfile.is_tarfile(source):
+        with tarfile.open(source) as archive:
+            for member in archive:
+                if member.isfile() and member.name.lower().endswith(".pdf"):
+                    yield member.name, archive.extractfile(member).read()
+    else:
+        raise ValueError(f"'{source}' is neither a directory nor a zip/tar archive.")
+
+
+def screen_document(document_id, source):
+    """
+    Worker entry point: extract, mask and analyse one resume.
+
+    Args:
+        document_id (str): Id written to the output.
+        source: Path to the PDF or its bytes.
+
+    Returns:
+        tuple: The output record and the seconds spent in each stage.
+    """
+    timings = {}
+    try:
+        started = time.perf_counter()
+        # Already inside a pool worker, so extraction must not use pdf_extract's own pool
+        pages = extract_pages(source, parallel=False)
+        timings["extract"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        masked_pages = []
+        pii = Counter()
+        for masked, findings in default_redactor.redact_stream(pages):
+            masked_pages.append(masked)
+            pii.update(finding["type"] for finding in findings)
+        text = "".join(masked_pages)
+        timings["mask"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        skills = extract_technical_skills(text)
+        timings["skills"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        sections = segment_sections(text)
+        timings["sections"] = time.perf_counter() - started
+    except Exception as e:
+        return {"id": document_id, "error": f"{type(e).__name__}: {e}"}, timings
+
+    return {
+        "id": document_id,
+        "pages": len(pages),
+        "technical_skills": skills,
+        "projects": sections.get("projects", []),
+        "education": sections.get("education", []),
+        "extracurricular_activities": sections.get("extracurricular", []),
+        "pii_masked": dict(pii),
+    }, timings
+
+
+def load_checkpoint(output_path, retry_errors=False):
+    """
+    Read the ids already written to an output file.
+
+    A partially written last line (from a crash mid-write) is truncated away.
+
+    Args:
+        output_path (str): JSON Lines output file.
+        retry_errors (bool): Leave documents that previously failed out of the result so they run again.
+
+    Returns:
+        set: Ids of the documents to skip.
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    valid_bytes = 0
+    with open(output_path, "rb") as file:
+        for line in file:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            valid_bytes += len(line)
+            if not (retry_errors and "error" in record):
+                done.add(record["id"])
+    if valid_bytes != os.path.getsize(output_path):
+        with open(output_path, "r+b") as file:
+            file.truncate(valid_bytes)
+    return done
+
+
+class ThroughputReport:
+    """Aggregates per-stage timings and prints throughput."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.documents = 0
+        self.errors = 0
+        self.pages = 0
+        self.stage_seconds = Counter()
+
+    def add(self, record, timings):
+        self.documents += 1
+        self.errors += "error" in record
+        self.pages += record.get("pages", 0)
+        self.stage_seconds.update(timings)
+
+    def summary(self):
+        """
+        Overall and per-stage throughput.
+
+        Per-stage rates are documents per second of worker time spent in the
+        stage, i.e. the rate a single worker sustains for that stage alone.
+
+        Returns:
+            dict: Throughput figures.
+        """
+        elapsed = time.perf_counter() - self.started
+        return {
+            "documents": self.documents,
+            "errors": self.errors,
+            "pages": self.pages,
+            "elapsed_s": round(elapsed, 3),
+            "documents_per_s": round(self.documents / elapsed, 2) if elapsed else 0.0,
+            "pages_per_s": round(self.pages / elapsed, 2) if elapsed else 0.0,
+            "stages": {
+                stage: {
+                    "worker_s": round(self.stage_seconds[stage], 3),
+                    "documents_per_worker_s": round(self.documents / self.stage_seconds[stage], 2)
+                    if self.stage_seconds[stage] else None,
+                }
+                for stage in STAGES
+            },
+        }
+
+
+def run(source, output_path, workers=None, retry_errors=False, progress_every=100, timeout=EXTRACT_TIMEOUT):
+    """
+    Screen every resume under `source`, appending results to `output_path`.
+
+    Args:
+        source (str): Directory or archive of PDFs.
+        output_path (str): JSON Lines output, also used as the checkpoint.
+        workers (int): Worker processes (default: CPU count).
+        retry_errors (bool): Re-run documents whose earlier attempt failed.
+        progress_every (int): Print progress every this many documents; 0 disables it.
+        timeout (float): Seconds one resume may take in a worker; None for no limit.
+
+    Returns:
+        dict: Throughput summary.
+    """
+    workers = workers or os.cpu_count() or 1
+    done = load_checkpoint(output_path, retry_errors)
+    if done:
+        print(f"Resuming: {len(done)} documents already screened.", file=sys.stderr)
+    report = ThroughputReport()
+    window = workers * WINDOW_PER_WORKER
+
+    def write(output, record, timings):
+        # One line per record, flushed so the checkpoint survives a crash
+        output.write(json.dumps(record) + "\n")
+        output.flush()
+        report.add(record, timings)
+        if progress_every and report.documents % progress_every == 0:
+            summary = report.summary()
+            print(f"{summary['documents']} documents, {summary['documents_per_s']} docs/s", file=sys.stderr)
+
+    def collect(document_id, future):
+        try:
+            return future.result()
+        except TaskTimeout:
+            # Only the stuck worker was killed and replaced; the rest of the batch carries on
+            return {"id": document_id, "error": "timeout"}, {}
+        except Exception as e:
+            # E.g. a worker killed by a native crash; recording it keeps reruns from retrying it forever
+            return {"id": document_id, "error": f"{type(e).__name__}: {e}"}, {}
+
+    # Recycling workers bounds memory growth from pathological documents
+    with ProcessWorkerPool(workers, max_tasks_per_child=200, name="screen") as pool, \
+            open(output_path, "a") as output:
+        pending = deque()
+        for document_id, document in iter_documents(source):
+            if document_id in done:
+                continue
+            pending.append((document_id, pool.submit(screen_document, document_id, document, timeout=timeout)))
+            # Only a bounded window is in flight, so archives are never read into memory whole
+            while len(pending) >= window:
+                write(output, *collect(*pending.popleft()))
+        while pending:
+            write(output, *collect(*pending.popleft()))
+    return report.summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("source", help="Directory or .zip/.tar(.gz) archive of PDF resumes")
+    parser.add_argument("-o", "--output", required=True, help="JSON Lines output file (also the checkpoint)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--retry-errors", action="store_true",
+                        help="Re-run documents that failed previously (their new line supersedes the old one)")
+    parser.add_argument("--progress-every", type=int, default=100, help="Progress interval in documents (0 = off)")
+    parser.add_argument("--timeout", type=float, default=EXTRACT_TIMEOUT,
+                        help="Seconds allowed per resume before it is written as a timeout (0 = no limit)")
+    args = parser.parse_args()
+
+    summary = run(args.source, args.output, args.workers, args.retry_errors, args.progress_every,
+                  args.timeout or None)
+    print(json.dumps(summary, indent=2), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Cold-start cost of importing the scoring module.
+
+Each measurement runs in a fresh interpreter. "legacy" reproduces the previous
+import-time work of train.py (NLTK imports plus the resource download
+checks, which touch the network); "import train" is the current module and
+"first score" adds resolving the tokenizer and stopwords on the first call.
+
+Usage:
+    python -m benchmarks.bench_import [--repeat 5] [--skip-legacy-downloads]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LEGACY_IMPORTS = (
+    "import nltk\n"
+    "from nltk.tokenize import word_tokenize\n"
+    "from nltk.corpus import stopwords\n"
+)
+LEGACY_DOWNLOADS = (
+    "try:\n"
+    "    nltk.download('punkt', quiet=True)\n"
+    "    nltk.download('stopwords', quiet=True)\n"
+    "except Exception:\n"
+    "    pass\n"
+)
+CURRENT = "import train\n"
+FIRST_SCORE = "import train\ntrain.score_answer('Python is a language.', 'Python is a programming language.')\n"
+
+
+def cold_start_ms(code, repeat):
+    """Median wall time of running `code` in a fresh interpreter."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--skip-legacy-downloads", action="store_true",
+                        help="Leave the network download checks out of the legacy measurement")
+    args = parser.parse_args()
+
+    legacy = LEGACY_IMPORTS if args.skip_legacy_downloads else LEGACY_IMPORTS + LEGACY_DOWNLOADS
+    cases = [
+        ("interpreter", "pass\n"),
+        ("legacy", legacy),
+        ("import train", CURRENT),
+        ("first score", FIRST_SCORE),
+    ]
+    print(f"{'case':<14}{'median ms':>12}")
+    for name, code in cases:
+        print(f"{name:<14}{cold_start_ms(code, args.repeat):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Throughput of the Base64 file encoding versus streaming authenticated encryption.
+
+Usage:
+    python -m benchmarks.bench_privacy [--size-mb 32] [--repeat 3]
+"""
+import argparse
+import os
+import secrets
+import tempfile
+import time
+from base64 import b64decode, b64encode
+
+import privacy
+
+# Read size of the Base64 baseline; a multiple of 3 so the pieces concatenate to one encoding
+BASE64_CHUNK_SIZE = 3 * 1024 * 21
+
+
+def base64_encode_file(file_path):
+    """The Base64 encoding that stored uploads before encryption, for comparison."""
+    with open(file_path, "rb") as file, open(f"{file_path}.enc", "w") as enc_file:
+        for chunk in iter(lambda: file.read(BASE64_CHUNK_SIZE), b""):
+            enc_file.write(b64encode(chunk).decode())
+
+
+def base64_decode_file(encoded_file_path):
+    """Inverse of `base64_encode_file`."""
+    with open(encoded_file_path, "r") as enc_file, open(encoded_file_path.replace(".enc", ".dec"), "wb") as dec_file:
+        for block in iter(lambda: enc_file.read(BASE64_CHUNK_SIZE // 3 * 4), ""):
+            dec_file.write(b64decode(block.encode()))
+
+
+def measure(function, repeat):
+    """Return the best wall-clock time of `repeat` calls to `function`."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=32, help="Size of the synthetic input file.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the best is reported.")
+    args = parser.parse_args()
+
+    key_ring = privacy.KeyRing({"bench": secrets.token_bytes(32)})
+    size = args.size_mb * 1024 * 1024
+    with tempfile.TemporaryDirectory() as workdir:
+        source = os.path.join(workdir, "resume.pdf")
+        with open(source, "wb") as file:
+            file.write(os.urandom(size))
+
+        encrypted = f"{source}.enc"
+        # Each case is (name, setup run untimed, timed function)
+        cases = [
+            ("base64 encode", None, lambda: base64_encode_file(source)),
+            ("base64 decode", lambda: base64_encode_file(source), lambda: base64_decode_file(encrypted)),
+        ]
+        for cipher in privacy.CIPHERS:
+            encrypt = lambda c=cipher: privacy.encrypt_file(source, key_ring, cipher=c)
+            cases.append((f"{cipher} encrypt", None, encrypt))
+            cases.append((f"{cipher} decrypt", encrypt, lambda: privacy.decrypt_file(encrypted, key_ring)))
+
+        print(f"{'case':<32}{'MB/s':>10}{'output/input':>14}")
+        for name, setup, function in cases:
+            if setup is not None:
+                setup()
+            seconds = measure(function, args.repeat)
+            ratio = os.path.getsize(encrypted) / size
+            print(f"{name:<32}{args.size_mb / seconds:>10.1f}{ratio:>14.3f}")
+
+if __name__ == "__main__":
+    main()
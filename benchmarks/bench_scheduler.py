@@ -0,0 +1,74 @@
+"""
+Question selection latency for large question banks.
+
+Builds a synthetic bank with tens of thousands of questions and measures
+planning (on load), starting an interview, and choosing each next question.
+
+Usage:
+    python -m benchmarks.bench_scheduler [--questions 50000] [--skills 20] [--interviews 1000]
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from question_bank import QuestionBank
+from question_scheduler import QuestionScheduler
+
+
+def write_bank(path, questions, skills):
+    rng = random.Random(0)
+    bank = {f"skill_{index}": [] for index in range(skills)}
+    for index in range(questions):
+        words = " ".join(f"term{rng.randrange(5000)}" for _ in range(rng.randrange(8, 48)))
+        bank[f"skill_{index % skills}"].append({"question": f"Question {index}?", "answer": words})
+    with open(path, "w") as file:
+        json.dump(bank, file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--questions", type=int, default=50000)
+    parser.add_argument("--skills", type=int, default=20)
+    parser.add_argument("--interviews", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bank.json")
+        write_bank(path, args.questions, args.skills)
+        bank = QuestionBank([path], reload_interval=None)
+        start = time.perf_counter()
+        scheduler = QuestionScheduler(bank, seed=0)
+        plan_ms = (time.perf_counter() - start) * 1000
+
+    rng = random.Random(1)
+    skill_names = [f"skill {index}" for index in range(args.skills)] + ["cobol", "fortran"]
+    start_times = []
+    next_times = []
+    for _ in range(args.interviews):
+        skills = rng.sample(skill_names, rng.randrange(1, 8))
+        start = time.perf_counter()
+        schedule = scheduler.start(skills)
+        start_times.append(time.perf_counter() - start)
+        while True:
+            start = time.perf_counter()
+            question = scheduler.next_question(schedule)
+            next_times.append(time.perf_counter() - start)
+            if question is None:
+                break
+            scheduler.record_score(schedule, rng.uniform(0, 10))
+
+    def summary(timings):
+        timings = sorted(timings)
+        return f"mean {sum(timings) / len(timings) * 1e3:.4f} ms, p99 {timings[int(len(timings) * 0.99)] * 1e3:.4f} ms"
+
+    print(f"bank: {len(bank)} questions across {args.skills} skills")
+    print(f"planning on load: {plan_ms:.1f} ms")
+    print(f"start interview: {summary(start_times)}")
+    print(f"next question:   {summary(next_times)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Latency and agreement of the token-overlap scorer versus the semantic scorer.
+
+Expected answers come from questions.json; candidate answers are the paraphrased
+answers in data.json (matching pairs) and answers to other questions (mismatched pairs).
+
+Usage:
+    python -m benchmarks.bench_scoring [--repeat 3]
+"""
+import argparse
+import time
+
+import numpy as np
+
+import train
+from semantic_scoring import get_semantic_index, load_corpus
+
+
+def build_pairs():
+    """Pair each expected answer with its data.json paraphrase and with an unrelated answer."""
+    _, expected_answers = load_corpus(["questions.json"])
+    _, paraphrases = load_corpus(["data.json"])
+    pairs = []
+    for index, expected in enumerate(expected_answers):
+        pairs.append((expected, paraphrases[index % len(paraphrases)]))
+        pairs.append((expected, paraphrases[(index * 7 + 3) % len(paraphrases)]))
+    return pairs
+
+
+def per_call_ms(function, pairs, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(pairs)
+        best = min(best, time.perf_counter() - start)
+    return best / len(pairs) * 1000
+
+
+def rank(values):
+    return np.argsort(np.argsort(values)).astype(float)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = get_semantic_index()
+    build_ms = (time.perf_counter() - start) * 1000
+    pairs = build_pairs()
+    train.default_scorer.precompute(expected for expected, _ in pairs)
+
+    overlap = [train.score_answer(e, u, mode="overlap") for e, u in pairs]
+    semantic = [index.score(e, u) for e, u in pairs]
+
+    timings = {
+        "overlap (score_answer)": per_call_ms(lambda p: [train.score_answer(e, u) for e, u in p], pairs, args.repeat),
+        "overlap (score_answers)": per_call_ms(train.score_answers, pairs, args.repeat),
+        "semantic": per_call_ms(lambda p: [index.score(e, u) for e, u in p], pairs, args.repeat),
+    }
+    print(f"pairs: {len(pairs)}  index: {index.matrix.shape} {index.matrix.dtype}  built/loaded in {build_ms:.1f} ms")
+    for name, milliseconds in timings.items():
+        print(f"{name:<26}{milliseconds:>10.4f} ms/answer")
+    pearson = np.corrcoef(overlap, semantic)[0, 1]
+    spearman = np.corrcoef(rank(overlap), rank(semantic))[0, 1]
+    print(f"agreement: pearson={pearson:.3f} spearman={spearman:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Section extraction cost of the per-heading regexes versus the one-pass segmenter.
+
+Usage:
+    python -m benchmarks.bench_sections [--pages 1 10 50]
+"""
+import argparse
+import random
+import re
+import time
+
+from section_segmenter import segment_sections
+
+HEADINGS = ["Education", "Technical skills", "Projects", "Certificates and achievements",
+            "Extracurricular Activities"]
+
+
+def legacy_app_sections(text):
+    """The original app.extract_section: one DOTALL regex per heading."""
+    found = {}
+    for heading in HEADINGS:
+        match = re.search(rf"{heading}\n(.*?)(\n\n|\Z)", text, re.DOTALL)
+        found[heading] = match.group(1).strip() if match else "Not found"
+    return found
+
+
+def legacy_extractor_sections(text):
+    """The original skills_extractor scans: one lazy [\\s\\S]*? findall per section."""
+    patterns = [
+        r'(projects?|project experience)\s*[:\-\n]*([\s\S]*?)(\n\n|\Z)',
+        r'(education|academic background)\s*[:\-\n]*([\s\S]*?)(\n\n|\Z)',
+        r'(extracurricular activities|volunteer work|hobbies|interests)\s*[:\-\n]*([\s\S]*?)(\n\n|\Z)',
+    ]
+    return [[match[1].strip() for match in re.findall(pattern, text, re.IGNORECASE)] for pattern in patterns]
+
+
+def synthetic_resume(pages, rng):
+    """Build resume text of roughly `pages` pages with every heading repeated per page."""
+    words = ["developed", "python", "service", "team", "led", "design", "data", "pipeline", "cloud", "api"]
+    lines = []
+    for _ in range(pages):
+        for heading in HEADINGS:
+            lines.append(heading)
+            for _ in range(8):
+                lines.append(" ".join(rng.choice(words) for _ in range(12)))
+            lines.append("")
+    return "\n".join(lines)
+
+
+def best_of(function, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 50])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'pages':>6}{'chars':>10}{'app regex ms':>15}{'extractor ms':>15}{'segmenter ms':>15}")
+    for pages in args.pages:
+        text = synthetic_resume(pages, rng)
+        app_time = best_of(lambda: legacy_app_sections(text))
+        extractor_time = best_of(lambda: legacy_extractor_sections(text))
+        segmenter_time = best_of(lambda: segment_sections(text))
+        print(f"{pages:>6}{len(text):>10}{app_time * 1000:>15.2f}{extractor_time * 1000:>15.2f}"
+              f"{segmenter_time * 1000:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Skill matching cost of the per-skill regex loop versus the compiled single-pass matcher.
+
+Usage:
+    python -m benchmarks.bench_skills [--vocabulary 31 500 3000] [--words 5000]
+"""
+import argparse
+import random
+import re
+import time
+
+from skill_matcher import SkillMatcher, load_taxonomy
+
+
+def per_skill_search(skills, text):
+    """The original approach: one IGNORECASE search over the whole text per skill."""
+    return [skill for skill in skills if re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE)]
+
+
+def synthetic_taxonomy(size, rng):
+    """Extend the shipped taxonomy with random made-up skills up to `size` entries."""
+    taxonomy = dict(load_taxonomy())
+    while len(taxonomy) < size:
+        name = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 12)))
+        taxonomy[name] = [f"{name}.js", f"{name} framework"]
+    return dict(list(taxonomy.items())[:size])
+
+
+def synthetic_text(words, vocabulary, rng):
+    """Build resume-like filler text with occasional skill mentions."""
+    filler = ["developed", "team", "project", "using", "built", "service", "data", "with", "and", "the"]
+    return " ".join(rng.choice(vocabulary) if rng.random() < 0.05 else rng.choice(filler) for _ in range(words))
+
+
+def best_of(function, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vocabulary", type=int, nargs="+", default=[31, 500, 3000])
+    parser.add_argument("--words", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'skills':>8}{'per-skill ms':>15}{'matcher ms':>13}{'build ms':>11}{'agree':>8}")
+    for size in args.vocabulary:
+        taxonomy = synthetic_taxonomy(size, rng)
+        text = synthetic_text(args.words, list(taxonomy), rng)
+        start = time.perf_counter()
+        matcher = SkillMatcher(taxonomy)
+        build = time.perf_counter() - start
+        legacy = best_of(lambda: per_skill_search(list(taxonomy), text))
+        single = best_of(lambda: matcher.find(text))
+        # Only compare canonical names; the matcher additionally recognises aliases
+        agree = set(per_skill_search(list(taxonomy), text)) <= set(matcher.find(text))
+        print(f"{size:>8}{legacy * 1000:>15.2f}{single * 1000:>13.2f}{build * 1000:>11.1f}{str(agree):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+"""
+Benchmark harness covering the application's hot paths.
+
+Runs every registered case on seeded synthetic inputs, prints a table and
+optionally writes machine-readable results. A previous results file can be
+passed to compare against; the exit status is 1 when a case regressed by more
+than the threshold.
+
+Usage:
+    python -m benchmarks.run [-k pii] [--output results.json] [--compare baseline.json] [--threshold 0.15]
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks import synthetic
+
+ROOT = synthetic.ROOT
+
+# Registered cases: name -> setup(rng) returning a zero-argument callable, or (callable, cleanup)
+CASES = {}
+
+
+def case(name):
+    """Register a benchmark case under `name`."""
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+# --- PDF extraction -------------------------------------------------------
+
+def _pdf_case(pages):
+    def setup(rng):
+        from pdf_extract import extract_pages
+        data = synthetic.resume_pdf(rng, pages)
+        # In-process extraction isolates backend cost from pool overhead
+        return lambda: extract_pages(data, parallel=False)
+    return setup
+
+
+case("pdf.extract_2p")(_pdf_case(2))
+case("pdf.extract_20p")(_pdf_case(20))
+
+
+# --- Text analysis --------------------------------------------------------
+
+@case("sections.segment_10p")
+def _sections(rng):
+    from section_segmenter import segment_sections
+    text = synthetic.resume_text(rng, 10)
+    return lambda: segment_sections(text)
+
+
+@case("pii.mask_10p")
+def _pii_mask(rng):
+    from pii_redactor import default_redactor
+    text = synthetic.resume_text(rng, 10)
+    return lambda: default_redactor.mask(text)
+
+
+@case("pii.redact_stream_10p")
+def _pii_stream(rng):
+    from pii_redactor import default_redactor
+    pages = synthetic.resume_pages(rng, 10)
+    return lambda: [masked for masked, _ in default_redactor.redact_stream(pages)]
+
+
+@case("skills.find_10p")
+def _skills(rng):
+    from skills_extractor import extract_technical_skills
+    text = synthetic.resume_text(rng, 10)
+    return lambda: extract_technical_skills(text)
+
+
+# --- Scoring and questions ------------------------------------------------
+
+@case("scoring.score_answer")
+def _score_answer(rng):
+    from train import score_answer
+    pairs = itertools.cycle(synthetic.answer_pairs(rng, 200))
+    return lambda: score_answer(*next(pairs))
+
+
+@case("scoring.score_answers_100")
+def _score_answers(rng):
+    from train import score_answers
+    pairs = synthetic.answer_pairs(rng, 100)
+    return lambda: score_answers(pairs)
+
+
+@case("questions.load_bank")
+def _load_bank(rng):
+    from question_bank import QuestionBank
+    paths = [os.path.join(ROOT, "questions.json"), os.path.join(ROOT, "data.json")]
+    return lambda: QuestionBank(paths, reload_interval=None)
+
+
+@case("questions.resolve")
+def _resolve(rng):
+    from question_bank import QuestionBank
+    bank = QuestionBank([os.path.join(ROOT, "questions.json"), os.path.join(ROOT, "data.json")])
+    names = itertools.cycle(["Python", "HTML", "css", "Machine Learning", "js", "COBOL"])
+    return lambda: bank.get(next(names))
+
+
+@case("questions.plan_interview")
+def _plan(rng):
+    from question_bank import QuestionBank
+    from question_scheduler import QuestionScheduler
+    bank = QuestionBank([os.path.join(ROOT, "questions.json"), os.path.join(ROOT, "data.json")])
+    scheduler = QuestionScheduler(bank, seed=0)
+    skills = ["Python", "Java", "HTML", "CSS", "SQL", "Machine Learning", "Rust"]
+
+    def plan():
+        schedule = scheduler.start(skills)
+        while scheduler.next_question(schedule) is not None:
+            scheduler.record_score(schedule, 5.0)
+    return plan
+
+
+# --- Flask endpoints ------------------------------------------------------
+
+def _client(parsed_data=None):
+    """A test client with GDPR consent and, optionally, parsed resume data in its session."""
+    import app as application
+
+    client = application.app.test_client()
+    client.post("/accept_gdpr")
+    session_id = f"bench-{random.getrandbits(64):x}"
+    with client.session_transaction() as session:
+        session["sid"] = session_id
+    if parsed_data is not None:
+        state = application.session_store.load(session_id)
+        state["parsed_data"] = parsed_data
+        application.session_store.set(session_id, state)
+    return application, client, session_id
+
+
+def _parsed():
+    from parsed_resume import ParsedResume
+    return ParsedResume(education="B.E. Computer Science", skills="Python, Java, HTML, CSS, SQL",
+                        projects="Portfolio website")
+
+
+@case("flask.upload_resume")
+def _upload(rng):
+    import io
+
+    _, client, _ = _client()
+    pdf = synthetic.resume_pdf(rng, 2)
+    counter = itertools.count()
+
+    def upload():
+        # A trailing comment makes every upload unique, so the parse cache never hits
+        data = pdf + f"\n%{next(counter)}\n".encode()
+        response = client.post("/upload_resume?wait=1", data={"resume": (io.BytesIO(data), "bench.pdf")},
+                               content_type="multipart/form-data")
+        assert response.status_code == 200, response.get_json()
+    # /quit deletes the stored upload and this session's cache entries
+    return upload, lambda: client.post("/quit")
+
+
+@case("flask.start_interview")
+def _start_interview(rng):
+    _, client, _ = _client(_parsed())
+    return lambda: client.post("/start_interview")
+
+
+@case("flask.submit_answer")
+def _submit_answer(rng):
+    application, client, session_id = _client(_parsed())
+    client.post("/start_interview")
+    answers = itertools.cycle([candidate for _, candidate in synthetic.answer_pairs(rng, 50)])
+
+    def submit():
+        # Rewind to the first question so every call scores an answer
+        state = application.session_store.load(session_id)
+        state["current_question_index"] = 0
+        application.session_store.set(session_id, state)
+        client.post("/submit_answer", json={"answer": next(answers)})
+    return submit
+
+
+@case("flask.get_parsed_data")
+def _get_parsed_data(rng):
+    _, client, _ = _client(_parsed())
+    return lambda: client.get("/get_parsed_data")
+
+
+# --- Harness --------------------------------------------------------------
+
+def measure(function, repeat, min_time):
+    """
+    Time a callable.
+
+    The loop count is calibrated so each sample lasts at least `min_time`
+    seconds; the statistics are per call over `repeat` samples.
+
+    Returns:
+        dict: Loop count and per-call timings in milliseconds.
+    """
+    function()  # Warm-up: lazy imports, caches, pools
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        samples.append((time.perf_counter() - start) / loops * 1000)
+    median = statistics.median(samples)
+    return {
+        "loops": loops,
+        "repeat": repeat,
+        "min_ms": round(min(samples), 6),
+        "median_ms": round(median, 6),
+        "mean_ms": round(statistics.fmean(samples), 6),
+        "stdev_ms": round(statistics.stdev(samples), 6) if len(samples) > 1 else 0.0,
+        "ops_per_s": round(1000 / median, 2) if median else None,
+    }
+
+
+def environment(seed):
+    """Describe the machine and revision the results came from."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "commit": commit,
+        "seed": seed,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def run(names, seed, repeat, min_time):
+    """
+    Run the selected cases.
+
+    Returns:
+        dict: Environment metadata and per-case results; cases whose setup fails are reported as skipped.
+    """
+    results = {}
+    for name in names:
+        try:
+            prepared = CASES[name](random.Random(seed))
+        except ImportError as e:
+            results[name] = {"skipped": f"missing dependency: {e.name}"}
+            continue
+        function, cleanup = prepared if isinstance(prepared, tuple) else (prepared, None)
+        try:
+            results[name] = measure(function, repeat, min_time)
+        finally:
+            if cleanup is not None:
+                cleanup()
+    return {"environment": environment(seed), "results": results}
+
+
+def compare(current, baseline, threshold):
+    """
+    Compare median timings against a baseline run.
+
+    Returns:
+        dict: Case name mapped to (baseline median, current median, ratio, verdict).
+    """
+    comparison = {}
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if "median_ms" not in result or not previous or "median_ms" not in previous:
+            continue
+        ratio = result["median_ms"] / previous["median_ms"] if previous["median_ms"] else float("inf")
+        if ratio > 1 + threshold:
+            verdict = "regression"
+        elif ratio < 1 - threshold:
+            verdict = "improvement"
+        else:
+            verdict = "unchanged"
+        comparison[name] = (previous["median_ms"], result["median_ms"], round(ratio, 3), verdict)
+    return comparison
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-k", "--filter", default="", help="Only run cases whose name contains this text")
+    parser.add_argument("--list", action="store_true", help="List the cases and exit")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.1, help="Minimum seconds per timing sample")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Results JSON of a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Relative change reported as a regression")
+    args = parser.parse_args()
+
+    names = [name for name in CASES if args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    current = run(names, args.seed, args.repeat, args.min_time)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(current, file, indent=2)
+
+    comparison = {}
+    if args.compare:
+        with open(args.compare, "r") as file:
+            comparison = compare(current, json.load(file), args.threshold)
+
+    print(f"{'case':<28}{'median ms':>12}{'stdev ms':>12}{'ops/s':>12}{'baseline ms':>14}{'ratio':>8}  verdict")
+    for name, result in current["results"].items():
+        if "skipped" in result:
+            print(f"{name:<28}{'skipped: ' + result['skipped']:>36}")
+            continue
+        line = f"{name:<28}{result['median_ms']:>12.4f}{result['stdev_ms']:>12.4f}{result['ops_per_s']:>12.1f}"
+        if name in comparison:
+            baseline_ms, _, ratio, verdict = comparison[name]
+            line += f"{baseline_ms:>14.4f}{ratio:>8.3f}  {verdict}"
+        print(line)
+
+    regressions = [name for name, (*_, verdict) in comparison.items() if verdict == "regression"]
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
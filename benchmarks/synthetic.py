@@ -0,0 +1,124 @@
+"""
+Seeded generators of synthetic resumes and answers for the benchmarks.
+
+Every generator takes a `random.Random`, so the same seed always produces the
+same inputs and runs stay comparable.
+"""
+import json
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FILLER = ["developed", "service", "team", "led", "design", "data", "pipeline", "cloud", "api", "scalable",
+          "users", "latency", "improved", "built", "tested", "deployed", "feature", "module", "report", "client"]
+SKILLS = ["Python", "Java", "JavaScript", "HTML", "CSS", "SQL", "React", "Docker", "AWS", "Git", "Linux",
+          "TensorFlow", "Machine Learning", "Data Science", "Node.js", "Kotlin", "Go", "C++"]
+PII = ["jane.doe@example.com", "+91 9876543210", "linkedin.com/in/jane-doe", "https://jane.dev/cv",
+       "DOB: 01/02/1990", "221 Baker Street", "123-45-6789"]
+HEADINGS = ["Education", "Technical Skills", "Projects", "Certificates", "Extracurricular Activities",
+            "Experience"]
+# Lines per page of generated resume text; fits a letter page at 10 pt
+LINES_PER_PAGE = 50
+
+
+def sentence(rng, words=12, pii_rate=0.05, skill_rate=0.15):
+    """One line of resume prose with occasional skills and personal data."""
+    line = [rng.choice(FILLER) for _ in range(words)]
+    if rng.random() < skill_rate:
+        line.insert(rng.randrange(len(line)), rng.choice(SKILLS))
+    if rng.random() < pii_rate:
+        line.insert(rng.randrange(len(line)), rng.choice(PII))
+    return " ".join(line)
+
+
+def resume_pages(rng, pages=2):
+    """
+    Generate resume text split into pages.
+
+    The first page starts with a contact header; every section heading recurs
+    across pages, followed by prose and blank lines between sections.
+
+    Args:
+        rng (random.Random): Source of randomness.
+        pages (int): Number of pages.
+
+    Returns:
+        list: Text of each page.
+    """
+    result = []
+    for page in range(pages):
+        lines = []
+        if page == 0:
+            lines += ["Jane Doe", f"{PII[0]} | {PII[1]} | {PII[2]}", "Address: 12 Park Lane, Springfield", ""]
+        while len(lines) < LINES_PER_PAGE:
+            lines.append(rng.choice(HEADINGS))
+            if lines[-1] == "Technical Skills":
+                lines.append(", ".join(rng.sample(SKILLS, 8)))
+            for _ in range(rng.randint(3, 8)):
+                lines.append(sentence(rng))
+            lines.append("")
+        result.append("\n".join(lines[:LINES_PER_PAGE]) + "\n")
+    return result
+
+
+def resume_text(rng, pages=2):
+    """Generate the full text of a synthetic resume; see `resume_pages`."""
+    return "".join(resume_pages(rng, pages))
+
+
+def resume_pdf(rng, pages=2):
+    """
+    Render a synthetic resume as PDF bytes with PyMuPDF.
+
+    Args:
+        rng (random.Random): Source of randomness.
+        pages (int): Number of pages.
+
+    Returns:
+        bytes: The PDF.
+    """
+    import fitz
+
+    document = fitz.open()
+    for text in resume_pages(rng, pages):
+        page = document.new_page()
+        page.insert_text((50, 60), text, fontsize=10)
+    data = document.tobytes()
+    document.close()
+    return data
+
+
+def load_expected_answers():
+    """Expected answers from the shipped question files."""
+    answers = []
+    for name in ("questions.json", "data.json"):
+        with open(os.path.join(ROOT, name), "r") as file:
+            for questions in json.load(file).values():
+                answers.extend(question.get("expected_answer") or question.get("answer") for question in questions)
+    return answers
+
+
+def answer_pairs(rng, count):
+    """
+    Generate (expected answer, candidate answer) pairs.
+
+    Candidate answers keep a random share of the expected answer's words,
+    shuffled and padded with filler, so scores spread over the whole range.
+
+    Args:
+        rng (random.Random): Source of randomness.
+        count (int): Number of pairs.
+
+    Returns:
+        list: (expected answer, candidate answer) tuples.
+    """
+    expected_answers = load_expected_answers()
+    pairs = []
+    for _ in range(count):
+        expected = rng.choice(expected_answers)
+        words = expected.split()
+        kept = [word for word in words if rng.random() < rng.random()]
+        kept += [rng.choice(FILLER) for _ in range(rng.randint(0, len(words) // 2))]
+        rng.shuffle(kept)
+        pairs.append((expected, " ".join(kept) or rng.choice(FILLER)))
+    return pairs
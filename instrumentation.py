@@ -0,0 +1,387 @@
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+from flask import Response, g, request
+
+# Set to 0 to turn stage timers and request metrics into no-ops
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1") != "0"
+# Fraction of requests profiled by the sampling profiler; 0 disables it
+PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", 0))
+# Directory receiving one folded-stack file per profiled request
+PROFILE_DIR = os.environ.get("PROFILE_DIR", "profiles")
+# Milliseconds between profiler samples
+PROFILE_INTERVAL_MS = float(os.environ.get("PROFILE_INTERVAL_MS", 5))
+
+# Latency buckets in seconds, from cheap lookups to model inference
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+def _escape(value):
+    """Escape a label value for the Prometheus text format."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value):
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Histogram:
+    """
+    Cumulative latency histogram with labels, rendered in Prometheus text format.
+
+    Args:
+        name (str): Metric name.
+        documentation (str): HELP text.
+        labelnames (tuple): Label names; `observe` takes their values as keyword arguments.
+        buckets (tuple): Upper bounds in seconds.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}  # label values -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def samples(self):
+        with self._lock:
+            snapshot = {key: list(series) for key, series in self._series.items()}
+        lines = []
+        for key, series in sorted(snapshot.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, [("le", _format_value(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key, [("le", "+Inf")])
+            lines.append(f"{self.name}_bucket{labels} {series[-1]}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{labels} {series[-1]}")
+        return lines
+
+
+class CounterMetric:
+    """Monotonic counter with labels."""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = Counter()
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            self._values[key] += amount
+
+    def samples(self):
+        with self._lock:
+            snapshot = dict(self._values)
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in sorted(snapshot.items())]
+
+
+class GaugeCallback:
+    """
+    Gauge whose values are computed at scrape time.
+
+    Args:
+        callback (callable): Returns a dict of label-value tuples to numbers, or a single number.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, callback, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+
+    def samples(self):
+        try:
+            values = self.callback()
+        except Exception as e:
+            print(f"Error collecting metric '{self.name}': {e}")
+            return []
+        if not isinstance(values, dict):
+            values = {(): values}
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in sorted(values.items()) if value is not None]
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together for `/metrics`."""
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(CounterMetric(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, callback, labelnames=()):
+        return self.register(GaugeCallback(name, documentation, callback, labelnames))
+
+    def render(self):
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition text.
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+def process_resident_memory_bytes():
+    """Resident set size of this process, or None where it cannot be read."""
+    try:
+        with open("/proc/self/statm", "r") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+metrics = MetricsRegistry()
+REQUEST_SECONDS = metrics.histogram(
+    "app_request_duration_seconds", "Request latency by endpoint.", ("endpoint", "method", "status")
+)
+STAGE_SECONDS = metrics.histogram(
+    "app_stage_duration_seconds", "Time spent in each processing stage.", ("stage",)
+)
+EXCEPTIONS = metrics.counter(
+    "app_request_exceptions_total", "Unhandled exceptions by endpoint.", ("endpoint",)
+)
+metrics.gauge("process_resident_memory_bytes", "Resident memory of this worker process.",
+              process_resident_memory_bytes)
+
+
+class _StageTimer:
+    __slots__ = ("name", "started")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        STAGE_SECONDS.observe(time.perf_counter() - self.started, stage=self.name)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def stage(name):
+    """
+    Time a processing stage, e.g. `with stage("pdf_extract"): ...`.
+
+    Args:
+        name (str): Stage label.
+
+    Returns:
+        A context manager recording the duration in `app_stage_duration_seconds`.
+    """
+    return _StageTimer(name) if METRICS_ENABLED else _NULL_TIMER
+
+
+def timed(name, function, *args, **kwargs):
+    """
+    Call a function inside a stage timer; handy for work submitted to a pool.
+
+    Args:
+        name (str): Stage label.
+        function (callable): Function to call with the remaining arguments.
+
+    Returns:
+        The function's return value.
+    """
+    with stage(name):
+        return function(*args, **kwargs)
+
+
+def _frame_name(frame):
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class SamplingProfiler:
+    """
+    Wall-clock sampling profiler producing folded stacks for flame graphs.
+
+    A daemon thread snapshots the stack of every thread each `interval` seconds
+    while at least one profile is active, so unsampled requests pay nothing.
+    Work for a request often runs on pool threads, so all threads are sampled
+    and each stack is rooted at its thread name; profiles of concurrent
+    requests therefore overlap.
+
+    Args:
+        interval (float): Seconds between samples.
+    """
+
+    def __init__(self, interval=PROFILE_INTERVAL_MS / 1000):
+        self.interval = interval
+        self._active = {}  # profile id -> Counter of folded stacks
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Begin a profile and return its id."""
+        profile_id = uuid.uuid4().hex
+        with self._lock:
+            self._active[profile_id] = Counter()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+                self._thread.start()
+        self._wake.set()
+        return profile_id
+
+    def stop(self, profile_id):
+        """
+        End a profile.
+
+        Returns:
+            Counter: Folded stack ("thread;file:function;...") mapped to its sample count.
+        """
+        with self._lock:
+            stacks = self._active.pop(profile_id, Counter())
+            if not self._active:
+                self._wake.clear()
+        return stacks
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while True:
+            self._wake.wait()
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            folded = []
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_name(frame))
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                folded.append(";".join(reversed(stack)))
+            with self._lock:
+                for stacks in self._active.values():
+                    stacks.update(folded)
+            time.sleep(self.interval)
+
+
+def write_folded(stacks, directory, label):
+    """
+    Write folded stacks in the format read by flamegraph.pl and speedscope.
+
+    Returns:
+        str: Path of the written file.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{label}-{uuid.uuid4().hex[:8]}.folded")
+    with open(path, "w") as file:
+        for stack, count in stacks.most_common():
+            file.write(f"{stack} {count}\n")
+    return path
+
+
+profiler = SamplingProfiler() if PROFILE_SAMPLE_RATE > 0 else None
+
+
+def init_app(app):
+    """
+    Attach request timing, the optional profiler and the `/metrics` endpoint to a Flask app.
+
+    Register this before other request hooks so rejected requests are measured too.
+
+    Args:
+        app (flask.Flask): The application.
+    """
+    if METRICS_ENABLED or profiler is not None:
+        @app.before_request
+        def start_request_timer():
+            g.request_started = time.perf_counter()
+            if profiler is not None and random.random() < PROFILE_SAMPLE_RATE:
+                g.profile_id = profiler.start()
+
+    if METRICS_ENABLED:
+        @app.after_request
+        def observe_request(response):
+            started = g.get("request_started")
+            if started is not None:
+                REQUEST_SECONDS.observe(time.perf_counter() - started, endpoint=request.endpoint or "unknown",
+                                        method=request.method, status=str(response.status_code))
+            return response
+
+    @app.teardown_request
+    def finish_request(error):
+        if error is not None and METRICS_ENABLED:
+            EXCEPTIONS.inc(endpoint=request.endpoint or "unknown")
+        profile_id = g.pop("profile_id", None)
+        if profile_id is not None:
+            stacks = profiler.stop(profile_id)
+            if stacks:
+                try:
+                    write_folded(stacks, PROFILE_DIR, request.endpoint or "unknown")
+                except OSError as e:
+                    print(f"Error writing profile: {e}")
+
+    @app.route("/metrics", methods=["GET"])
+    def prometheus_metrics():
+        """Expose metrics in the Prometheus text format."""
+        return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
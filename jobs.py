@@ -0,0 +1,216 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+# Job states; the last two are final
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINAL_STATES = (SUCCEEDED, FAILED)
+
+
+class Job:
+    """
+    Status record of one background job.
+
+    Attributes:
+        id (str): Job id handed to the client.
+        owner (str): Session id allowed to see the job.
+        status (str): queued, running, succeeded or failed.
+        stage (str): Current pipeline stage, e.g. "parsing".
+        progress (float): Fraction of the pipeline completed, 0-1.
+        result (dict): Result once succeeded.
+        error (str): Error message once failed.
+        version (int): Incremented on every change, for change notifications.
+    """
+
+    __slots__ = ("id", "owner", "status", "stage", "progress", "result", "error",
+                 "created_at", "updated_at", "finished_at", "version")
+
+    def __init__(self, owner):
+        self.id = uuid.uuid4().hex
+        self.owner = owner
+        self.status = QUEUED
+        self.stage = QUEUED
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self.created_at = self.updated_at = time.time()
+        self.finished_at = None
+        self.version = 0
+
+    def to_dict(self):
+        """Public status fields; the result is served separately."""
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "stage": self.stage,
+            "progress": round(self.progress, 3),
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+class JobManager:
+    """
+    Runs background jobs on a work pool and keeps their status for polling.
+
+    Finished jobs, including their results, are dropped `ttl` seconds after
+    they finish so no processed resume data outlives its use.
+
+    Args:
+        executor (BoundedExecutor): Pool running the jobs; a full pool rejects new jobs with QueueFull.
+        ttl (float): Seconds a finished job is kept.
+    """
+
+    def __init__(self, executor, ttl=600):
+        self.executor = executor
+        self.ttl = ttl
+        self._jobs = {}
+        self._finished = OrderedDict()  # job id -> finish time, oldest first
+        self._changed = threading.Condition()
+
+    def submit(self, owner, fn, *args, **kwargs):
+        """
+        Start a job.
+
+        Args:
+            owner (str): Session id that may read the job.
+            fn (callable): Called as fn(report, *args, **kwargs); `report(stage, progress)`
+                           publishes progress and the return value becomes the result.
+
+        Returns:
+            tuple: The queued Job and a concurrent.futures.Future resolving to its result.
+
+        Raises:
+            QueueFull: If the pool cannot take another job.
+        """
+        self.purge_expired()
+        job = Job(owner)
+        with self._changed:
+            self._jobs[job.id] = job
+        try:
+            future = self.executor.submit(self._run, job, fn, args, kwargs)
+        except Exception:
+            with self._changed:
+                del self._jobs[job.id]
+            raise
+        return job, future
+
+    def _update(self, job, **fields):
+        with self._changed:
+            for name, value in fields.items():
+                setattr(job, name, value)
+            job.updated_at = time.time()
+            job.version += 1
+            if job.status in FINAL_STATES:
+                job.finished_at = job.updated_at
+                self._finished[job.id] = job.finished_at
+            self._changed.notify_all()
+
+    def _run(self, job, fn, args, kwargs):
+        self._update(job, status=RUNNING, stage=RUNNING)
+
+        def report(stage, progress):
+            self._update(job, stage=stage, progress=progress)
+
+        try:
+            result = fn(report, *args, **kwargs)
+        except Exception as e:
+            self._update(job, status=FAILED, stage=FAILED, error=str(e))
+            raise
+        self._update(job, status=SUCCEEDED, stage=SUCCEEDED, progress=1.0, result=result)
+        return result
+
+    def get(self, job_id, owner):
+        """
+        Look up a job.
+
+        Args:
+            job_id (str): Job id.
+            owner (str): Session id of the caller; other sessions' jobs are not visible.
+
+        Returns:
+            Job: The job, or None if it is unknown, expired or owned by another session.
+        """
+        self.purge_expired()
+        job = self._jobs.get(job_id)
+        if job is None or job.owner != owner:
+            return None
+        return job
+
+    def wait(self, job, version, timeout):
+        """
+        Block until the job changes past `version` or the timeout expires.
+
+        Returns:
+            bool: True if the job changed.
+        """
+        with self._changed:
+            return self._changed.wait_for(lambda: job.version > version, timeout=timeout)
+
+    def delete_owned(self, owner):
+        """
+        Forget every job of a session, e.g. when the candidate quits.
+
+        Args:
+            owner (str): Session id.
+
+        Returns:
+            int: Number of jobs removed. Running jobs finish but their records are gone.
+        """
+        with self._changed:
+            owned = [job_id for job_id, job in self._jobs.items() if job.owner == owner]
+            for job_id in owned:
+                del self._jobs[job_id]
+                self._finished.pop(job_id, None)
+        return len(owned)
+
+    def purge_expired(self):
+        """
+        Drop finished jobs older than the TTL.
+
+        Returns:
+            int: Number of jobs removed.
+        """
+        cutoff = time.time() - self.ttl
+        removed = 0
+        with self._changed:
+            while self._finished:
+                job_id, finished_at = next(iter(self._finished.items()))
+                if finished_at > cutoff:
+                    break
+                del self._finished[job_id]
+                self._jobs.pop(job_id, None)
+                removed += 1
+        return removed
+
+    def stats(self):
+        """
+        Report job counts by status.
+
+        Returns:
+            dict: Status mapped to the number of jobs currently kept.
+        """
+        with self._changed:
+            counts = {status: 0 for status in (QUEUED, RUNNING, SUCCEEDED, FAILED)}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return counts
+
+
+def create_job_manager(executor):
+    """
+    Create a job manager configured by `JOB_TTL`.
+
+    Args:
+        executor (BoundedExecutor): Pool running the jobs.
+
+    Returns:
+        JobManager: The configured manager.
+    """
+    return JobManager(executor, ttl=float(os.environ.get("JOB_TTL", 600)))
@@ -0,0 +1,161 @@
+import gc
+import os
+import threading
+
+# Default summarizer; a distilled checkpoint such as "sshleifer/distilbart-cnn-12-6"
+# roughly halves load time and resident memory on CPU
+DEFAULT_SUMMARIZER_MODEL = "facebook/bart-large-cnn"
+
+
+class ModelRegistry:
+    """
+    Registry of heavy models that are loaded lazily on first use.
+
+    Each model is described by a factory. The first `get` call loads it under a
+    per-model lock so concurrent requests trigger a single load; later calls
+    return the shared instance. `preload` loads models eagerly, which lets a
+    master process load them before forking workers that then share the pages.
+    """
+
+    def __init__(self):
+        self._factories = {}
+        self._models = {}
+        self._errors = {}
+        self._locks = {}
+        self._preloaded = set()
+
+    def register(self, name, factory):
+        """
+        Register a model factory.
+
+        Args:
+            name (str): Name used to look the model up.
+            factory (callable): Zero-argument callable returning the loaded model.
+        """
+        self._factories[name] = factory
+        self._locks[name] = threading.Lock()
+
+    def get(self, name):
+        """
+        Return a model, loading it on first use.
+
+        Args:
+            name (str): Registered model name.
+
+        Returns:
+            object: The loaded model, or None if loading failed.
+        """
+        model = self._models.get(name)
+        if model is not None:
+            return model
+        with self._locks[name]:
+            # Another thread may have finished loading while we waited
+            if name in self._models:
+                return self._models[name]
+            if name in self._errors:
+                return None
+            try:
+                model = self._factories[name]()
+            except Exception as e:
+                print(f"Error initializing model '{name}': {e}")
+                self._errors[name] = str(e)
+                return None
+            self._models[name] = model
+            return model
+
+    def preload(self, names=None):
+        """
+        Eagerly load models, e.g. in a master process before workers fork.
+
+        Args:
+            names (list): Model names to load; all registered models if omitted.
+        """
+        for name in names or list(self._factories):
+            self._preloaded.add(name)
+            self.get(name)
+        # Move the loaded objects out of the GC's tracked generations so that
+        # collections in forked workers do not touch (and copy) their pages
+        gc.freeze()
+
+    def is_loaded(self, name):
+        """Return True if the named model has been loaded."""
+        return name in self._models
+
+    def is_ready(self):
+        """Return True if every preloaded model loaded and no model failed to load."""
+        return not self._errors and all(name in self._models for name in self._preloaded)
+
+    def memory_bytes(self):
+        """
+        Estimate the memory held by each loaded model.
+
+        Returns:
+            dict: Model name mapped to the bytes of its parameters and buffers, for loaded models.
+        """
+        return {name: model_memory_bytes(model) for name, model in list(self._models.items())}
+
+    def status(self):
+        """
+        Describe the state of every registered model.
+
+        Returns:
+            dict: Model name mapped to "loaded", "not_loaded" or "failed: <reason>".
+        """
+        report = {}
+        for name in self._factories:
+            if name in self._models:
+                report[name] = "loaded"
+            elif name in self._errors:
+                report[name] = f"failed: {self._errors[name]}"
+            else:
+                report[name] = "not_loaded"
+        return report
+
+
+def model_memory_bytes(model):
+    """
+    Sum the parameter and buffer sizes of a PyTorch model or a pipeline wrapping one.
+
+    Args:
+        model: A torch.nn.Module or an object with a `model` attribute holding one.
+
+    Returns:
+        int: Bytes, or None for objects that are not PyTorch models.
+    """
+    module = getattr(model, "model", model)
+    if not hasattr(module, "parameters"):
+        return None
+    tensors = list(module.parameters()) + list(module.buffers())
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+
+def load_summarizer():
+    """
+    Build the summarization pipeline configured by the environment.
+
+    `SUMMARIZER_MODEL` selects the checkpoint and `SUMMARIZER_QUANTIZE=1` applies
+    dynamic int8 quantization to its linear layers for faster CPU inference.
+
+    Returns:
+        transformers.Pipeline: The summarization pipeline, running on CPU.
+    """
+    # Imported here so that processes which never summarize skip the heavy import
+    from transformers import pipeline, logging
+
+    # Suppress detailed logs from the Transformers library
+    logging.set_verbosity_error()
+
+    model_name = os.environ.get("SUMMARIZER_MODEL", DEFAULT_SUMMARIZER_MODEL)
+    summarizer = pipeline("summarization", model=model_name, device=-1)
+
+    if os.environ.get("SUMMARIZER_QUANTIZE") == "1":
+        import torch
+
+        summarizer.model = torch.quantization.quantize_dynamic(
+            summarizer.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    return summarizer
+
+
+model_registry = ModelRegistry()
+model_registry.register("summarizer", load_summarizer)
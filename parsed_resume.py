@@ -0,0 +1,154 @@
+import re
+
+# Placeholder shown for sections missing from a resume
+NOT_FOUND = "Not found"
+# Sections kept for each resume, in display order
+SECTIONS = ("education", "skills", "projects", "certificates", "extracurricular")
+
+# Separators between the entries of a section
+_SKILL_SEPARATOR = re.compile(r"[,;|\n•]")
+_PROJECT_SEPARATOR = re.compile(r"\n•")
+_LINE_SEPARATOR = re.compile(r"\n")
+
+
+def _split(text, separator):
+    """Split a section into its non-empty entries; a missing section has none."""
+    if text == NOT_FOUND:
+        return []
+    entries = (part.strip(" \t•") for part in separator.split(text))
+    return [entry for entry in entries if entry]
+
+
+class ParsedResume:
+    """
+    Masked sections of one resume, with its entry lists split once up front.
+
+    Instances are what the session store and the resume cache hold; the
+    endpoints read the precomputed lists and views instead of re-splitting
+    the section text on every request. A section that appears several times
+    keeps every block: the section text is the first one, as the endpoints
+    always showed, and `blocks` returns them all.
+
+    A resume with no section found is falsy, like the empty dict parsers
+    returned before.
+
+    Attributes:
+        education, skills, projects, certificates, extracurricular (str): Text of the section's
+            first block, or NOT_FOUND.
+        skill_list (list): Individual skills, from every block.
+        project_list (list): Individual projects, from every block.
+        certificate_list (list): Individual certificates, from every block.
+    """
+
+    __slots__ = SECTIONS + ("skill_list", "project_list", "certificate_list", "_more_blocks", "_skills_given",
+                            "_key_fields")
+
+    def __init__(self, education=NOT_FOUND, skills=NOT_FOUND, projects=NOT_FOUND, certificates=NOT_FOUND,
+                 extracurricular=NOT_FOUND, skill_list=None, project_list=None, certificate_list=None,
+                 more_blocks=None):
+        self.education = education
+        self.skills = skills
+        self.projects = projects
+        self.certificates = certificates
+        self.extracurricular = extracurricular
+        # Section name -> its blocks after the first, for sections that appear more than once
+        self._more_blocks = {name: list(blocks) for name, blocks in (more_blocks or {}).items() if blocks}
+        # Lists given explicitly (e.g. skill matcher output) are kept as they are
+        self._skills_given = skill_list is not None
+        self.skill_list = list(skill_list) if skill_list is not None else self._entries("skills", _SKILL_SEPARATOR)
+        self.project_list = (list(project_list) if project_list is not None
+                             else self._entries("projects", _PROJECT_SEPARATOR))
+        self.certificate_list = (list(certificate_list) if certificate_list is not None
+                                 else self._entries("certificates", _LINE_SEPARATOR))
+        self._key_fields = {
+            "Top Certificates": self.certificate_list[:3] or [NOT_FOUND],
+            "Key Skills": skills.split("\n")[0],
+            "Top Projects": self.project_list[:3] or [NOT_FOUND],
+        }
+
+    def _entries(self, name, separator):
+        """Split every block of a section into its entries."""
+        return [entry for block in self.blocks(name) for entry in _split(block, separator)]
+
+    @classmethod
+    def from_sections(cls, sections, technical_skills=None):
+        """
+        Build a resume from `segment_sections` output, keeping every block of each section.
+
+        Args:
+            sections (dict): Section name mapped to its list of text blocks.
+            technical_skills (list): Skills found by the skill matcher, used instead of splitting the skills section.
+
+        Returns:
+            ParsedResume: The resume.
+        """
+        fields = {name: sections[name][0] if sections.get(name) else NOT_FOUND for name in SECTIONS}
+        more_blocks = {name: sections[name][1:] for name in SECTIONS if len(sections.get(name, ())) > 1}
+        return cls(**fields, skill_list=technical_skills, more_blocks=more_blocks)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a resume from the section dict returned by `to_dict`."""
+        return cls(**{name: data.get(name) or NOT_FOUND for name in SECTIONS})
+
+    def map(self, function):
+        """
+        Apply a text transformation, e.g. PII masking, to every section.
+
+        Returns:
+            ParsedResume: A new resume whose lists are split from the transformed text.
+        """
+        more_blocks = {name: [function(block) for block in blocks] for name, blocks in self._more_blocks.items()}
+        return ParsedResume(**{name: function(getattr(self, name)) for name in SECTIONS}, more_blocks=more_blocks)
+
+    def blocks(self, name):
+        """Every block of a section in order of appearance; empty if the section was not found."""
+        text = getattr(self, name)
+        return ([] if text == NOT_FOUND else [text]) + self._more_blocks.get(name, [])
+
+    def sections(self):
+        """Section name mapped to its text, in display order."""
+        return {name: getattr(self, name) for name in SECTIONS}
+
+    def to_dict(self):
+        """The /get_parsed_data view: section name mapped to its text."""
+        return self.sections()
+
+    def key_fields(self):
+        """The /get_key_fields view: top certificates, key skills and top projects."""
+        return self._key_fields
+
+    def to_list(self):
+        """
+        Positional fields for compact serialization; inverse of `from_list`.
+
+        Only the section text is stored, then the skill list when it did not
+        come from splitting the text and the blocks after the first, each
+        omitted (or None) when absent; the entry lists are rebuilt on load,
+        which is cheaper than storing every entry twice.
+        """
+        values = [getattr(self, name) for name in SECTIONS]
+        if self._skills_given or self._more_blocks:
+            values.append(self.skill_list if self._skills_given else None)
+        if self._more_blocks:
+            values.append(self._more_blocks)
+        return values
+
+    @classmethod
+    def from_list(cls, values):
+        """Rebuild a resume from `to_list` output."""
+        sections, extra = values[:len(SECTIONS)], values[len(SECTIONS):]
+        skill_list = extra[0] if extra else None
+        more_blocks = extra[1] if len(extra) > 1 else None
+        return cls(*sections, skill_list=skill_list, more_blocks=more_blocks)
+
+    def __bool__(self):
+        return any(getattr(self, name) != NOT_FOUND for name in SECTIONS)
+
+    def __eq__(self, other):
+        return isinstance(other, ParsedResume) and self.sections() == other.sections() and (
+            self.skill_list == other.skill_list) and self._more_blocks == other._more_blocks
+
+    def __repr__(self):
+        found = [name for name in SECTIONS if getattr(self, name) != NOT_FOUND]
+        return f"ParsedResume(sections={found}, skills={len(self.skill_list)})"
@@ -0,0 +1,211 @@
+import io
+import math
+import os
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeout
+
+from work_pools import ProcessWorkerPool, TaskTimeout
+
+# Backends in order of preference; PyMuPDF extracts text an order of magnitude faster than PyPDF2
+BACKENDS = ["pymupdf", "pypdf2"]
+
+# Documents with at least this many pages are split across several worker processes
+PARALLEL_PAGE_THRESHOLD = int(os.environ.get("PDF_PARALLEL_PAGES", 16))
+# Seconds a single document may spend in extraction before it is abandoned
+EXTRACT_TIMEOUT = float(os.environ.get("PDF_EXTRACT_TIMEOUT", 30))
+# Number of extraction worker processes
+PDF_WORKERS = int(os.environ.get("PDF_WORKERS", os.cpu_count() or 1))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class ExtractionTimeout(Exception):
+    """Raised when text extraction for a document exceeds its time budget."""
+
+
+def available_backends():
+    """
+    List the installed PDF backends in order of preference.
+
+    Returns:
+        list: Backend names such as "pymupdf" and "pypdf2".
+    """
+    found = []
+    for backend in BACKENDS:
+        try:
+            if backend == "pymupdf":
+                import fitz  # noqa: F401
+            else:
+                import PyPDF2  # noqa: F401
+        except ImportError:
+            continue
+        found.append(backend)
+    return found
+
+
+def select_backend(preferred="auto"):
+    """
+    Pick the backend to use, honouring `PDF_BACKEND` when set.
+
+    Args:
+        preferred (str): "auto" for the fastest installed backend, or a backend name.
+
+    Returns:
+        str: The backend name.
+    """
+    preferred = os.environ.get("PDF_BACKEND", preferred) if preferred == "auto" else preferred
+    installed = available_backends()
+    if not installed:
+        raise RuntimeError("No PDF backend installed; install PyMuPDF or PyPDF2.")
+    if preferred == "auto":
+        return installed[0]
+    if preferred not in installed:
+        raise RuntimeError(f"PDF backend '{preferred}' is not installed.")
+    return preferred
+
+
+def _open(source, backend):
+    """Open a document from a path or bytes with the given backend."""
+    if backend == "pymupdf":
+        import fitz
+        if isinstance(source, bytes):
+            return fitz.open(stream=source, filetype="pdf")
+        return fitz.open(source)
+    import PyPDF2
+    if isinstance(source, bytes):
+        return PyPDF2.PdfReader(io.BytesIO(source))
+    return PyPDF2.PdfReader(source)
+
+
+def _page_count(document, backend):
+    return len(document) if backend == "pymupdf" else len(document.pages)
+
+
+def _page_texts(document, backend, start, stop):
+    """Extract the text of pages [start, stop) from an open document."""
+    if backend == "pymupdf":
+        return [document.load_page(page_num).get_text() for page_num in range(start, stop)]
+    return [document.pages[page_num].extract_text() or "" for page_num in range(start, stop)]
+
+
+def _extract_range(source, backend, start, stop):
+    """Worker entry point: open the document and extract a range of pages."""
+    document = _open(source, backend)
+    try:
+        if stop is None:
+            stop = _page_count(document, backend)
+        return _page_texts(document, backend, start, stop)
+    finally:
+        if backend == "pymupdf":
+            document.close()
+
+
+def _extract_or_count(source, backend):
+    """
+    Worker entry point: extract a short document whole, or count the pages of a long one.
+
+    Returns:
+        list or int: Page texts, or the page count when the document should be split.
+    """
+    document = _open(source, backend)
+    try:
+        page_count = _page_count(document, backend)
+        if page_count < PARALLEL_PAGE_THRESHOLD:
+            return _page_texts(document, backend, 0, page_count)
+        return page_count
+    finally:
+        if backend == "pymupdf":
+            document.close()
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessWorkerPool(PDF_WORKERS, name="pdf-extract")
+        return _pool
+
+
+def _as_source(source):
+    """Normalise a path, bytes or binary stream into something picklable for workers."""
+    if isinstance(source, (str, bytes)):
+        return source
+    if isinstance(source, os.PathLike):
+        return os.fspath(source)
+    return source.read()
+
+
+def extract_pages(source, backend="auto", timeout=EXTRACT_TIMEOUT, parallel=True):
+    """
+    Extract the text of every page of a PDF.
+
+    With `parallel` set, work runs in a shared process pool so the calling
+    thread only waits. Opening the document and counting its pages happen in
+    the pool too, and everything counts against `timeout`: once it expires,
+    only this document's tasks are cancelled and their workers replaced, so
+    other documents in flight are unaffected. Documents with many pages are
+    split into page ranges processed concurrently.
+
+    Args:
+        source: Path to a PDF, its bytes, or a binary file-like object.
+        backend (str): "auto", "pymupdf" or "pypdf2".
+        timeout (float): Seconds allowed for the whole document when running in parallel.
+        parallel (bool): Use the process pool; set to False inside worker processes.
+
+    Returns:
+        list: Text of each page in order.
+
+    Raises:
+        ExtractionTimeout: If extraction takes longer than `timeout`.
+    """
+    backend = select_backend(backend)
+    source = _as_source(source)
+    if not parallel:
+        return _extract_range(source, backend, 0, None)
+
+    pool = _get_pool()
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    def remaining():
+        return None if deadline is None else max(deadline - time.monotonic(), 0)
+
+    futures = [pool.submit(_extract_or_count, source, backend, timeout=timeout)]
+    try:
+        # Short documents come back whole; long ones report their page count to be split
+        outcome = futures[0].result(timeout=remaining())
+        if not isinstance(outcome, int):
+            return outcome
+
+        page_count = outcome
+        tasks = min(PDF_WORKERS, math.ceil(page_count / (PARALLEL_PAGE_THRESHOLD / 2)))
+        step = math.ceil(page_count / tasks)
+        futures = [
+            pool.submit(_extract_range, source, backend, start, min(start + step, page_count), timeout=remaining())
+            for start in range(0, page_count, step)
+        ]
+        pages = []
+        for future in futures:
+            pages.extend(future.result(timeout=remaining()))
+        return pages
+    except (FutureTimeout, TaskTimeout):
+        pool.cancel(futures)
+        raise ExtractionTimeout(f"PDF text extraction exceeded {timeout} seconds.") from None
+
+
+def extract_text(source, backend="auto", timeout=EXTRACT_TIMEOUT, parallel=True):
+    """
+    Extract the full text of a PDF.
+
+    Args:
+        source: Path to a PDF, its bytes, or a binary file-like object.
+        backend (str): "auto", "pymupdf" or "pypdf2".
+        timeout (float): Seconds allowed for the whole document when running in parallel.
+        parallel (bool): Use the process pool; set to False inside worker processes.
+
+    Returns:
+        str: The text of all pages joined in order.
+    """
+    # One join instead of repeated += keeps this linear in the document size
+    return "".join(extract_pages(source, backend=backend, timeout=timeout, parallel=parallel))
@@ -0,0 +1,200 @@
+import re
+
+# Date formats accepted after a date-of-birth label
+_DATE = (
+    r"(?:\d{1,2}[/.\-]\d{1,2}[/.\-]\d{2,4}"
+    r"|\d{4}-\d{2}-\d{2}"
+    r"|\d{1,2}(?:st|nd|rd|th)?\s+[A-Za-z]{3,9},?\s+\d{4}"
+    r"|[A-Za-z]{3,9}\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4})"
+)
+
+_STREET_SUFFIX = (
+    r"(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Way|Place|Pl|"
+    r"Terrace|Highway|Hwy|Nagar|Colony|Marg)"
+)
+
+# Detectors in priority order: entity type, pattern, replacement.
+# The scanner is case-sensitive; (?i:...) marks the parts that are not, which
+# keeps character-class matching fast on the common path.
+DETECTORS = [
+    ("EMAIL", r"(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", "[EMAIL REDACTED]"),
+    ("URL", r"(?i:https?://|www\.)[^\s<>\"']+"
+            r"|(?<![a-zA-Z0-9@.-])(?:[a-zA-Z0-9-]+\.)+(?i:com|org|net|io|dev|in|co|me|ai|app|edu|gov|uk|info)"
+            r"/[^\s<>\"']*",
+     "[LINK REDACTED]"),
+    ("IBAN", r"(?<![\w])[A-Z]{2}\d{2}(?: ?[A-Z0-9]{4}){2,7}(?: ?[A-Z0-9]{1,3})?(?![\w])", "[IBAN REDACTED]"),
+    ("NATIONAL_ID", r"(?<![\w-])(?:\d{3}-\d{2}-\d{4}"                 # US SSN
+                    r"|[2-9]\d{3} \d{4} \d{4}"                        # Indian Aadhaar
+                    r"|[A-Z]{5}\d{4}[A-Z]"                             # Indian PAN
+                    r"|[A-CEGHJ-PR-TW-Z]{2} ?\d{2} ?\d{2} ?\d{2} ?[A-D])"  # UK National Insurance
+                    r"(?![\w-])", "[ID REDACTED]"),
+    ("DOB", rf"(?i:\bd\.?o\.?b\.?|\bdate\s+of\s+birth|\bborn(?:\s+on)?)\s*[:\-]?\s*{_DATE}", "[DOB REDACTED]"),
+    ("ADDRESS", rf"(?i:\baddress)\s*[:\-][^\n]+"
+                rf"|(?<!\w)\d{{1,5}}(?:[ \t]+[A-Z][a-z]+){{1,4}}[ \t]+{_STREET_SUFFIX}\b\.?", "[ADDRESS REDACTED]"),
+    ("PHONE", r"(?<![\w+])(?:\+?\d{1,3}[ .-]?)?(?:\d{10}|\(?\d{3}\)?[ .-]\d{3}[ .-]\d{4}|\d{5}[ -]\d{5})(?!\w)",
+     "[PHONE REDACTED]"),
+]
+
+
+def iban_checksum_ok(candidate):
+    """
+    Validate an IBAN with the ISO 13616 mod-97 check.
+
+    Args:
+        candidate (str): IBAN, possibly containing spaces.
+
+    Returns:
+        bool: True if the checksum is valid.
+    """
+    compact = candidate.replace(" ", "")
+    rearranged = compact[4:] + compact[:4]
+    digits = "".join(str(int(char, 36)) for char in rearranged)
+    return int(digits) % 97 == 1
+
+
+# Optional validators that reject false positives after a pattern matched
+VALIDATORS = {"IBAN": iban_checksum_ok}
+
+# Every default detector needs one of these on the line where its match ends;
+# lines without any are copied through without running the full scanner
+TRIGGER = r"[@/\d]|(?i:www\.|address)"
+
+
+class PIIRedactor:
+    """
+    Single-pass PII scanner with entity reporting.
+
+    All detectors are merged into one precompiled regex of named groups, so the
+    text is scanned once regardless of how many entity types are enabled.
+    Findings record the entity type and offsets only, never the matched value,
+    so they are safe to keep for auditing.
+
+    A cheap trigger regex first locates candidate lines; only those (plus the
+    line before each, for labels such as "Date of Birth:" on their own line)
+    go through the full scanner.
+
+    Args:
+        detectors (list): (entity type, pattern, replacement) tuples in priority order;
+                          every pattern must start at a word start.
+        validators (dict): Entity type mapped to a callable accepting the matched text.
+        trigger (str): Pattern present on every line where an entity can end; None scans all text.
+    """
+
+    def __init__(self, detectors=None, validators=None, trigger=TRIGGER):
+        detectors = DETECTORS if detectors is None else detectors
+        self.validators = VALIDATORS if validators is None else validators
+        self._trigger = re.compile(trigger) if trigger else None
+        self._replacements = {}
+        groups = []
+        for index, (entity, pattern, replacement) in enumerate(detectors):
+            group = f"g{index}"
+            self._replacements[group] = (entity, replacement)
+            groups.append(f"(?P<{group}>{pattern})")
+        # Every entity starts at a word start, so one shared guard rejects the
+        # positions inside words before any detector is tried
+        self._regex = re.compile(r"(?<!\w)(?:" + "|".join(groups) + ")")
+
+    def _candidate_regions(self, text):
+        """Yield merged (start, end) line ranges that may contain an entity."""
+        if self._trigger is None:
+            yield 0, len(text)
+            return
+        region = None
+        position = 0
+        while True:
+            trigger = self._trigger.search(text, position)
+            if trigger is None:
+                break
+            line_start = text.rfind("\n", 0, trigger.start()) + 1
+            start = text.rfind("\n", 0, line_start - 1) + 1 if line_start else 0
+            end = text.find("\n", trigger.end())
+            end = len(text) if end == -1 else end + 1
+            if region is not None and start <= region[1]:
+                region = (region[0], end)
+            else:
+                if region is not None:
+                    yield region
+                region = (start, end)
+            position = end
+        if region is not None:
+            yield region
+
+    def _scan(self, text, offset, findings):
+        """Replace every entity in `text`, appending findings shifted by `offset`."""
+        parts = []
+        last = 0
+        for region_start, region_end in self._candidate_regions(text):
+            for match in self._regex.finditer(text, region_start, region_end):
+                entity, replacement = self._replacements[match.lastgroup]
+                validator = self.validators.get(entity)
+                if validator is not None and not validator(match.group()):
+                    continue
+                start, end = match.span()
+                parts.append(text[last:start])
+                parts.append(replacement)
+                last = end
+                findings.append({"type": entity, "start": start + offset, "end": end + offset})
+        parts.append(text[last:])
+        return "".join(parts)
+
+    def redact(self, text):
+        """
+        Mask PII in the text and report what was found.
+
+        Args:
+            text (str): Input text.
+
+        Returns:
+            tuple: The masked text and a list of {"type", "start", "end"} findings
+                   with offsets into the original text.
+        """
+        findings = []
+        return self._scan(text, 0, findings), findings
+
+    def mask(self, text):
+        """
+        Mask PII in the text.
+
+        Args:
+            text (str): Input text.
+
+        Returns:
+            str: Text with every detected entity replaced.
+        """
+        return self._scan(text, 0, [])
+
+    def redact_stream(self, chunks, max_carry=4096):
+        """
+        Mask an iterable of text chunks (e.g. PDF pages) with bounded memory.
+
+        The trailing partial line of each chunk is carried into the next one so
+        entities split across a page boundary are still detected.
+
+        Args:
+            chunks (iterable): Text chunks in document order.
+            max_carry (int): Longest partial line held back between chunks.
+
+        Yields:
+            tuple: Masked text and its findings, with offsets into the concatenated input.
+        """
+        carry = ""
+        offset = 0
+        for chunk in chunks:
+            buffer = carry + chunk
+            cut = buffer.rfind("\n") + 1
+            if cut == 0:
+                if len(buffer) < max_carry:
+                    carry = buffer
+                    continue
+                cut = len(buffer)
+            findings = []
+            yield self._scan(buffer[:cut], offset, findings), findings
+            offset += cut
+            carry = buffer[cut:]
+        if carry:
+            findings = []
+            yield self._scan(carry, offset, findings), findings
+
+
+# Shared instance compiled once at import
+default_redactor = PIIRedactor()
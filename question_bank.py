@@ -0,0 +1,215 @@
+import json
+import os
+import threading
+import time
+
+# Question files merged into the bank, in priority order (earlier files win on duplicate questions)
+QUESTION_FILES = ["questions.json", "data.json"]
+# Seconds between checks of the question files' modification times
+RELOAD_INTERVAL = float(os.environ.get("QUESTION_BANK_RELOAD_INTERVAL", 2))
+
+# Extra names under which a question-bank skill is found; keys are also found by
+# their own name with "_" read as a space (e.g. "machine learning")
+SKILL_ALIASES = {
+    "html_css": ["html", "css", "html5", "css3", "html/css", "html & css", "html and css"],
+    "javascript": ["js", "ecmascript"],
+    "machine_learning": ["ml"],
+    "data_science": ["data analysis", "data analytics"],
+    "sql": ["mysql", "postgresql", "sqlite"],
+}
+
+
+def normalize_skill(skill):
+    """
+    Normalise a skill name for lookup: lowercase, with underscores and runs of whitespace as single spaces.
+
+    Args:
+        skill (str): Skill name as written in a resume or question file.
+
+    Returns:
+        str: The lookup key.
+    """
+    return " ".join(skill.lower().replace("_", " ").split())
+
+
+def normalize_question(question):
+    """
+    Bring a question entry to the common schema.
+
+    questions.json stores answers under "expected_answer" while data.json uses "answer".
+
+    Args:
+        question (dict): Question entry from a question file.
+
+    Returns:
+        dict: {"question", "expected_answer"} plus any other fields of the entry.
+    """
+    normalized = {key: value for key, value in question.items() if key != "answer"}
+    normalized["expected_answer"] = question.get("expected_answer") or question.get("answer", "")
+    return normalized
+
+
+class QuestionBank:
+    """
+    Interview questions loaded once and indexed by skill and alias.
+
+    Lookups are dictionary reads. The source files are re-read only when their
+    modification time changes, checked at most every `reload_interval` seconds.
+
+    Args:
+        paths (list): Question files mapping skills to lists of question dictionaries.
+        aliases (dict): Question-bank skill mapped to extra names that should find it.
+        reload_interval (float): Minimum seconds between modification-time checks; None disables hot reload.
+    """
+
+    def __init__(self, paths=QUESTION_FILES, aliases=None, reload_interval=RELOAD_INTERVAL):
+        self.paths = list(paths)
+        self.aliases = SKILL_ALIASES if aliases is None else aliases
+        self.reload_interval = reload_interval
+        self._questions = {}  # skill -> list of normalized questions
+        self._index = {}  # normalized skill or alias -> skill
+        self._mtimes = {}
+        self._checked_at = 0.0
+        self._reload_hooks = []
+        self._lock = threading.Lock()
+        self.reload()
+
+    def _file_mtimes(self):
+        mtimes = {}
+        for path in self.paths:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[path] = None
+        return mtimes
+
+    def _load(self):
+        """Read and merge the question files."""
+        questions = {}
+        for path in self.paths:
+            try:
+                with open(path, "r") as file:
+                    data = json.load(file)
+            except FileNotFoundError:
+                print(f"Error: '{path}' not found.")
+                continue
+            except json.JSONDecodeError as e:
+                print(f"Error: Failed to decode '{path}' - {e}")
+                continue
+            for skill, entries in data.items():
+                merged = questions.setdefault(skill.lower(), [])
+                seen = {entry["question"] for entry in merged}
+                for entry in entries:
+                    entry = normalize_question(entry)
+                    if entry.get("question") and entry["question"] not in seen:
+                        seen.add(entry["question"])
+                        merged.append(entry)
+        return questions
+
+    def _build_index(self, questions):
+        index = {}
+        for skill, names in self.aliases.items():
+            if skill in questions:
+                for name in names:
+                    index[normalize_skill(name)] = skill
+        # A skill's own name takes precedence over another skill's alias
+        for skill in questions:
+            index[skill] = skill
+            index[normalize_skill(skill)] = skill
+        return index
+
+    def reload(self):
+        """Re-read the question files and rebuild the index, then run the reload hooks."""
+        with self._lock:
+            mtimes = self._file_mtimes()
+            questions = self._load()
+            # Swapped in whole, so concurrent lookups see either the old or the new bank
+            self._questions, self._index = questions, self._build_index(questions)
+            self._mtimes = mtimes
+            self._checked_at = time.monotonic()
+            hooks = list(self._reload_hooks)
+        for hook in hooks:
+            hook(self)
+
+    def add_reload_hook(self, hook):
+        """
+        Register a callback run with the bank after every (re)load, e.g. to precompute answers.
+
+        Args:
+            hook (callable): Function accepting the QuestionBank.
+        """
+        self._reload_hooks.append(hook)
+        hook(self)
+
+    def _maybe_reload(self):
+        if self.reload_interval is None:
+            return
+        now = time.monotonic()
+        if now - self._checked_at < self.reload_interval:
+            return
+        self._checked_at = now
+        if self._file_mtimes() != self._mtimes:
+            self.reload()
+
+    def resolve(self, skill):
+        """
+        Map a skill name or alias to its question-bank skill.
+
+        Args:
+            skill (str): Skill name, e.g. "HTML", "Machine Learning" or "python".
+
+        Returns:
+            str: The question-bank skill (e.g. "html_css"), or None if it has no questions.
+        """
+        self._maybe_reload()
+        return self._index.get(normalize_skill(skill))
+
+    def get(self, skill):
+        """
+        Return the questions for a skill name or alias.
+
+        Args:
+            skill (str): Skill name or alias.
+
+        Returns:
+            list: Questions with "question" and "expected_answer" keys; empty if the skill is unknown.
+                  The list is shared, so callers must not modify it.
+        """
+        resolved = self.resolve(skill)
+        return self._questions.get(resolved, []) if resolved else []
+
+    def skills(self):
+        """Return the question-bank skills."""
+        self._maybe_reload()
+        return list(self._questions)
+
+    def expected_answers(self):
+        """Yield every expected answer in the bank."""
+        for questions in self._questions.values():
+            for question in questions:
+                yield question["expected_answer"]
+
+    def __contains__(self, skill):
+        return self.resolve(skill) is not None
+
+    def __len__(self):
+        return sum(len(questions) for questions in self._questions.values())
+
+
+_default_bank = None
+_default_bank_lock = threading.Lock()
+
+
+def get_question_bank():
+    """
+    Return the process-wide question bank, loading it on first use.
+
+    Returns:
+        QuestionBank: The shared bank.
+    """
+    global _default_bank
+    if _default_bank is None:
+        with _default_bank_lock:
+            if _default_bank is None:
+                _default_bank = QuestionBank()
+    return _default_bank
@@ -0,0 +1,211 @@
+import os
+import random
+import threading
+
+# Most questions asked in one interview
+MAX_QUESTIONS = int(os.environ.get("MAX_INTERVIEW_QUESTIONS", 10))
+# Difficulty levels, easiest first
+LEVELS = ["easy", "medium", "hard"]
+# Level an interview starts at
+START_LEVEL = 1
+# Running-score bounds (0-10 scale) below which the level drops and from which it rises
+LOWER_SCORE = 4.0
+UPPER_SCORE = 7.0
+# Weight of the latest answer in the running score
+SCORE_WEIGHT = 0.5
+
+
+def fallback_question(skill):
+    """Generic question for a skill without predefined questions."""
+    return {
+        "question": f"Can you explain your experience with {skill}?",
+        "expected_answer": f"Experience with {skill}",
+    }
+
+
+def assign_levels(questions):
+    """
+    Place each question of a skill in a difficulty level.
+
+    An explicit "difficulty" field ("easy", "medium", "hard" or 0-2) wins;
+    otherwise questions are split into terciles by expected-answer length,
+    longer answers counting as harder.
+
+    Args:
+        questions (list): Questions of one skill.
+
+    Returns:
+        list: One list of question indexes per level.
+    """
+    buckets = [[] for _ in LEVELS]
+    unrated = []
+    for index, question in enumerate(questions):
+        difficulty = question.get("difficulty")
+        if difficulty in LEVELS:
+            buckets[LEVELS.index(difficulty)].append(index)
+        elif isinstance(difficulty, int) and 0 <= difficulty < len(LEVELS):
+            buckets[difficulty].append(index)
+        else:
+            unrated.append(index)
+    unrated.sort(key=lambda index: len(questions[index]["expected_answer"].split()))
+    for position, index in enumerate(unrated):
+        buckets[position * len(LEVELS) // len(unrated)].append(index)
+    return buckets
+
+
+class QuestionScheduler:
+    """
+    Chooses interview questions one at a time from the question bank.
+
+    Interviews are bounded to `max_questions` and visit the candidate's skills
+    round-robin, so every skill gets a fair share. Each answer updates a running
+    score that moves the interview between easy, medium and hard questions.
+
+    Plans are precomputed whenever the bank (re)loads: every skill's questions
+    are bucketed by difficulty and shuffled once. Each bucket has a process-wide
+    cursor that rotates through it, so consecutive interviews get different
+    questions and picking one costs O(1) regardless of the bank's size.
+
+    The per-interview schedule is a plain JSON-serializable dict kept in the
+    session state.
+
+    Args:
+        bank (QuestionBank): Source of questions.
+        max_questions (int): Most questions asked in one interview.
+        seed (int): Seed of the shuffles, for reproducible plans.
+    """
+
+    def __init__(self, bank, max_questions=MAX_QUESTIONS, seed=None):
+        self.bank = bank
+        self.max_questions = max_questions
+        self._random = random.Random(seed)
+        self._plans = {}  # skill -> (questions, [shuffled indexes per level])
+        self._cursors = {}  # (skill, level) -> next position in the shuffled bucket
+        self._lock = threading.Lock()
+        bank.add_reload_hook(self._build_plans)
+
+    def _build_plans(self, bank):
+        plans = {}
+        cursors = {}
+        for skill in bank.skills():
+            questions = bank.get(skill)
+            buckets = assign_levels(questions)
+            for level, bucket in enumerate(buckets):
+                self._random.shuffle(bucket)
+                # Random start so processes serving the same bank do not ask in lockstep
+                cursors[(skill, level)] = self._random.randrange(len(bucket)) if bucket else 0
+            plans[skill] = (questions, buckets)
+        with self._lock:
+            self._plans, self._cursors = plans, cursors
+
+    def start(self, skills):
+        """
+        Plan an interview for a candidate's skills.
+
+        Args:
+            skills (list): Skill names from the resume; aliases of the same bank skill count once.
+
+        Returns:
+            dict: The schedule, or None if there is nothing to ask.
+        """
+        bank_skills = []
+        other_skills = []
+        for skill in skills:
+            skill = skill.strip()
+            if not skill:
+                continue
+            bank_skill = self.bank.resolve(skill)
+            if bank_skill is None:
+                if skill not in other_skills:
+                    other_skills.append(skill)
+            elif bank_skill in self._plans and bank_skill not in bank_skills:
+                bank_skills.append(bank_skill)
+        # Skills with predefined questions come first; the rest get one generic question each
+        order = bank_skills + other_skills
+        available = sum(len(self._plans[skill][0]) for skill in bank_skills) + len(other_skills)
+        total = min(self.max_questions, available)
+        if total == 0:
+            return None
+        return {
+            "skills": order,
+            "bank_skills": len(bank_skills),
+            "next_skill": 0,
+            "total": total,
+            "level": START_LEVEL,
+            "running_score": None,
+            "asked": [],
+        }
+
+    def _pick(self, skill, level, asked):
+        """Take the next unasked question of a skill, starting at `level` and moving outwards."""
+        questions, buckets = self._plans[skill]
+        for candidate in sorted(range(len(LEVELS)), key=lambda other: (abs(other - level), -other)):
+            bucket = buckets[candidate]
+            if not bucket:
+                continue
+            with self._lock:
+                start = self._cursors.get((skill, candidate), 0)
+                # Only this interview's questions are skipped, so the scan is bounded by max_questions
+                for step in range(len(bucket)):
+                    position = (start + step) % len(bucket)
+                    question = questions[bucket[position]]
+                    if question["question"] not in asked:
+                        self._cursors[(skill, candidate)] = position + 1
+                        return question, candidate
+        return None, None
+
+    def next_question(self, schedule):
+        """
+        Choose the next question and record it in the schedule.
+
+        Args:
+            schedule (dict): Schedule returned by `start`.
+
+        Returns:
+            dict: Question with "question", "expected_answer", "skill" and "difficulty", or None when done.
+        """
+        if len(schedule["asked"]) >= schedule["total"]:
+            return None
+        asked = set(schedule["asked"])
+        skills = schedule["skills"]
+        for step in range(len(skills)):
+            position = (schedule["next_skill"] + step) % len(skills)
+            skill = skills[position]
+            if position >= schedule["bank_skills"]:
+                question = fallback_question(skill)
+                if question["question"] in asked:
+                    continue
+                difficulty = None
+            else:
+                if skill not in self._plans:
+                    # Removed from the bank by a reload
+                    continue
+                question, level = self._pick(skill, schedule["level"], asked)
+                if question is None:
+                    continue
+                difficulty = LEVELS[level]
+            schedule["next_skill"] = position + 1
+            schedule["asked"].append(question["question"])
+            return {
+                "question": question["question"],
+                "expected_answer": question["expected_answer"],
+                "skill": skill,
+                "difficulty": difficulty,
+            }
+        return None
+
+    def record_score(self, schedule, score):
+        """
+        Update the running score with an answer's score and adapt the difficulty level.
+
+        Args:
+            schedule (dict): Schedule returned by `start`.
+            score (float): Score of the latest answer, 0-10.
+        """
+        running = schedule["running_score"]
+        running = score if running is None else SCORE_WEIGHT * score + (1 - SCORE_WEIGHT) * running
+        schedule["running_score"] = round(running, 2)
+        if running >= UPPER_SCORE:
+            schedule["level"] = min(schedule["level"] + 1, len(LEVELS) - 1)
+        elif running < LOWER_SCORE:
+            schedule["level"] = max(schedule["level"] - 1, 0)
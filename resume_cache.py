@@ -0,0 +1,174 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from serialization import dumps, loads
+
+# Namespaces for the two kinds of cached results
+PARSED = "parsed"
+SUMMARY = "summary"
+
+
+def sha256_bytes(data):
+    """Return the hex SHA-256 digest of a bytes object."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_text(text):
+    """Return the hex SHA-256 digest of a string encoded as UTF-8."""
+    return sha256_bytes(text.encode("utf-8"))
+
+
+class ResumeCache:
+    """
+    Content-addressed LRU cache for parsed resume sections and summaries.
+
+    Entries are keyed by the SHA-256 of their input, so the same resume or text
+    never reaches the parser or the model twice. Only derived data is stored,
+    never the uploaded file itself: parsed sections must be masked before they
+    are cached, since with `persist_dir` they are written to disk as they are.
+
+    Args:
+        max_bytes (int): Upper bound on the serialised size of the in-memory entries.
+        persist_dir (str): Optional directory where entries are also written as files.
+    """
+
+    def __init__(self, max_bytes=32 * 1024 * 1024, persist_dir=None):
+        self.max_bytes = max_bytes
+        self.persist_dir = persist_dir
+        self._entries = OrderedDict()  # (namespace, key) -> serialised value
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if persist_dir:
+            os.makedirs(persist_dir, exist_ok=True)
+            self._remove_legacy_entries()
+
+    def _remove_legacy_entries(self):
+        """Delete .json entries left by earlier versions, which cached parsed sections unmasked."""
+        for name in os.listdir(self.persist_dir):
+            if name.endswith(".json") and name.startswith((f"{PARSED}-", f"{SUMMARY}-")):
+                try:
+                    os.remove(os.path.join(self.persist_dir, name))
+                except FileNotFoundError:  # Removed by another worker
+                    pass
+
+    def _disk_path(self, namespace, key):
+        return os.path.join(self.persist_dir, f"{namespace}-{key}.bin")
+
+    def get(self, namespace, key):
+        """
+        Look up a cached value.
+
+        Args:
+            namespace (str): PARSED or SUMMARY.
+            key (str): SHA-256 hex digest of the input.
+
+        Returns:
+            object: The cached value, or None on a miss.
+        """
+        with self._lock:
+            payload = self._entries.get((namespace, key))
+            if payload is not None:
+                self._entries.move_to_end((namespace, key))
+                self.hits += 1
+                return loads(payload)
+
+        if self.persist_dir:
+            try:
+                with open(self._disk_path(namespace, key), "rb") as file:
+                    payload = file.read()
+            except FileNotFoundError:
+                payload = None
+            if payload is not None:
+                with self._lock:
+                    self.hits += 1
+                    self._store(namespace, key, payload)
+                return loads(payload)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, namespace, key, value):
+        """
+        Cache a value.
+
+        Args:
+            namespace (str): PARSED or SUMMARY.
+            key (str): SHA-256 hex digest of the input.
+            value (object): Derived data: a ParsedResume, a summary string or other JSON-compatible data.
+        """
+        payload = dumps(value)
+        with self._lock:
+            self._store(namespace, key, payload)
+        if self.persist_dir:
+            # Write then rename so concurrent readers never see a partial file
+            path = self._disk_path(namespace, key)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as file:
+                file.write(payload)
+            os.replace(tmp_path, path)
+
+    def delete(self, namespace, key):
+        """
+        Remove a cached value from memory and disk.
+
+        Args:
+            namespace (str): PARSED or SUMMARY.
+            key (str): SHA-256 hex digest of the input.
+        """
+        with self._lock:
+            payload = self._entries.pop((namespace, key), None)
+            if payload is not None:
+                self._size -= len(payload)
+        if self.persist_dir:
+            try:
+                os.remove(self._disk_path(namespace, key))
+            except FileNotFoundError:
+                pass
+
+    def evict(self, namespace, key):
+        """Drop a value from this process's memory only, leaving any persisted copy."""
+        with self._lock:
+            payload = self._entries.pop((namespace, key), None)
+            if payload is not None:
+                self._size -= len(payload)
+
+    def keys(self):
+        """Return the (namespace, key) pairs held in memory, least recently used first."""
+        with self._lock:
+            return list(self._entries)
+
+    def stats(self):
+        """Return entry count, memory size and hit/miss counters."""
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._size, "hits": self.hits, "misses": self.misses}
+
+    def _store(self, namespace, key, payload):
+        """Insert an entry and evict least recently used ones; caller holds the lock."""
+        previous = self._entries.pop((namespace, key), None)
+        if previous is not None:
+            self._size -= len(previous)
+        if len(payload) > self.max_bytes:
+            return
+        self._entries[(namespace, key)] = payload
+        self._size += len(payload)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+
+def create_resume_cache():
+    """
+    Create the cache configured by `RESUME_CACHE_MAX_BYTES` and `RESUME_CACHE_DIR`.
+
+    Returns:
+        ResumeCache: The configured cache; persistence is disabled unless a directory is set.
+    """
+    return ResumeCache(
+        max_bytes=int(os.environ.get("RESUME_CACHE_MAX_BYTES", 32 * 1024 * 1024)),
+        persist_dir=os.environ.get("RESUME_CACHE_DIR") or None,
+    )
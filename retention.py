@@ -0,0 +1,422 @@
+import os
+import sqlite3
+import threading
+import time
+
+from privacy import DecryptionError, reencrypt_file
+
+# Artifact kinds tracked by the index
+FILE = "file"
+CACHE = "cache"
+
+
+def secure_delete(path, overwrite=True, chunk_size=1 << 16):
+    """
+    Overwrite a file with zeros, flush it to disk and remove it.
+
+    Overwriting is best effort: copy-on-write and journaling filesystems or SSD
+    wear levelling may keep old blocks, so stored files are encrypted anyway.
+
+    Args:
+        path (str): File to delete.
+        overwrite (bool): Zero the contents before unlinking.
+        chunk_size (int): Bytes written per step.
+
+    Returns:
+        int: Bytes reclaimed, or 0 if the file was already gone.
+    """
+    try:
+        size = os.path.getsize(path)
+        if overwrite and size:
+            zeros = bytes(chunk_size)
+            with open(path, "r+b") as file:
+                for offset in range(0, size, chunk_size):
+                    file.write(zeros[:min(chunk_size, size - offset)])
+                file.flush()
+                os.fsync(file.fileno())
+        os.remove(path)
+    except FileNotFoundError:
+        return 0
+    return size
+
+
+class RetentionIndex:
+    """
+    SQLite index of the artifacts each session leaves behind.
+
+    Every stored upload and cache entry is recorded with its owner and expiry
+    time, so expired artifacts are found with an index lookup instead of a
+    directory scan. Shared by all worker processes through the database file.
+
+    Args:
+        path (str): Path to the SQLite database file, or ":memory:" for a per-process index.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()  # One connection per thread
+        # Threads share one in-memory database through a named shared-cache URI,
+        # which lives as long as a connection to it is open
+        self._memory_uri = f"file:retention-{id(self)}?mode=memory&cache=shared" if path == ":memory:" else None
+        self._keepalive = self._connect()
+        with self._keepalive as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS artifacts ("
+                "id INTEGER PRIMARY KEY, session_id TEXT NOT NULL, kind TEXT NOT NULL, "
+                "location TEXT NOT NULL, size INTEGER NOT NULL, expires_at REAL NOT NULL, "
+                "UNIQUE (session_id, kind, location))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS artifacts_expiry ON artifacts (expires_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS artifacts_location ON artifacts (location)")
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self._memory_uri:
+                conn = sqlite3.connect(self._memory_uri, uri=True, timeout=30, isolation_level=None)
+            else:
+                conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            # WAL lets readers proceed while another process writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def add(self, session_id, kind, location, size, expires_at):
+        """
+        Record an artifact, or push back the expiry of one already recorded.
+
+        Args:
+            session_id (str): Owning session.
+            kind (str): FILE or CACHE.
+            location (str): File path, or "namespace:key" for cache entries.
+            size (int): Size in bytes at the time it was recorded.
+            expires_at (float): Unix time after which the artifact is purged.
+        """
+        self._connect().execute(
+            "INSERT INTO artifacts (session_id, kind, location, size, expires_at) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (session_id, kind, location) DO UPDATE SET size = excluded.size, "
+            "expires_at = MAX(expires_at, excluded.expires_at)",
+            (session_id, kind, location, size, expires_at),
+        )
+
+    def locations(self, kind):
+        """Return the set of locations of the given kind that any session has recorded."""
+        rows = self._connect().execute("SELECT DISTINCT location FROM artifacts WHERE kind = ?", (kind,)).fetchall()
+        return {location for location, in rows}
+
+    def contains(self, location):
+        """Return True if any session has recorded the given location."""
+        row = self._connect().execute("SELECT 1 FROM artifacts WHERE location = ? LIMIT 1", (location,)).fetchone()
+        return row is not None
+
+    def claim_expired(self, now, limit):
+        """
+        Remove up to `limit` expired artifacts from the index and return them.
+
+        Selecting and deleting in one write transaction means concurrent
+        purgers in other processes never claim the same rows.
+
+        Returns:
+            list: (kind, location, size) tuples.
+        """
+        return self._claim("expires_at <= ? ORDER BY expires_at LIMIT ?", (now, limit))
+
+    def claim_session(self, session_id):
+        """Remove every artifact of a session from the index and return them; see `claim_expired`."""
+        return self._claim("session_id = ?", (session_id,))
+
+    def _claim(self, condition, params):
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(f"SELECT id, kind, location, size FROM artifacts WHERE {condition}", params).fetchall()
+            conn.executemany("DELETE FROM artifacts WHERE id = ?", [(row[0],) for row in rows])
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        # A location shared with another session is only purged once nobody references it
+        return [(kind, location, size) for _, kind, location, size in rows if not self.contains(location)]
+
+    def stats(self):
+        """Return artifact counts and recorded bytes by kind."""
+        rows = self._connect().execute("SELECT kind, COUNT(*), SUM(size) FROM artifacts GROUP BY kind").fetchall()
+        return {kind: {"artifacts": count, "bytes": total or 0} for kind, count, total in rows}
+
+
+class RetentionManager:
+    """
+    Expires session artifacts and purges them in batches.
+
+    Stored files are overwritten and removed; cache entries are deleted from
+    the resume cache. A background thread, started on first use, purges
+    expired artifacts every `interval` seconds.
+
+    The index is shared by every worker, but a purge only deletes cache entries
+    from the purging process's in-memory cache (and from disk, where a
+    persisted cache is shared). Each worker therefore also drops, on its own
+    purge tick, cached entries the index no longer lists, so copies held by
+    other workers are gone within `interval` seconds.
+
+    Args:
+        index (RetentionIndex): Where artifacts are recorded.
+        cache (ResumeCache): Cache whose entries are tracked.
+        ttl (float): Seconds an artifact is kept after it was last recorded.
+        interval (float): Seconds between background purge runs.
+        batch_size (int): Artifacts claimed per transaction.
+        overwrite (bool): Zero files before removing them.
+        directory (str): Upload directory whose untracked files are adopted when the purger starts.
+        key_ring (KeyRing): If given, tracked files under older keys are re-encrypted
+                            under its current key when the purger starts.
+        cipher (str): Cipher used for re-encrypted files.
+    """
+
+    def __init__(self, index, cache, ttl=3600, interval=60, batch_size=100, overwrite=True, directory=None,
+                 key_ring=None, cipher="aes-256-gcm"):
+        self.index = index
+        self.cache = cache
+        self.ttl = ttl
+        self.interval = interval
+        self.batch_size = batch_size
+        self.overwrite = overwrite
+        self.directory = directory
+        self.key_ring = key_ring
+        self.cipher = cipher
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._runs = 0
+        self._purged_files = 0
+        self._purged_cache_entries = 0
+        self._reclaimed_bytes = 0
+
+    def track_file(self, session_id, path):
+        """Record a stored file of a session."""
+        self._ensure_worker()
+        self.index.add(session_id, FILE, path, os.path.getsize(path), time.time() + self.ttl)
+
+    def track_cache(self, session_id, namespace, key):
+        """Record a cache entry derived from a session's resume."""
+        self._ensure_worker()
+        self.index.add(session_id, CACHE, f"{namespace}:{key}", 0, time.time() + self.ttl)
+
+    def drop_unlisted_cache(self):
+        """
+        Evict entries of this process's in-memory cache that the index no longer lists.
+
+        Catches up with purges run by other workers. An entry cached moments
+        before it is tracked may be evicted too, which only costs a cache miss.
+
+        Returns:
+            int: Number of entries evicted.
+        """
+        listed = self.index.locations(CACHE)
+        evicted = 0
+        for namespace, key in self.cache.keys():
+            if f"{namespace}:{key}" not in listed:
+                self.cache.evict(namespace, key)
+                evicted += 1
+        return evicted
+
+    def drop_untracked_cache(self, namespace, keys):
+        """
+        Delete cache entries that no session records, e.g. those a job derived for a session that has quit.
+
+        Returns:
+            int: Number of entries deleted.
+        """
+        dropped = 0
+        for key in keys:
+            if not self.index.contains(f"{namespace}:{key}"):
+                self.cache.delete(namespace, key)
+                dropped += 1
+        return dropped
+
+    def adopt_untracked(self, directory):
+        """
+        Give files under `directory` that the index does not know a TTL from their modification time.
+
+        Run once at startup so uploads left by earlier versions, crashes or a
+        lost index expire like everything else. Per-session subdirectories are
+        searched too.
+
+        Returns:
+            int: Number of files adopted.
+        """
+        adopted = 0
+        for root, _, names in os.walk(directory):
+            for name in names:
+                path = os.path.join(root, name)
+                if not self.index.contains(path):
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:  # Removed since the directory was listed
+                        continue
+                    self.index.add("", FILE, path, stat.st_size, stat.st_mtime + self.ttl)
+                    adopted += 1
+        return adopted
+
+    def reencrypt_stale(self):
+        """
+        Re-encrypt tracked files still under an older key, e.g. after a new key was appended to ENCRYPTION_KEYS.
+
+        Run once at startup. Files purged meanwhile are skipped, and a file
+        purged while it was being re-encrypted is removed again.
+
+        Returns:
+            int: Number of files re-encrypted.
+        """
+        if self.key_ring is None:
+            return 0
+        rotated = 0
+        for path in self.index.locations(FILE):
+            try:
+                if not reencrypt_file(path, self.key_ring, self.cipher):
+                    continue
+            except FileNotFoundError:  # Purged since the index was read
+                continue
+            except DecryptionError as e:
+                print(f"Error re-encrypting {path}: {e}")
+                continue
+            rotated += 1
+            if not self.index.contains(path):
+                secure_delete(path, self.overwrite)
+        return rotated
+
+    def _remove_empty_parent(self, path):
+        """Remove the per-session directory of a purged file once it is empty."""
+        parent = os.path.dirname(path)
+        if self.directory and os.path.dirname(parent) == self.directory:
+            try:
+                os.rmdir(parent)
+            except OSError:  # Still holds other uploads, or already gone
+                pass
+
+    def _purge(self, artifacts):
+        report = {"files": 0, "cache_entries": 0, "bytes_reclaimed": 0}
+        for kind, location, _ in artifacts:
+            if kind == FILE:
+                report["bytes_reclaimed"] += secure_delete(location, self.overwrite)
+                self._remove_empty_parent(location)
+                report["files"] += 1
+            else:
+                namespace, _, key = location.partition(":")
+                self.cache.delete(namespace, key)
+                report["cache_entries"] += 1
+        with self._stats_lock:
+            self._purged_files += report["files"]
+            self._purged_cache_entries += report["cache_entries"]
+            self._reclaimed_bytes += report["bytes_reclaimed"]
+        return report
+
+    def purge_session(self, session_id):
+        """
+        Purge every artifact of a session now, e.g. when the candidate quits.
+
+        Returns:
+            dict: Files removed, cache entries removed and bytes reclaimed.
+        """
+        return self._purge(self.index.claim_session(session_id))
+
+    def purge_expired(self, now=None):
+        """
+        Purge every expired artifact, one batch per transaction.
+
+        Returns:
+            dict: Files removed, cache entries removed and bytes reclaimed.
+        """
+        now = time.time() if now is None else now
+        total = {"files": 0, "cache_entries": 0, "bytes_reclaimed": 0}
+        while True:
+            batch = self.index.claim_expired(now, self.batch_size)
+            if not batch:
+                break
+            for name, value in self._purge(batch).items():
+                total[name] += value
+        with self._stats_lock:
+            self._runs += 1
+        return total
+
+    def stats(self):
+        """
+        Report what is tracked and what has been purged by this process.
+
+        Returns:
+            dict: Tracked artifacts by kind, purge runs, purged counts and reclaimed bytes.
+        """
+        with self._stats_lock:
+            purged = {
+                "runs": self._runs,
+                "files": self._purged_files,
+                "cache_entries": self._purged_cache_entries,
+                "bytes_reclaimed": self._reclaimed_bytes,
+            }
+        return {"tracked": self.index.stats(), "purged": purged}
+
+    def start(self):
+        """Start the background purger; idempotent, and tracking an artifact also starts it."""
+        self._ensure_worker()
+
+    def _ensure_worker(self):
+        # Started lazily so that a preloading master never forks with a live thread
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="retention", daemon=True)
+                self._worker.start()
+
+    def _run(self):
+        if self.directory:
+            try:
+                self.adopt_untracked(self.directory)
+            except OSError as e:
+                print(f"Error indexing {self.directory}: {e}")
+        try:
+            rotated = self.reencrypt_stale()
+            if rotated:
+                print(f"Retention: re-encrypted {rotated} files under the current key.")
+        except Exception as e:
+            print(f"Error re-encrypting stored files: {e}")
+        while True:
+            try:
+                report = self.purge_expired()
+                if report["files"] or report["cache_entries"]:
+                    print(f"Retention: purged {report['files']} files and {report['cache_entries']} cache "
+                          f"entries, reclaimed {report['bytes_reclaimed']} bytes.")
+                # Purges by other workers only reached their own in-memory caches
+                self.drop_unlisted_cache()
+            except Exception as e:
+                print(f"Error purging expired artifacts: {e}")
+            time.sleep(self.interval)
+
+
+def create_retention_manager(cache, directory=None, persist_index=True, key_ring=None, cipher="aes-256-gcm"):
+    """
+    Create a retention manager configured by `RETENTION_DB_PATH`, `RETENTION_TTL`,
+    `RETENTION_INTERVAL`, `RETENTION_BATCH_SIZE` and `RETENTION_SECURE_OVERWRITE`.
+
+    Args:
+        cache (ResumeCache): Cache whose entries are tracked.
+        directory (str): Upload directory adopted when the purger starts.
+        persist_index (bool): Keep the index in a file by default; when False it stays
+                              in memory unless `RETENTION_DB_PATH` is set.
+        key_ring (KeyRing): Key ring whose current key stored files are re-encrypted under at startup.
+        cipher (str): Cipher used for re-encrypted files.
+
+    Returns:
+        RetentionManager: The configured manager; call `start` to begin purging.
+    """
+    default_path = os.path.join(os.getcwd(), "retention.db") if persist_index else ":memory:"
+    path = os.environ.get("RETENTION_DB_PATH", default_path)
+    return RetentionManager(
+        RetentionIndex(path), cache,
+        ttl=float(os.environ.get("RETENTION_TTL", os.environ.get("SESSION_TTL", 3600))),
+        interval=float(os.environ.get("RETENTION_INTERVAL", 60)),
+        batch_size=int(os.environ.get("RETENTION_BATCH_SIZE", 100)),
+        overwrite=os.environ.get("RETENTION_SECURE_OVERWRITE", "1") != "0",
+        directory=directory,
+        key_ring=key_ring,
+        cipher=cipher,
+    )
@@ -0,0 +1,104 @@
+import re
+
+# Canonical section name -> headings that introduce it (matched case-insensitively)
+SECTION_ALIASES = {
+    "education": ["education", "academic background", "academic qualifications", "education and training"],
+    "skills": ["technical skills", "skills", "core competencies", "technical expertise"],
+    "projects": ["projects", "project", "project experience", "academic projects", "personal projects"],
+    "certificates": ["certificates and achievements", "certificates", "certifications", "achievements",
+                     "awards"],
+    "extracurricular": ["extracurricular activities", "extracurricular", "volunteer work", "hobbies",
+                        "interests", "hobbies and interests"],
+}
+
+# Separators allowed between an inline heading and its content, e.g. "Skills: Python, Java"
+HEADING_SEPARATORS = ":-–—"
+
+# A blank (or whitespace-only) line, which ends a section
+_BLANK_LINE = re.compile(r"\n[ \t]*\n")
+
+
+def _normalize_heading(heading):
+    """Lowercase a heading and collapse runs of whitespace."""
+    return " ".join(heading.lower().split())
+
+
+class SectionSegmenter:
+    """
+    Splits resume text into sections in a single pass.
+
+    All known headings are compiled into one multiline regex, so a single scan
+    finds every heading line and each section is the text up to the next
+    heading (or the first blank line). The cost is linear in the text length
+    and independent of the number of sections or aliases.
+
+    Args:
+        aliases (dict): Canonical section name mapped to the headings that introduce it.
+        stop_at_blank (bool): End a section at the first blank line, as well as at the next heading.
+    """
+
+    def __init__(self, aliases=None, stop_at_blank=True):
+        self.stop_at_blank = stop_at_blank
+        self._headings = {}
+        for section, headings in (aliases or SECTION_ALIASES).items():
+            for heading in headings:
+                self._headings[_normalize_heading(heading)] = section
+        # Longest headings first so "technical skills" wins over "skills"
+        alternatives = sorted(self._headings, key=len, reverse=True)
+        heading_pattern = "|".join(r"[ \t]+".join(map(re.escape, heading.split())) for heading in alternatives)
+        separators = re.escape(HEADING_SEPARATORS)
+        self._regex = re.compile(
+            rf"^[ \t]*({heading_pattern})[ \t]*(?:[{separators}][ \t]*(.*?))?[ \t]*$",
+            re.IGNORECASE | re.MULTILINE,
+        )
+
+    def segment(self, text):
+        """
+        Split text into sections.
+
+        Args:
+            text (str): Resume text.
+
+        Returns:
+            dict: Canonical section name mapped to the list of its blocks, in order of appearance.
+        """
+        text = text.replace("\r\n", "\n")
+        matches = list(self._regex.finditer(text))
+        sections = {}
+        for position, match in enumerate(matches):
+            end = matches[position + 1].start() if position + 1 < len(matches) else len(text)
+            inline = match.group(2) or ""
+            body = text[match.end() + 1:end]
+            if self.stop_at_blank:
+                if inline:
+                    body = f"{inline}\n{body}"
+                else:
+                    # Blank lines right after the heading do not end the section
+                    body = body.lstrip()
+                blank = _BLANK_LINE.search(body)
+                if blank:
+                    body = body[:blank.start()]
+            elif inline:
+                body = f"{inline}\n{body}"
+            body = body.strip()
+            if body:
+                section = self._headings[_normalize_heading(match.group(1))]
+                sections.setdefault(section, []).append(body)
+        return sections
+
+
+# Shared instance used by app.py and skills_extractor.py
+default_segmenter = SectionSegmenter()
+
+
+def segment_sections(text):
+    """
+    Split resume text into its known sections using the default headings.
+
+    Args:
+        text (str): Resume text.
+
+    Returns:
+        dict: Canonical section name mapped to the list of its blocks.
+    """
+    return default_segmenter.segment(text)
@@ -0,0 +1,317 @@
+import json
+import math
+import os
+import threading
+from collections import Counter
+
+import numpy as np
+
+from train import clean_answer
+
+# Files whose questions and answers form the LSA training corpus and the expected answers
+CORPUS_FILES = ["questions.json", "data.json"]
+# Sentence-embedding model used when sentence-transformers is installed and SEMANTIC_MODEL is set
+DEFAULT_SENTENCE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+# Dimensions kept by the LSA projection
+LSA_DIMENSIONS = 128
+
+
+def _normalize_rows(matrix):
+    """Scale each row to unit length, leaving all-zero rows untouched."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return (matrix / np.where(norms == 0, 1, norms)).astype(np.float32)
+
+
+def load_corpus(paths=CORPUS_FILES):
+    """
+    Collect question texts and expected answers from the question files.
+
+    Both schemas are accepted: answers stored under "expected_answer" or "answer".
+
+    Args:
+        paths (list): JSON files mapping skills to lists of question dictionaries.
+
+    Returns:
+        tuple: All texts (questions and answers) and the distinct expected answers.
+    """
+    texts = []
+    answers = []
+    for path in paths:
+        try:
+            with open(path, "r") as file:
+                bank = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"Error loading '{path}' for semantic scoring: {e}")
+            continue
+        for questions in bank.values():
+            for question in questions:
+                answer = question.get("expected_answer") or question.get("answer")
+                texts.append(question.get("question", ""))
+                if answer:
+                    texts.append(answer)
+                    answers.append(answer)
+    return texts, list(dict.fromkeys(answers))
+
+
+class LsaEncoder:
+    """
+    Dependency-free TF-IDF + latent semantic analysis sentence encoder.
+
+    Args:
+        vocabulary (dict): Token mapped to column index.
+        idf (numpy.ndarray): Inverse document frequency per token.
+        components (numpy.ndarray): LSA projection of shape (dimensions, vocabulary size).
+    """
+
+    name = "lsa"
+
+    def __init__(self, vocabulary, idf, components):
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.components = components
+
+    @classmethod
+    def fit(cls, texts, dimensions=LSA_DIMENSIONS):
+        """
+        Learn the vocabulary, IDF weights and LSA projection from a corpus.
+
+        Args:
+            texts (list): Training documents.
+            dimensions (int): Maximum number of latent dimensions.
+
+        Returns:
+            LsaEncoder: The fitted encoder.
+        """
+        documents = [clean_answer(text) for text in texts]
+        document_frequency = Counter(token for tokens in documents for token in set(tokens))
+        vocabulary = {token: index for index, token in enumerate(sorted(document_frequency))}
+        idf = np.array(
+            [math.log((1 + len(documents)) / (1 + document_frequency[token])) + 1 for token in vocabulary],
+            dtype=np.float32,
+        )
+        encoder = cls(vocabulary, idf, np.zeros((0, len(vocabulary)), dtype=np.float32))
+        if not vocabulary:
+            return encoder
+        tfidf = encoder._tfidf(documents)
+        # Right singular vectors span the latent topics of the corpus
+        _, _, right = np.linalg.svd(tfidf, full_matrices=False)
+        encoder.components = right[:dimensions].astype(np.float32)
+        return encoder
+
+    def _tfidf(self, documents):
+        matrix = np.zeros((len(documents), len(self.vocabulary)), dtype=np.float32)
+        for row, tokens in enumerate(documents):
+            for token, count in Counter(tokens).items():
+                column = self.vocabulary.get(token)
+                if column is not None:
+                    matrix[row, column] = 1 + math.log(count)
+        return _normalize_rows(matrix * self.idf)
+
+    def encode(self, texts):
+        """
+        Embed texts as unit-length float32 vectors.
+
+        Args:
+            texts (list): Texts to embed.
+
+        Returns:
+            numpy.ndarray: Matrix of shape (len(texts), dimensions).
+        """
+        tfidf = self._tfidf([clean_answer(text) for text in texts])
+        return _normalize_rows(tfidf @ self.components.T)
+
+    def save(self, directory):
+        """Write the encoder parameters to a directory."""
+        with open(os.path.join(directory, "lsa_vocabulary.json"), "w") as file:
+            json.dump(self.vocabulary, file)
+        np.save(os.path.join(directory, "lsa_idf.npy"), self.idf)
+        np.save(os.path.join(directory, "lsa_components.npy"), self.components)
+
+    @classmethod
+    def load(cls, directory):
+        """Load encoder parameters written by `save`, memory-mapping the projection."""
+        with open(os.path.join(directory, "lsa_vocabulary.json"), "r") as file:
+            vocabulary = json.load(file)
+        idf = np.load(os.path.join(directory, "lsa_idf.npy"))
+        components = np.load(os.path.join(directory, "lsa_components.npy"), mmap_mode="r")
+        return cls(vocabulary, idf, components)
+
+
+class SentenceTransformerEncoder:
+    """
+    Small CPU sentence-embedding model from the sentence-transformers package.
+
+    Args:
+        model_name (str): Hugging Face model id.
+    """
+
+    name = "sentence-transformer"
+
+    def __init__(self, model_name=DEFAULT_SENTENCE_MODEL):
+        from sentence_transformers import SentenceTransformer
+
+        self.model_name = model_name
+        self.model = SentenceTransformer(model_name, device="cpu")
+
+    def encode(self, texts):
+        """Embed texts as unit-length float32 vectors."""
+        return self.model.encode(list(texts), normalize_embeddings=True, convert_to_numpy=True).astype(np.float32)
+
+    def save(self, directory):
+        """
+        Record the model id in a directory; the weights stay in the Hugging Face cache.
+
+        Args:
+            directory (str): Index directory to write `sentence_model.json` to.
+        """
+        with open(os.path.join(directory, "sentence_model.json"), "w") as file:
+            json.dump({"model": self.model_name}, file)
+
+    @classmethod
+    def load(cls, directory):
+        """
+        Load the model recorded by `save`.
+
+        Args:
+            directory (str): Index directory holding `sentence_model.json`.
+
+        Returns:
+            SentenceTransformerEncoder: The encoder for the recorded model.
+        """
+        with open(os.path.join(directory, "sentence_model.json"), "r") as file:
+            return cls(json.load(file)["model"])
+
+
+class EmbeddingIndex:
+    """
+    Expected-answer embeddings stored as one compact float32 matrix.
+
+    Scoring a submission costs one embedding of the user's answer and one dot
+    product with the stored row of the expected answer. Saved indexes are
+    loaded memory-mapped, so worker processes share the matrix pages.
+
+    Args:
+        encoder: Object with an `encode(texts)` method returning unit-length rows.
+        answers (list): Expected answers, one per matrix row.
+        matrix (numpy.ndarray): Embeddings of shape (len(answers), dimensions).
+    """
+
+    def __init__(self, encoder, answers, matrix):
+        self.encoder = encoder
+        self.answers = answers
+        self.matrix = matrix
+        self._rows = {answer: row for row, answer in enumerate(answers)}
+
+    @classmethod
+    def build(cls, encoder, answers):
+        """
+        Embed the expected answers.
+
+        Args:
+            encoder: Sentence encoder.
+            answers (list): Expected answers.
+
+        Returns:
+            EmbeddingIndex: The index.
+        """
+        return cls(encoder, list(answers), encoder.encode(answers))
+
+    def save(self, directory):
+        """Write the matrix, the answer list and the encoder to a directory."""
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "embeddings.npy"), np.ascontiguousarray(self.matrix, dtype=np.float32))
+        with open(os.path.join(directory, "answers.json"), "w") as file:
+            json.dump({"encoder": self.encoder.name, "answers": self.answers}, file)
+        self.encoder.save(directory)
+
+    @classmethod
+    def load(cls, directory):
+        """Load an index written by `save`, memory-mapping the embedding matrix."""
+        with open(os.path.join(directory, "answers.json"), "r") as file:
+            metadata = json.load(file)
+        encoder_class = LsaEncoder if metadata["encoder"] == LsaEncoder.name else SentenceTransformerEncoder
+        matrix = np.load(os.path.join(directory, "embeddings.npy"), mmap_mode="r")
+        return cls(encoder_class.load(directory), metadata["answers"], matrix)
+
+    def embedding(self, expected_answer):
+        """Return the stored embedding of an expected answer, embedding unknown ones on the fly."""
+        row = self._rows.get(expected_answer)
+        if row is not None:
+            return self.matrix[row]
+        return self.encoder.encode([expected_answer])[0]
+
+    def score(self, expected_answer, user_answer):
+        """
+        Score an answer by cosine similarity with the expected answer.
+
+        Args:
+            expected_answer (str): The correct/expected answer.
+            user_answer (str): The user's provided answer.
+
+        Returns:
+            float: A score between 0 and 10; dissimilar answers score 0.
+        """
+        similarity = float(np.dot(self.embedding(expected_answer), self.encoder.encode([user_answer])[0]))
+        return round(max(similarity, 0.0) * 10, 2)
+
+
+def create_encoder(texts):
+    """
+    Pick the sentence encoder: a sentence-transformers model when `SEMANTIC_MODEL`
+    is set and the package is installed, otherwise TF-IDF/LSA fitted on `texts`.
+
+    Args:
+        texts (list): Corpus used to fit the LSA fallback.
+
+    Returns:
+        The encoder.
+    """
+    model_name = os.environ.get("SEMANTIC_MODEL")
+    if model_name:
+        try:
+            return SentenceTransformerEncoder(model_name)
+        except Exception as e:
+            print(f"Error loading sentence model '{model_name}', using LSA: {e}")
+    return LsaEncoder.fit(texts)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_semantic_index():
+    """
+    Return the process-wide index, loading it from `SEMANTIC_INDEX_DIR` when
+    present or building (and saving) it from the question files otherwise.
+
+    Returns:
+        EmbeddingIndex: The shared index.
+    """
+    global _index
+    if _index is not None:
+        return _index
+    with _index_lock:
+        if _index is None:
+            directory = os.environ.get("SEMANTIC_INDEX_DIR")
+            if directory and os.path.exists(os.path.join(directory, "embeddings.npy")):
+                _index = EmbeddingIndex.load(directory)
+            else:
+                texts, answers = load_corpus()
+                _index = EmbeddingIndex.build(create_encoder(texts), answers)
+                if directory:
+                    _index.save(directory)
+        return _index
+
+
+def semantic_score(expected_answer, user_answer):
+    """
+    Score an answer by embedding similarity with the expected answer.
+
+    Args:
+        expected_answer (str): The correct/expected answer.
+        user_answer (str): The user's provided answer.
+
+    Returns:
+        float: A score between 0 and 10.
+    """
+    return get_semantic_index().score(expected_answer, user_answer)
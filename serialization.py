@@ -0,0 +1,82 @@
+import json
+
+from parsed_resume import ParsedResume
+
+try:
+    import msgpack
+except ImportError:  # Optional; JSON is used when msgpack is not installed
+    msgpack = None
+
+# First byte of every payload, naming its format
+_MSGPACK = b"M"
+_JSON = b"J"
+# msgpack extension type code of ParsedResume
+_PARSED_RESUME_EXT = 1
+# Marker key of ParsedResume objects in the JSON format
+_PARSED_RESUME_KEY = "__parsed_resume__"
+
+
+def _msgpack_default(value):
+    if isinstance(value, ParsedResume):
+        return msgpack.ExtType(_PARSED_RESUME_EXT, msgpack.packb(value.to_list(), use_bin_type=True))
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _msgpack_ext_hook(code, data):
+    if code == _PARSED_RESUME_EXT:
+        return ParsedResume.from_list(msgpack.unpackb(data, raw=False))
+    return msgpack.ExtType(code, data)
+
+
+def _json_default(value):
+    if isinstance(value, ParsedResume):
+        return {_PARSED_RESUME_KEY: value.to_list()}
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _json_object_hook(value):
+    if _PARSED_RESUME_KEY in value:
+        return ParsedResume.from_list(value[_PARSED_RESUME_KEY])
+    return value
+
+
+def dumps(value):
+    """
+    Serialize session state or a cache entry compactly.
+
+    msgpack is used when installed, JSON otherwise; ParsedResume objects are
+    stored as positional field lists in either format.
+
+    Args:
+        value: JSON-compatible data, possibly containing ParsedResume objects.
+
+    Returns:
+        bytes: The payload, prefixed with its format.
+    """
+    if msgpack is not None:
+        return _MSGPACK + msgpack.packb(value, default=_msgpack_default, use_bin_type=True)
+    return _JSON + json.dumps(value, default=_json_default, separators=(",", ":")).encode("utf-8")
+
+
+def loads(payload):
+    """
+    Deserialize a payload written by `dumps`, or plain JSON written by earlier versions.
+
+    Args:
+        payload (bytes or str): The payload.
+
+    Returns:
+        The deserialized value.
+
+    Raises:
+        ValueError: If the payload is msgpack but msgpack is not installed.
+    """
+    if isinstance(payload, str):
+        return json.loads(payload, object_hook=_json_object_hook)
+    if payload[:1] == _MSGPACK:
+        if msgpack is None:
+            raise ValueError("Payload was written with msgpack, which is not installed.")
+        return msgpack.unpackb(payload[1:], ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False)
+    if payload[:1] == _JSON:
+        payload = payload[1:]
+    return json.loads(payload, object_hook=_json_object_hook)
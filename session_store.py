@@ -0,0 +1,215 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from serialization import dumps, loads
+
+
+def new_interview_state():
+    """
+    Build the default interview state for a fresh session.
+
+    Returns:
+        dict: Interview state with no parsed resume and no questions.
+    """
+    return {
+        "questions": [],
+        "schedule": None,
+        "current_question_index": 0,
+        "parsed_data": None,
+        "total_score": 0,
+        "total_questions": 0,
+        "resume": None,
+    }
+
+
+class SessionStore:
+    """
+    Base class for interview state backends keyed by session id.
+
+    Backends hold state dictionaries serialised with `serialization.dumps` (JSON-compatible
+    data and ParsedResume objects) and must be safe to use
+    from several threads at once.
+    """
+
+    def get(self, session_id):
+        """
+        Fetch the state stored for a session.
+
+        Args:
+            session_id (str): The session identifier.
+
+        Returns:
+            dict: The stored state, or None if the session is unknown or expired.
+        """
+        raise NotImplementedError
+
+    def set(self, session_id, state):
+        """
+        Store the state for a session, replacing any previous value.
+
+        Args:
+            session_id (str): The session identifier.
+            state (dict): The state to store.
+        """
+        raise NotImplementedError
+
+    def delete(self, session_id):
+        """
+        Remove the state stored for a session.
+
+        Args:
+            session_id (str): The session identifier.
+        """
+        raise NotImplementedError
+
+    def load(self, session_id):
+        """
+        Fetch the state for a session, falling back to a fresh interview state.
+
+        Args:
+            session_id (str): The session identifier.
+
+        Returns:
+            dict: The stored state or a new default state.
+        """
+        state = self.get(session_id)
+        if state is None:
+            state = new_interview_state()
+        return state
+
+
+class MemorySessionStore(SessionStore):
+    """
+    In-process LRU store with TTL eviction, suitable for a single worker process.
+
+    Args:
+        max_sessions (int): Maximum number of sessions kept before the least recently used is evicted.
+        ttl (float): Seconds of inactivity after which a session expires.
+    """
+
+    def __init__(self, max_sessions=1024, ttl=3600):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._entries = OrderedDict()  # session_id -> (expires_at, serialised state)
+        self._lock = threading.Lock()
+
+    def get(self, session_id):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= now:
+                del self._entries[session_id]
+                return None
+            # Refresh recency and expiry on access
+            self._entries[session_id] = (now + self.ttl, payload)
+            self._entries.move_to_end(session_id)
+        # Deserialise outside the lock so callers get a private copy
+        return loads(payload)
+
+    def set(self, session_id, state):
+        payload = dumps(state)
+        now = time.monotonic()
+        with self._lock:
+            self._entries[session_id] = (now + self.ttl, payload)
+            self._entries.move_to_end(session_id)
+            self._evict(now)
+
+    def delete(self, session_id):
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def _evict(self, now):
+        """Drop expired sessions from the cold end, then enforce the size bound."""
+        while self._entries:
+            oldest_id, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now and len(self._entries) <= self.max_sessions:
+                break
+            del self._entries[oldest_id]
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Shared store backed by a SQLite file, usable across threads and worker processes.
+
+    Args:
+        path (str): Path to the SQLite database file.
+        ttl (float): Seconds of inactivity after which a session expires.
+    """
+
+    def __init__(self, path, ttl=3600):
+        self.path = path
+        self.ttl = ttl
+        self._local = threading.local()  # One connection per thread
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "session_id TEXT PRIMARY KEY, state TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS sessions_expiry ON sessions (expires_at)")
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            # WAL lets readers proceed while another process writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, session_id):
+        now = time.time()
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT state, expires_at FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        payload, expires_at = row
+        if expires_at <= now:
+            self.delete(session_id)
+            return None
+        conn.execute(
+            "UPDATE sessions SET expires_at = ? WHERE session_id = ?", (now + self.ttl, session_id)
+        )
+        return loads(payload)
+
+    def set(self, session_id, state):
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO sessions (session_id, state, expires_at) VALUES (?, ?, ?)",
+            (session_id, dumps(state), now + self.ttl),
+        )
+        # Opportunistically purge expired rows using the expiry index
+        conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+
+    def delete(self, session_id):
+        self._connect().execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+
+def create_session_store():
+    """
+    Create the session store selected by the environment.
+
+    `SESSION_BACKEND` chooses between "memory" (default) and "sqlite";
+    `SESSION_DB_PATH`, `SESSION_TTL` and `SESSION_MAX_ENTRIES` tune the backends.
+
+    Returns:
+        SessionStore: The configured store.
+    """
+    backend = os.environ.get("SESSION_BACKEND", "memory").lower()
+    ttl = float(os.environ.get("SESSION_TTL", 3600))
+    if backend == "sqlite":
+        path = os.environ.get("SESSION_DB_PATH", os.path.join(os.getcwd(), "sessions.db"))
+        return SQLiteSessionStore(path, ttl=ttl)
+    if backend != "memory":
+        print(f"Unknown SESSION_BACKEND '{backend}', using in-memory store.")
+    max_sessions = int(os.environ.get("SESSION_MAX_ENTRIES", 1024))
+    return MemorySessionStore(max_sessions=max_sessions, ttl=ttl)
@@ -0,0 +1,136 @@
+import json
+import os
+import re
+
+# Skill taxonomy shipped with the application: canonical skill -> list of aliases
+SKILLS_PATH = os.environ.get(
+    "SKILL_TAXONOMY_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills.json")
+)
+
+
+def load_taxonomy(path=SKILLS_PATH):
+    """
+    Load a skill taxonomy from a JSON file.
+
+    Args:
+        path (str): Path to a JSON object mapping each canonical skill to a list of aliases.
+
+    Returns:
+        dict: Canonical skill mapped to its aliases, or an empty dict if the file is missing or invalid.
+    """
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        print(f"Error: skill taxonomy '{path}' not found.")
+        return {}
+    except json.JSONDecodeError as e:
+        print(f"Error: Failed to decode skill taxonomy '{path}' - {e}")
+        return {}
+
+
+def _normalize(term):
+    """Lowercase a term and collapse runs of whitespace."""
+    return " ".join(term.lower().split())
+
+
+def _trie_pattern(node):
+    """
+    Render a character trie as a regular expression.
+
+    Sharing prefixes means the regex engine follows a single branch per input
+    character, so matching cost barely grows with the size of the vocabulary.
+    """
+    branches = []
+    for char, child in sorted(node.items()):
+        if char == "":
+            continue
+        # Spaces in aliases match any whitespace, e.g. a line break from the PDF layout
+        token = r"\s+" if char == " " else re.escape(char)
+        branches.append(token + _trie_pattern(child))
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        # A term ends here but longer ones continue; the greedy ? tries the longer ones first
+        body = "(?:" + body + ")?"
+    return body
+
+
+class SkillMatcher:
+    """
+    Precompiled matcher that finds every skill and alias in one scan of the text.
+
+    All aliases are merged into a single case-insensitive trie-shaped regex with
+    word boundaries, so the text is scanned once regardless of vocabulary size.
+
+    Args:
+        taxonomy (dict): Canonical skill mapped to a list of aliases.
+    """
+
+    def __init__(self, taxonomy):
+        self.skills = list(taxonomy)
+        self._canonical = {}
+        trie = {}
+        for skill, aliases in taxonomy.items():
+            for term in [skill, *aliases]:
+                term = _normalize(term)
+                if not term:
+                    continue
+                self._canonical.setdefault(term, skill)
+                node = trie
+                for char in term:
+                    node = node.setdefault(char, {})
+                node[""] = {}
+        pattern = _trie_pattern(trie)
+        # Lookarounds instead of \b so terms such as "c++" and ".net" still need word boundaries
+        self._regex = re.compile(rf"(?<!\w)(?:{pattern})(?!\w)", re.IGNORECASE) if pattern else None
+
+    @classmethod
+    def from_file(cls, path=SKILLS_PATH):
+        """
+        Build a matcher from a taxonomy file.
+
+        Args:
+            path (str): Path to the taxonomy JSON file.
+
+        Returns:
+            SkillMatcher: The compiled matcher.
+        """
+        return cls(load_taxonomy(path))
+
+    def match(self, text):
+        """
+        Find all skill mentions in the text.
+
+        Args:
+            text (str): Input text.
+
+        Returns:
+            dict: Canonical skill mapped to {"count": int, "offsets": [(start, end), ...]},
+                  in order of first appearance.
+        """
+        found = {}
+        if self._regex is None:
+            return found
+        for match in self._regex.finditer(text):
+            skill = self._canonical.get(_normalize(match.group()))
+            if skill is None:
+                continue
+            entry = found.setdefault(skill, {"count": 0, "offsets": []})
+            entry["count"] += 1
+            entry["offsets"].append(match.span())
+        return found
+
+    def find(self, text):
+        """
+        List the skills mentioned in the text.
+
+        Args:
+            text (str): Input text.
+
+        Returns:
+            list: Canonical skills found, in taxonomy order.
+        """
+        found = self.match(text)
+        return [skill for skill in self.skills if skill in found]
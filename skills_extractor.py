@@ -1,6 +1,13 @@
-import fitz  # PyMuPDF for PDF text extraction
-import re  # Regular expressions for pattern matching
+from pdf_extract import extract_pages, extract_text  # Pooled PDF text extraction (PyMuPDF or PyPDF2)
 import json  # For JSON serialization of parsed data
+from skill_matcher import SkillMatcher  # Single-pass skill and alias matching
+from section_segmenter import segment_sections  # One-pass resume section detection
+from pii_redactor import default_redactor  # Precompiled single-pass PII masking
+from parsed_resume import ParsedResume  # Resume model shared with the web app
+
+# Compiled once at import from the skill taxonomy (skills.json)
+skill_matcher = SkillMatcher.from_file()
+
 
 def extract_text_from_pdf(pdf_path):
     """
@@ -13,13 +20,8 @@ def extract_text_from_pdf(pdf_path):
         str: Extracted text from the PDF, or an empty string if extraction fails.
     """
     try:
-        document = fitz.open(pdf_path)  # Open the PDF file
-        text = ""
-        # Iterate through each page in the PDF and extract text
-        for page_num in range(len(document)):
-            page = document.load_page(page_num)
-            text += page.get_text()
-        return text
+        # Pages are extracted by worker processes and joined once
+        return extract_text(pdf_path)
     except Exception as e:
         # Handle errors during text extraction
         print(f"Error extracting text from PDF: {e}")
@@ -28,7 +30,8 @@ def extract_text_from_pdf(pdf_path):
 
 def mask_sensitive_data(text):
     """
-    Mask sensitive data such as email addresses, phone numbers, and URLs.
+    Mask sensitive data such as email addresses, phone numbers, URLs, addresses,
+    dates of birth, national ID numbers and IBANs.
 
     Args:
         text (str): Input text containing sensitive data.
@@ -37,19 +40,46 @@ def mask_sensitive_data(text):
         str: Text with sensitive data masked.
     """
     try:
-        # Mask email addresses
-        text = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '[EMAIL REDACTED]', text)
-        # Mask phone numbers
-        text = re.sub(r'\b(\+?\d{1,3})?\s?[-.]?\d{10}\b', '[PHONE REDACTED]', text)
-        # Mask LinkedIn and GitHub URLs
-        text = re.sub(r'(linkedin\.com/\S+|github\.com/\S+)', '[LINK REDACTED]', text)
-        return text
+        # Every detector runs in a single scan of the text
+        return default_redactor.mask(text)
     except Exception as e:
         # Handle errors during masking
         print(f"Error masking sensitive data: {e}")
         return text
 
 
+def redact_sensitive_data(text):
+    """
+    Mask sensitive data and report what was masked, for auditing.
+
+    Args:
+        text (str): Input text containing sensitive data.
+
+    Returns:
+        tuple: Masked text and a list of findings with entity type and offsets (never the values).
+    """
+    return default_redactor.redact(text)
+
+
+def extract_masked_text_from_pdf(pdf_path):
+    """
+    Extract text from a PDF and mask sensitive data page by page.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+
+    Returns:
+        str: Masked text of the PDF, or an empty string if extraction fails.
+    """
+    try:
+        pages = extract_pages(pdf_path)
+        return "".join(masked for masked, _ in default_redactor.redact_stream(pages))
+    except Exception as e:
+        # Handle errors during text extraction
+        print(f"Error extracting text from PDF: {e}")
+        return ""
+
+
 def extract_technical_skills(text):
     """
     Extract technical skills from the resume text.
@@ -60,15 +90,21 @@ def extract_technical_skills(text):
     Returns:
         list: List of found technical skills.
     """
-    # Predefined list of technical skills to search for
-    skills = [
-        'python', 'java', 'c++', 'html', 'css', 'javascript', 'sql', 'machine learning', 'data science',
-        'ruby', 'go', 'swift', 'kotlin', 'matlab', 'r', 'php', 'scala', 'react', 'angular', 'django', 'flask',
-        'docker', 'aws', 'azure', 'git', 'linux', 'node.js', 'tensorflow', 'pytorch', 'android', 'ios'
-    ]
-    # Match skills in the text using regular expressions
-    found_skills = [skill for skill in skills if re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE)]
-    return found_skills
+    # One scan of the text matches every skill and alias in the taxonomy
+    return skill_matcher.find(text)
+
+
+def match_technical_skills(text):
+    """
+    Locate technical skills in the resume text.
+
+    Args:
+        text (str): Input text.
+
+    Returns:
+        dict: Skill mapped to its mention count and (start, end) offsets.
+    """
+    return skill_matcher.match(text)
 
 
 def extract_projects(text):
@@ -81,11 +117,7 @@ def extract_projects(text):
     Returns:
         list: List of projects.
     """
-    # Define a pattern to match project-related sections
-    project_pattern = r'(projects?|project experience)\s*[:\-\n]*([\s\S]*?)(\n\n|\Z)'
-    matches = re.findall(project_pattern, text, re.IGNORECASE)
-    # Extract and clean project descriptions
-    return [match[1].strip() for match in matches]
+    return segment_sections(text).get("projects", [])
 
 
 def extract_education(text):
@@ -98,11 +130,7 @@ def extract_education(text):
     Returns:
         list: List of education details.
     """
-    # Define a pattern to match education-related sections
-    education_pattern = r'(education|academic background)\s*[:\-\n]*([\s\S]*?)(\n\n|\Z)'
-    matches = re.findall(education_pattern, text, re.IGNORECASE)
-    # Extract and clean education details
-    return [match[1].strip() for match in matches]
+    return segment_sections(text).get("education", [])
 
 
 def extract_extracurricular_activities(text):
@@ -115,11 +143,7 @@ def extract_extracurricular_activities(text):
     Returns:
         list: List of extracurricular activities.
     """
-    # Define a pattern to match extracurricular activities or hobbies
-    activities_pattern = r'(extracurricular activities|volunteer work|hobbies|interests)\s*[:\-\n]*([\s\S]*?)(\n\n|\Z)'
-    matches = re.findall(activities_pattern, text, re.IGNORECASE)
-    # Extract and clean activity descriptions
-    return [match[1].strip() for match in matches]
+    return segment_sections(text).get("extracurricular", [])
 
 
 def get_resume_details(pdf_path):
@@ -130,30 +154,20 @@ def get_resume_details(pdf_path):
         pdf_path (str): Path to the resume PDF.
 
     Returns:
-        dict: Parsed resume details, or an empty dictionary if text extraction fails.
+        ParsedResume: Masked sections, with the matched technical skills as its skill list; every
+                      block of a repeated section is kept (see `ParsedResume.blocks`). Empty, and
+                      so falsy, if text extraction fails.
     """
-    # Extract text from the PDF
-    text = extract_text_from_pdf(pdf_path)
-    if not text:
+    # Extract text from the PDF, masking sensitive data page by page before analysis
+    masked_text = extract_masked_text_from_pdf(pdf_path)
+    if not masked_text:
         print("Failed to extract text from the PDF.")
-        return {}
+        return ParsedResume()
 
-    # Mask sensitive data before analysis
-    masked_text = mask_sensitive_data(text)
-
-    # Extract key details from the text
+    # Extract key details from the text; sections come from a single segmentation pass
     technical_skills = extract_technical_skills(masked_text)
-    projects = extract_projects(masked_text)
-    education = extract_education(masked_text)
-    extracurricular_activities = extract_extracurricular_activities(masked_text)
-
-    # Return a dictionary containing all extracted details
-    return {
-        "technical_skills": technical_skills,
-        "projects": projects,
-        "education": education,
-        "extracurricular_activities": extracurricular_activities
-    }
+    sections = segment_sections(masked_text)
+    return ParsedResume.from_sections(sections, technical_skills)
 
 
 if __name__ == "__main__":
@@ -161,4 +175,9 @@ if __name__ == "__main__":
     pdf_path = "path_to_resume.pdf"  # Replace with the actual file path
     # Extract and print resume details in JSON format
     details = get_resume_details(pdf_path)
-    print(json.dumps(details, indent=2))
+    print(json.dumps({
+        "technical_skills": details.skill_list,
+        "projects": details.blocks("projects"),
+        "education": details.blocks("education"),
+        "extracurricular_activities": details.blocks("extracurricular"),
+    }, indent=2))
@@ -0,0 +1,187 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from work_pools import QueueFull
+
+
+class SummaryBatcher:
+    """
+    Micro-batching front end for a summarization model.
+
+    Requests are queued and a background worker collects them for up to
+    `max_wait_ms` (or until `max_batch_size` are waiting), runs them through
+    the model as one padded batch and resolves each request's future.
+
+    Args:
+        summarize_batch (callable): Takes a list of texts and returns a list of summaries in the same order.
+        max_batch_size (int): Maximum number of texts summarized together.
+        max_wait_ms (float): Longest time the first request in a batch waits for companions.
+        max_pending (int): Most requests allowed to wait; further ones raise QueueFull. None means unbounded.
+    """
+
+    def __init__(self, summarize_batch, max_batch_size=8, max_wait_ms=10, max_pending=None):
+        self.summarize_batch = summarize_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_pending = max_pending
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._jobs = 0
+        self._queue_latency_total = 0.0
+        self._queue_latency_max = 0.0
+        self._inference_total = 0.0
+        self._rejected = 0
+
+    def submit(self, text):
+        """
+        Queue a text for summarization.
+
+        Args:
+            text (str): The text to summarize.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the summary string.
+
+        Raises:
+            QueueFull: If `max_pending` requests are already waiting.
+        """
+        if self.max_pending is not None and self._queue.qsize() >= self.max_pending:
+            with self._stats_lock:
+                self._rejected += 1
+            raise QueueFull("The summarization queue is full; retry shortly.")
+        self._ensure_worker()
+        future = Future()
+        self._queue.put((text, future, time.perf_counter()))
+        return future
+
+    def summarize(self, text, timeout=None):
+        """
+        Summarize a text through the batch queue and wait for the result.
+
+        Args:
+            text (str): The text to summarize.
+            timeout (float): Seconds to wait before giving up.
+
+        Returns:
+            str: The generated summary.
+        """
+        return self.submit(text).result(timeout=timeout)
+
+    def stats(self):
+        """
+        Report batching metrics.
+
+        Returns:
+            dict: Batch count, processed jobs, average fill rate, queue latency and inference time.
+        """
+        with self._stats_lock:
+            batches = self._batches
+            jobs = self._jobs
+            return {
+                "batches": batches,
+                "jobs": jobs,
+                "pending": self._queue.qsize(),
+                "rejected": self._rejected,
+                "max_batch_size": self.max_batch_size,
+                "avg_batch_size": round(jobs / batches, 3) if batches else 0.0,
+                "avg_fill_rate": round(jobs / (batches * self.max_batch_size), 3) if batches else 0.0,
+                "avg_queue_latency_ms": round(self._queue_latency_total / jobs * 1000, 3) if jobs else 0.0,
+                "max_queue_latency_ms": round(self._queue_latency_max * 1000, 3),
+                "avg_inference_ms": round(self._inference_total / batches * 1000, 3) if batches else 0.0,
+            }
+
+    def _ensure_worker(self):
+        # Started lazily so that a preloading master never forks with a live thread
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="summary-batcher", daemon=True)
+                self._worker.start()
+
+    def _collect(self):
+        """Block for one job, then gather more until the batch is full or the wait expires."""
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            started = time.perf_counter()
+            latencies = [started - queued_at for _, _, queued_at in batch]
+            texts = [text for text, _, _ in batch]
+            try:
+                summaries = self.summarize_batch(texts)
+                for (_, future, _), summary in zip(batch, summaries):
+                    future.set_result(summary)
+            except Exception:
+                # One bad input must not fail its neighbours, so retry individually
+                for text, future, _ in batch:
+                    try:
+                        future.set_result(self.summarize_batch([text])[0])
+                    except Exception as e:
+                        future.set_exception(e)
+            with self._stats_lock:
+                self._batches += 1
+                self._jobs += len(batch)
+                self._queue_latency_total += sum(latencies)
+                self._queue_latency_max = max(self._queue_latency_max, max(latencies))
+                self._inference_total += time.perf_counter() - started
+
+
+def make_pipeline_summarizer(model_registry, max_length=150, min_length=50):
+    """
+    Build a batch summarization function backed by the registry's summarizer.
+
+    Args:
+        model_registry (ModelRegistry): Registry providing the "summarizer" pipeline.
+        max_length (int): Maximum summary length in tokens.
+        min_length (int): Minimum summary length in tokens.
+
+    Returns:
+        callable: Function mapping a list of texts to a list of summaries.
+    """
+    def summarize_batch(texts):
+        summarizer = model_registry.get("summarizer")
+        if summarizer is None:
+            raise RuntimeError("Summarization model not initialized.")
+        # The pipeline pads the texts and runs them through the model together
+        results = summarizer(
+            texts, max_length=max_length, min_length=min_length, do_sample=False, batch_size=len(texts)
+        )
+        return [result["summary_text"] for result in results]
+
+    return summarize_batch
+
+
+def create_summary_batcher(model_registry):
+    """
+    Create a batcher configured by `SUMMARY_MAX_BATCH_SIZE`, `SUMMARY_MAX_WAIT_MS` and `SUMMARY_QUEUE_SIZE`.
+
+    Args:
+        model_registry (ModelRegistry): Registry providing the "summarizer" pipeline.
+
+    Returns:
+        SummaryBatcher: The configured batcher.
+    """
+    return SummaryBatcher(
+        make_pipeline_summarizer(model_registry),
+        max_batch_size=int(os.environ.get("SUMMARY_MAX_BATCH_SIZE", 8)),
+        max_wait_ms=float(os.environ.get("SUMMARY_MAX_WAIT_MS", 10)),
+        max_pending=int(os.environ.get("SUMMARY_QUEUE_SIZE", 64)),
+    )
@@ -0,0 +1,237 @@
+import os
+import re
+import threading
+from concurrent.futures import Future
+
+from resume_cache import SUMMARY, sha256_text
+
+# Sentence or line boundaries where sections are split into chunks
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?;])\s+|\n+")
+
+
+def join_sections(sections):
+    """Text of a parsed resume as one string, in section order."""
+    return " ".join(sections.values()).strip()
+
+
+def make_token_counter(model_registry):
+    """
+    Count tokens with the loaded summarizer's tokenizer.
+
+    Before the model has loaded (or if it has no tokenizer) the count is
+    estimated from the word count, erring on the high side.
+
+    Args:
+        model_registry (ModelRegistry): Registry providing the "summarizer" pipeline.
+
+    Returns:
+        callable: Function mapping a text to its token count.
+    """
+    def count_tokens(text):
+        tokenizer = None
+        if model_registry.is_loaded("summarizer"):
+            tokenizer = getattr(model_registry.get("summarizer"), "tokenizer", None)
+        if tokenizer is None:
+            return len(text.split()) * 4 // 3 + 1
+        return len(tokenizer.encode(text, add_special_tokens=False))
+
+    return count_tokens
+
+
+def _resolved(value):
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def _after_all(futures, outer, then):
+    """Call then(results) once every future is done, or fail `outer` with the first error."""
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def done(_):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        try:
+            then([future.result() for future in futures])
+        except Exception as e:
+            if not outer.done():
+                outer.set_exception(e)
+
+    for future in futures:
+        future.add_done_callback(done)
+
+
+class ChunkedSummarizer:
+    """
+    Map-reduce summarization for texts longer than the model's input window.
+
+    A resume that fits in `max_tokens` is summarized in one call. A longer one
+    is split by section, and sections over the budget are split further at
+    sentence boundaries (map); every chunk goes through the batcher at once, so
+    chunks of one resume share padded batches. The partial summaries are
+    joined in section order and summarized again (reduce), repeating until
+    they fit one window.
+
+    Every summary is cached by the SHA-256 of its input, so editing one section
+    only recomputes that section's chunks and the reduce step.
+
+    Args:
+        batcher (SummaryBatcher): Queue in front of the model.
+        cache (ResumeCache): Cache holding the chunk summaries in its SUMMARY namespace.
+        count_tokens (callable): Maps a text to its token count.
+        max_tokens (int): Token budget of one model input, below the model's window.
+        min_chunk_words (int): Chunks with fewer words are passed to the reduce step verbatim,
+                               since the model pads short inputs up to its minimum summary length.
+    """
+
+    def __init__(self, batcher, cache, count_tokens, max_tokens=900, min_chunk_words=60):
+        self.batcher = batcher
+        self.cache = cache
+        self.count_tokens = count_tokens
+        self.max_tokens = max_tokens
+        self.min_chunk_words = min_chunk_words
+        self._stats_lock = threading.Lock()
+        self._documents = 0
+        self._chunked = 0
+        self._chunks = 0
+        self._cached_chunks = 0
+        self._reduce_rounds = 0
+
+    def split(self, text):
+        """
+        Split a text into pieces of at most `max_tokens` tokens.
+
+        Args:
+            text (str): Section text.
+
+        Returns:
+            list: The chunks, in order.
+        """
+        if self.count_tokens(text) <= self.max_tokens:
+            return [text]
+        chunks = []
+        current, current_tokens = [], 0
+        for sentence in filter(None, (part.strip() for part in _SENTENCE_BREAK.split(text))):
+            tokens = self.count_tokens(sentence)
+            if tokens > self.max_tokens:
+                # A run-on "sentence" (e.g. a long skill list) is cut by words
+                words = sentence.split()
+                step = max(1, len(words) * self.max_tokens // tokens)
+                pieces = [" ".join(words[i:i + step]) for i in range(0, len(words), step)]
+            else:
+                pieces = [sentence]
+            for piece in pieces:
+                piece_tokens = tokens if len(pieces) == 1 else self.count_tokens(piece)
+                if current and current_tokens + piece_tokens > self.max_tokens:
+                    chunks.append(" ".join(current))
+                    current, current_tokens = [], 0
+                current.append(piece)
+                current_tokens += piece_tokens
+        if current:
+            chunks.append(" ".join(current))
+        return chunks
+
+    def _summarize(self, text, cache_keys):
+        """Summarize one model input through the cache and the batcher."""
+        digest = sha256_text(text)
+        cache_keys.append(digest)
+        cached = self.cache.get(SUMMARY, digest)
+        if cached is not None:
+            with self._stats_lock:
+                self._cached_chunks += 1
+            return _resolved(cached)
+        future = self.batcher.submit(text)
+        future.add_done_callback(
+            lambda done: done.exception() is None and self.cache.set(SUMMARY, digest, done.result())
+        )
+        return future
+
+    def _map(self, text, cache_keys):
+        if len(text.split()) < self.min_chunk_words:
+            return _resolved(text)
+        with self._stats_lock:
+            self._chunks += 1
+        return self._summarize(text, cache_keys)
+
+    def _reduce(self, partials, outer, cache_keys):
+        joined = " ".join(partials)
+        if self.count_tokens(joined) <= self.max_tokens:
+            final = self._summarize(joined, cache_keys)
+            _after_all([final], outer, lambda results: outer.set_result(results[0]))
+            return
+        # Partials are at most one summary long, so each round packs several into a group
+        with self._stats_lock:
+            self._reduce_rounds += 1
+        groups = self.split("\n".join(partials))
+        futures = [self._summarize(group, cache_keys) for group in groups]
+        _after_all(futures, outer, lambda results: self._reduce(results, outer, cache_keys))
+
+    def submit(self, sections, cache_keys=None):
+        """
+        Summarize a parsed resume.
+
+        Args:
+            sections (dict): Section name mapped to its text, in display order.
+            cache_keys (list): If given, receives the digest of every cache entry used,
+                               so the caller can delete them later.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the summary string.
+
+        Raises:
+            QueueFull: If the batcher cannot take the chunks.
+        """
+        cache_keys = [] if cache_keys is None else cache_keys
+        text = join_sections(sections)
+        with self._stats_lock:
+            self._documents += 1
+        # Short resumes keep the single-call path and its cache key
+        if self.count_tokens(text) <= self.max_tokens:
+            return self._summarize(text, cache_keys)
+
+        with self._stats_lock:
+            self._chunked += 1
+        chunks = [chunk for section in sections.values() if section.strip() for chunk in self.split(section)]
+        outer = Future()
+        futures = [self._map(chunk, cache_keys) for chunk in chunks]
+        _after_all(futures, outer, lambda results: self._reduce(results, outer, cache_keys))
+        return outer
+
+    def stats(self):
+        """
+        Report chunking metrics.
+
+        Returns:
+            dict: Documents summarized, how many needed chunking, chunk count, cache hits and extra reduce rounds.
+        """
+        with self._stats_lock:
+            return {
+                "documents": self._documents,
+                "chunked_documents": self._chunked,
+                "chunks": self._chunks,
+                "cached_summaries": self._cached_chunks,
+                "reduce_rounds": self._reduce_rounds,
+                "max_tokens": self.max_tokens,
+            }
+
+
+def create_chunked_summarizer(batcher, cache, model_registry):
+    """
+    Create a chunked summarizer configured by `SUMMARY_CHUNK_TOKENS` and `SUMMARY_MIN_CHUNK_WORDS`.
+
+    Args:
+        batcher (SummaryBatcher): Queue in front of the model.
+        cache (ResumeCache): Cache for chunk summaries.
+        model_registry (ModelRegistry): Registry whose summarizer's tokenizer counts tokens.
+
+    Returns:
+        ChunkedSummarizer: The configured summarizer.
+    """
+    return ChunkedSummarizer(
+        batcher, cache, make_token_counter(model_registry),
+        max_tokens=int(os.environ.get("SUMMARY_CHUNK_TOKENS", 900)),
+        min_chunk_words=int(os.environ.get("SUMMARY_MIN_CHUNK_WORDS", 60)),
+    )
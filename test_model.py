@@ -1,5 +1,6 @@
 import json
 from train import score_answer  # Importing a scoring function from the `train` module
+from question_bank import get_question_bank  # Shared, indexed question bank
 
 
 def load_questions():
@@ -33,16 +34,14 @@ def get_questions_by_skill(skill):
     Fetches questions for a specific skill from the question bank.
 
     Args:
-        skill (str): The skill for which questions are to be retrieved.
+        skill (str): The skill (or an alias such as "HTML" for html_css) for which questions are to be retrieved.
 
     Returns:
         list: A list of questions for the given skill. Returns an empty list if no questions are found.
     """
     try:
-        # Load the questions dictionary
-        questions = load_questions()
-        # Return questions corresponding to the skill (case-insensitive)
-        return questions.get(skill.lower(), [])
+        # Questions are loaded once and looked up by skill name or alias (case-insensitive)
+        return get_question_bank().get(skill)
     except Exception as e:
         # Handle any unexpected errors during the process
         print(f"Error fetching questions for skill '{skill}': {e}")
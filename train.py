@@ -1,14 +1,143 @@
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
+import os
+import re
 import string
+import threading
+from functools import lru_cache
 
-# Ensure necessary NLTK resources are downloaded
-try:
-    nltk.download('punkt', quiet=True)  # Download tokenizer data
-    nltk.download('stopwords', quiet=True)  # Download stopwords data
-except Exception as e:
-    print(f"Error downloading NLTK resources: {e}")  # Handle any errors during the download
+# Directory searched for NLTK data before NLTK's default locations; ship punkt and
+# stopwords here (see download_nltk_resources) for air-gapped deployments
+NLTK_DATA_DIR = os.environ.get(
+    "NLTK_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "nltk_data")
+)
+# Set to 1 to let missing NLTK resources be downloaded into NLTK_DATA_DIR on first use
+NLTK_ALLOW_DOWNLOAD = os.environ.get("NLTK_ALLOW_DOWNLOAD", "0") == "1"
+# NLTK resources used for scoring: resource name -> path checked by nltk.data.find
+NLTK_RESOURCES = {
+    "punkt_tab": "tokenizers/punkt_tab",
+    "punkt": "tokenizers/punkt",
+    "stopwords": "corpora/stopwords",
+}
+
+# "overlap" (token overlap) or "semantic" (embedding similarity, see semantic_scoring.py)
+SCORING_MODE = os.environ.get("SCORING_MODE", "overlap")
+
+# Punctuation characters removed from token lists
+PUNCTUATION = frozenset(string.punctuation)
+
+# NLTK's English stopword list, used when the stopwords corpus is not installed
+ENGLISH_STOP_WORDS = frozenset("""
+i me my myself we our ours ourselves you you're you've you'll you'd your yours yourself
+yourselves he him his himself she she's her hers herself it it's its itself they them their
+theirs themselves what which who whom this that that'll these those am is are was were be
+been being have has had having do does did doing a an the and but if or because as until
+while of at by for with about against between into through during before after above below
+to from up down in out on off over under again further then once here there when where why
+how all any both each few more most other some such no nor not only own same so than too
+very s t can will just don don't should should've now d ll m o re ve y ain aren aren't
+couldn couldn't didn didn't doesn doesn't hadn hadn't hasn hasn't haven haven't isn isn't
+ma mightn mightn't mustn mustn't needn needn't shan shan't shouldn shouldn't wasn wasn't
+weren weren't won won't wouldn wouldn't
+""".split())
+
+# Dependency-free tokenizer used when punkt is unavailable: words (keeping inner
+# hyphens and dots, as in "real-time" or "node.js"), clitics split off like
+# NLTK's treebank tokenizer ("don't" -> "do", "n't") and punctuation marks
+_TOKEN_PATTERN = re.compile(r"\w+?(?=n't\b)|n't\b|\w+(?:[-.]\w+)*|'\w+|[^\w\s]")
+
+
+def regex_tokenize(text):
+    """
+    Split text into word and punctuation tokens without NLTK.
+
+    Args:
+        text (str): Text to tokenize.
+
+    Returns:
+        list: Tokens in order.
+    """
+    return _TOKEN_PATTERN.findall(text)
+
+
+@lru_cache(maxsize=1)
+def _load_nltk():
+    """
+    Import NLTK on first use and point it at the local data directory.
+
+    Returns:
+        module: The nltk module, or None if it is not installed.
+    """
+    try:
+        import nltk
+    except ImportError:
+        return None
+    if NLTK_DATA_DIR not in nltk.data.path:
+        nltk.data.path.insert(0, NLTK_DATA_DIR)
+    return nltk
+
+
+def _has_resource(nltk, name):
+    """Check for an NLTK resource locally, downloading it only when allowed."""
+    try:
+        nltk.data.find(NLTK_RESOURCES[name])
+        return True
+    except LookupError:
+        pass
+    if not NLTK_ALLOW_DOWNLOAD:
+        return False
+    try:
+        return nltk.download(name, download_dir=NLTK_DATA_DIR, quiet=True)
+    except Exception as e:
+        print(f"Error downloading NLTK resource '{name}': {e}")
+        return False
+
+
+def download_nltk_resources(directory=NLTK_DATA_DIR):
+    """
+    Download the NLTK resources used for scoring, e.g. to bundle them before deployment.
+
+    Args:
+        directory (str): Target data directory.
+    """
+    import nltk
+
+    for name in NLTK_RESOURCES:
+        nltk.download(name, download_dir=directory, quiet=True)
+
+
+@lru_cache(maxsize=1)
+def get_tokenizer():
+    """
+    Resolve the word tokenizer once per process.
+
+    Returns:
+        callable: NLTK's word_tokenize when punkt data is available, otherwise `regex_tokenize`.
+    """
+    nltk = _load_nltk()
+    if nltk is not None and (_has_resource(nltk, "punkt_tab") or _has_resource(nltk, "punkt")):
+        from nltk.tokenize import word_tokenize
+        try:
+            # Newer NLTK releases need punkt_tab, older ones punkt; probe the one installed
+            word_tokenize("warm up")
+            return word_tokenize
+        except LookupError:
+            pass
+    print("Warning: NLTK punkt data not found; using the regex tokenizer.")
+    return regex_tokenize
+
+
+@lru_cache(maxsize=1)
+def get_stop_words():
+    """
+    Load the English stopword list once per process.
+
+    Returns:
+        frozenset: English stopwords, from NLTK data when available or the built-in list otherwise.
+    """
+    nltk = _load_nltk()
+    if nltk is not None and _has_resource(nltk, "stopwords"):
+        from nltk.corpus import stopwords
+        return frozenset(stopwords.words('english'))
+    return ENGLISH_STOP_WORDS
 
 
 def clean_answer(answer):
@@ -22,12 +151,12 @@ def clean_answer(answer):
         list: A list of cleaned and tokenized words.
     """
     try:
-        # Load English stopwords
-        stop_words = set(stopwords.words('english'))
+        # Load English stopwords (cached after the first call)
+        stop_words = get_stop_words()
         # Tokenize the input answer into words
-        tokens = word_tokenize(answer.lower())
+        tokens = get_tokenizer()(answer.lower())
         # Remove stopwords and punctuation from the tokens
-        tokens = [word for word in tokens if word not in stop_words and word not in string.punctuation]
+        tokens = [word for word in tokens if word not in stop_words and word not in PUNCTUATION]
         return tokens
     except Exception as e:
         # Handle unexpected errors during the cleaning process
@@ -35,45 +164,162 @@ def clean_answer(answer):
         return []
 
 
-def score_answer(expected_answer, user_answer):
+class ExpectedAnswer:
     """
-    Scores the user's answer by comparing it with the expected answer using word matching.
+    Precomputed representation of an expected answer.
 
-    Args:
-        expected_answer (str): The correct/expected answer.
-        user_answer (str): The user's provided answer.
+    Attributes:
+        tokens (frozenset): Distinct cleaned tokens.
+        length (int): Number of cleaned tokens including repeats.
+    """
 
-    Returns:
-        float: A score between 0 and 10, representing the match percentage.
+    __slots__ = ("tokens", "length")
+
+    def __init__(self, tokens, length):
+        self.tokens = tokens
+        self.length = length
+
+
+class AnswerScorer:
     """
-    try:
-        # Clean and tokenize the expected and user answers
-        expected_tokens = clean_answer(expected_answer)
+    Word-overlap scorer with expected answers tokenized ahead of time.
+
+    Expected answers are cleaned once (at load time via `precompute`, or on
+    first use) and kept as token sets, so scoring only tokenizes the user's
+    answer.
+
+    Args:
+        max_cached (int): Maximum number of expected answers kept precomputed.
+    """
+
+    def __init__(self, max_cached=100000):
+        self.max_cached = max_cached
+        self._expected = {}  # expected answer text -> ExpectedAnswer
+        self._lock = threading.Lock()
+
+    def precompute(self, expected_answers):
+        """
+        Tokenize expected answers ahead of time.
+
+        Args:
+            expected_answers (iterable): Expected answer strings.
+        """
+        for expected_answer in expected_answers:
+            self.expected(expected_answer)
+
+    def expected(self, expected_answer):
+        """
+        Return the precomputed form of an expected answer, building it if needed.
+
+        Args:
+            expected_answer (str): The expected answer.
+
+        Returns:
+            ExpectedAnswer: Its token set and token count.
+        """
+        entry = self._expected.get(expected_answer)
+        if entry is not None:
+            return entry
+        tokens = clean_answer(expected_answer)
+        entry = ExpectedAnswer(frozenset(tokens), len(tokens))
+        with self._lock:
+            if len(self._expected) < self.max_cached:
+                self._expected[expected_answer] = entry
+        return entry
+
+    def score(self, expected_answer, user_answer):
+        """
+        Score one answer; see `score_answer`.
+
+        Args:
+            expected_answer (str): The correct/expected answer.
+            user_answer (str): The user's provided answer.
+
+        Returns:
+            float: A score between 0 and 10.
+        """
+        expected = self.expected(expected_answer)
         user_tokens = clean_answer(user_answer)
 
         # Check if either answer is empty after cleaning
-        if not expected_tokens or not user_tokens:
+        if not expected.length or not user_tokens:
             print("Warning: One or both answers are empty after cleaning.")
             return 0.0
 
         # Find the common tokens between the two answers
-        common_tokens = set(expected_tokens).intersection(user_tokens)
-        match_score = len(common_tokens)
+        match_score = len(expected.tokens.intersection(user_tokens))
 
         # Calculate the maximum possible score based on token lengths
-        max_score = max(len(expected_tokens), len(user_tokens))
-        if max_score == 0:
-            return 0.0  # Avoid division by zero
+        max_score = max(expected.length, len(user_tokens))
 
         # Compute the score as a percentage and scale to a 1-10 range
-        score = (match_score / max_score) * 10
-        return round(score, 2)  # Round to 2 decimal places
+        return round((match_score / max_score) * 10, 2)
+
+    def score_batch(self, pairs):
+        """
+        Score many (expected answer, user answer) pairs.
+
+        Tokenizing the user's answers dominates, and it runs per answer however
+        the overlap is counted, so this is a loop over `score`; vectorizing the
+        overlap with NumPy measured slower at every batch size.
+
+        Args:
+            pairs (iterable): (expected answer, user answer) tuples.
+
+        Returns:
+            list: Scores between 0 and 10, in input order.
+        """
+        return [self.score(expected_answer, user_answer) for expected_answer, user_answer in pairs]
+
+
+# Shared scorer; callers may precompute their question bank into it
+default_scorer = AnswerScorer()
+
+
+def score_answer(expected_answer, user_answer, mode=None):
+    """
+    Scores the user's answer by comparing it with the expected answer using word matching,
+    or by embedding similarity in semantic mode.
+
+    Args:
+        expected_answer (str): The correct/expected answer.
+        user_answer (str): The user's provided answer.
+        mode (str): "overlap" or "semantic"; defaults to the SCORING_MODE setting.
+
+    Returns:
+        float: A score between 0 and 10, representing the match percentage.
+    """
+    try:
+        if (mode or SCORING_MODE) == "semantic":
+            # Imported lazily: it depends on this module and on precomputed embeddings
+            from semantic_scoring import semantic_score
+            return semantic_score(expected_answer, user_answer)
+        # The expected answer's tokens come precomputed; only the user's answer is tokenized
+        return default_scorer.score(expected_answer, user_answer)
     except Exception as e:
         # Handle unexpected errors during scoring
         print(f"Error scoring answer: {e}")
         return 0.0
 
 
+def score_answers(pairs):
+    """
+    Scores many (expected answer, user answer) pairs.
+
+    Args:
+        pairs (iterable): (expected answer, user answer) tuples.
+
+    Returns:
+        list: Scores between 0 and 10, in input order.
+    """
+    try:
+        return default_scorer.score_batch(pairs)
+    except Exception as e:
+        # Handle unexpected errors during scoring
+        print(f"Error scoring answers: {e}")
+        return [0.0 for _ in pairs]
+
+
 # Example Usage
 if __name__ == "__main__":
     # Example inputs for testing
@@ -0,0 +1,341 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from multiprocessing.connection import wait as wait_connections
+
+
+class QueueFull(Exception):
+    """Raised when a work pool already holds as many tasks as it accepts."""
+
+
+class TaskTimeout(Exception):
+    """Raised for a process pool task that ran past its timeout; its worker was killed."""
+
+
+class BoundedExecutor:
+    """
+    Thread pool that rejects work instead of queueing it without limit.
+
+    At most `max_workers` tasks run and `max_pending` more wait; further
+    submissions raise `QueueFull` straight away, which the web layer turns into
+    HTTP 429 so callers back off rather than waiting behind a long queue.
+
+    Args:
+        max_workers (int): Threads running tasks.
+        max_pending (int): Tasks allowed to wait for a free thread.
+        name (str): Pool name, used for thread names and error messages.
+    """
+
+    def __init__(self, max_workers, max_pending, name="work"):
+        self.name = name
+        self.max_workers = max_workers
+        self.capacity = max_workers + max_pending
+        # Threads start on first submit, so a preloading master never forks with live workers
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix=name)
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Schedule a call on the pool.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the call's result.
+
+        Raises:
+            QueueFull: If the pool is at capacity.
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise QueueFull(f"The {self.name} queue is full; retry shortly.")
+        with self._lock:
+            self._in_flight += 1
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future):
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+        self._slots.release()
+
+    async def run(self, fn, *args, **kwargs):
+        """Run a call on the pool and await its result without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def stats(self):
+        """
+        Report pool usage.
+
+        Returns:
+            dict: Worker count, capacity, tasks in flight, completed and rejected tasks.
+        """
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "capacity": self.capacity,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+
+def _process_worker(conn):
+    """Process pool worker: run (fn, args) calls from the pipe until it closes."""
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        fn, args = task
+        try:
+            reply = (True, fn(*args))
+        except Exception as e:
+            reply = (False, e)
+        try:
+            conn.send(reply)
+        except Exception as e:  # Unpicklable result or exception
+            conn.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+class _ProcessWorker:
+    """One worker process and the parent's end of its pipe."""
+
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_process_worker, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.task = None  # (future, deadline) while busy
+        self.tasks_done = 0
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        """Let an idle worker exit on its own."""
+        self.conn.send(None)
+        self.process.join()
+        self.conn.close()
+
+
+class ProcessWorkerPool:
+    """
+    Process pool whose tasks can time out without affecting each other.
+
+    Unlike multiprocessing.Pool, a task that runs past its timeout (or is
+    cancelled with `cancel`) has only its own worker killed and replaced; other
+    tasks keep running. A dispatcher thread hands queued tasks to idle workers,
+    collects results and enforces the deadlines; it alone touches the workers.
+    Workers start on first use, so a preloading master never forks with live
+    workers.
+
+    Args:
+        workers (int): Worker processes.
+        max_tasks_per_child (int): Replace a worker after this many tasks, bounding memory growth; None keeps it.
+        name (str): Pool name, used for the dispatcher thread and error messages.
+    """
+
+    def __init__(self, workers, max_tasks_per_child=None, name="process"):
+        self.workers = workers
+        self.max_tasks_per_child = max_tasks_per_child
+        self.name = name
+        self._context = multiprocessing.get_context()
+        self._lock = threading.Lock()
+        self._queue = deque()  # (future, fn, args, timeout) waiting for a worker
+        self._idle = []
+        self._busy = {}  # future -> worker running it
+        self._cancelled = set()  # Running futures whose workers are to be killed
+        self._wakeup_reader, self._wakeup_writer = self._context.Pipe(duplex=False)
+        self._dispatcher = None
+        self._closed = False
+        self._timed_out = 0
+
+    def submit(self, fn, *args, timeout=None):
+        """
+        Queue a call; `fn` and its arguments must be picklable.
+
+        Args:
+            timeout (float): Seconds the call may run once a worker starts it; None for no limit.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the result, or fails with TaskTimeout.
+
+        Raises:
+            RuntimeError: If the pool is closed.
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"The {self.name} pool is closed.")
+            self._queue.append((future, fn, args, timeout))
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(target=self._dispatch, name=self.name, daemon=True)
+                self._dispatcher.start()
+            self._wakeup_writer.send(None)
+        return future
+
+    def cancel(self, futures):
+        """Cancel queued calls and kill the workers running the others, e.g. when their caller gives up."""
+        with self._lock:
+            for future in futures:
+                # Queued calls are skipped by the dispatcher; running ones lose their worker
+                if not future.cancel() and future in self._busy:
+                    self._cancelled.add(future)
+            if not self._closed:
+                self._wakeup_writer.send(None)
+
+    def _start_queued(self, now):
+        """Hand queued tasks to idle or new workers; caller holds the lock."""
+        while self._queue and (self._idle or len(self._busy) < self.workers):
+            future, fn, args, timeout = self._queue.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            worker = self._idle.pop() if self._idle else _ProcessWorker(self._context)
+            try:
+                worker.conn.send((fn, args))
+            except Exception as e:  # Unpicklable arguments; nothing reached the pipe
+                self._idle.append(worker)
+                future.set_exception(e)
+                continue
+            worker.task = (future, None if timeout is None else now + timeout)
+            self._busy[future] = worker
+
+    def _kill_overdue(self, now):
+        """Kill the workers of cancelled tasks and tasks past their deadline; caller holds the lock."""
+        for future, worker in list(self._busy.items()):
+            deadline = worker.task[1]
+            if future in self._cancelled:
+                error = TaskTimeout("Task cancelled; its worker was replaced.")
+            elif deadline is not None and deadline <= now:
+                self._timed_out += 1
+                error = TaskTimeout("Task exceeded its timeout; its worker was replaced.")
+            else:
+                continue
+            del self._busy[future]
+            self._cancelled.discard(future)
+            worker.kill()
+            future.set_exception(error)
+
+    def _finish(self, future, worker):
+        """Collect a worker's reply; caller holds the lock."""
+        del self._busy[future]
+        self._cancelled.discard(future)
+        try:
+            ok, value = worker.conn.recv()
+        except (EOFError, OSError):  # The worker died, e.g. killed by the OS
+            ok, value = False, RuntimeError("Worker process exited unexpectedly.")
+            worker.kill()
+        else:
+            worker.task = None
+            worker.tasks_done += 1
+            if self.max_tasks_per_child and worker.tasks_done >= self.max_tasks_per_child:
+                worker.stop()
+            else:
+                self._idle.append(worker)
+        if ok:
+            future.set_result(value)
+        else:
+            future.set_exception(value)
+
+    def _dispatch(self):
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                if self._closed:
+                    self._shutdown()
+                    return
+                self._kill_overdue(now)
+                self._start_queued(now)
+                running = {worker.conn: (future, worker) for future, worker in self._busy.items()}
+                deadlines = [worker.task[1] for worker in self._busy.values() if worker.task[1] is not None]
+            timeout = max(min(deadlines) - now, 0) if deadlines else None
+            for conn in wait_connections([self._wakeup_reader, *running], timeout):
+                with self._lock:
+                    if conn is self._wakeup_reader:
+                        conn.recv()
+                    elif self._busy.get(running[conn][0]) is running[conn][1]:
+                        self._finish(*running[conn])
+
+    def _shutdown(self):
+        """Stop every worker and fail outstanding calls; caller holds the lock."""
+        for future, _, _, _ in self._queue:
+            future.cancel()
+        self._queue.clear()
+        for future, worker in self._busy.items():
+            worker.kill()
+            future.set_exception(TaskTimeout(f"The {self.name} pool was closed."))
+        self._busy.clear()
+        for worker in self._idle:
+            worker.stop()
+        self._idle.clear()
+
+    def stats(self):
+        """
+        Report pool usage.
+
+        Returns:
+            dict: Worker count, queued and running tasks, and tasks that timed out.
+        """
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queued": len(self._queue),
+                "running": len(self._busy),
+                "timed_out": self._timed_out,
+            }
+
+    def close(self):
+        """Stop the workers; queued calls are cancelled and running ones fail."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            dispatcher = self._dispatcher
+            if dispatcher is not None:
+                self._wakeup_writer.send(None)
+        if dispatcher is not None:
+            dispatcher.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def create_bounded_executor(name, workers, queue_size):
+    """
+    Create a pool configured by `<NAME>_WORKERS` and `<NAME>_QUEUE_SIZE`.
+
+    Args:
+        name (str): Pool name, e.g. "parse" reads PARSE_WORKERS and PARSE_QUEUE_SIZE.
+        workers (int): Default number of threads.
+        queue_size (int): Default number of waiting tasks.
+
+    Returns:
+        BoundedExecutor: The configured pool.
+    """
+    prefix = name.upper()
+    return BoundedExecutor(
+        int(os.environ.get(f"{prefix}_WORKERS", workers)),
+        int(os.environ.get(f"{prefix}_QUEUE_SIZE", queue_size)),
+        name=name,
+    )